@@ -1,6 +1,6 @@
 import grpc.experimental.gevent as grpc_gevent
 
-from grpc import Channel
+from grpc import Channel, aio
 
 grpc_gevent.init_gevent()
 
@@ -19,3 +19,19 @@ class GRPCClient:
                         Обычно создаётся один раз и переиспользуется.
         """
         self.channel = channel
+
+
+class AsyncGRPCClient:
+    """
+    Базовый класс асинхронного gRPC-клиента (grpc.aio).
+
+    Сгенерированные стабы работают и с асинхронным каналом: каждый вызов возвращает awaitable,
+    поэтому из одного event loop можно держать в полёте тысячи запросов.
+    """
+    def __init__(self, channel: aio.Channel):
+        """
+        Конструктор базового асинхронного клиента.
+
+        :param channel: Асинхронный gRPC-канал, через который происходит подключение к серверу.
+        """
+        self.channel = channel
@@ -1,7 +1,7 @@
 from locust.env import Environment
 
-from clients.grpc.client import GRPCClient
-from grpc import Channel
+from clients.grpc.client import AsyncGRPCClient, GRPCClient
+from grpc import Channel, aio
 
 from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_locust_grpc_client
 from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import GetAccountsRequest, \
@@ -100,6 +100,75 @@ class AccountsGatewayGRPCClient(GRPCClient):
         return self.open_credit_card_account_api(request)
 
 
+class AccountsGatewayAsyncGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный (grpc.aio) gRPC-клиент для взаимодействия с AccountsGatewayService.
+    Содержит только открытие счетов — его использует асинхронный сидер (seeds/async_builder.py).
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к AccountsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = AccountsGatewayServiceStub(channel)
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequest) -> OpenDepositAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDepositAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого депозитного счета.
+        """
+        return await self.stub.OpenDepositAccount(request)
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequest) -> OpenSavingsAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenSavingsAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого сберегательного счета.
+        """
+        return await self.stub.OpenSavingsAccount(request)
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequest) -> OpenDebitCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDebitCardAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого дебетового счета.
+        """
+        return await self.stub.OpenDebitCardAccount(request)
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequest) -> OpenCreditCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenCreditCardAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого кредитного счета.
+        """
+        return await self.stub.OpenCreditCardAccount(request)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
+        request = OpenDepositAccountRequest(user_id=user_id)
+        return await self.open_deposit_account_api(request)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponse:
+        request = OpenSavingsAccountRequest(user_id=user_id)
+        return await self.open_savings_account_api(request)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponse:
+        request = OpenDebitCardAccountRequest(user_id=user_id)
+        return await self.open_debit_card_account_api(request)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponse:
+        request = OpenCreditCardAccountRequest(user_id=user_id)
+        return await self.open_credit_card_account_api(request)
+
+
 def build_accounts_gateway_grpc_client() -> AccountsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра AccountsGatewayGRPCClient.
@@ -108,7 +177,10 @@ def build_accounts_gateway_grpc_client() -> AccountsGatewayGRPCClient:
     """
     return AccountsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
-def build_accounts_gateway_locust_grpc_client(environment: Environment) -> AccountsGatewayGRPCClient:
+def build_accounts_gateway_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> AccountsGatewayGRPCClient:
     """
     Функция создаёт экземпляр AccountsGatewayGRPCClient адаптированного под Locust.
 
@@ -116,6 +188,10 @@ def build_accounts_gateway_locust_grpc_client(environment: Environment) -> Accou
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param channel: общий канал с интерцептором, если клиенты должны его разделять.
     :return: экземпляр AccountsGatewayGRPCClient с хуками сбора метрик.
     """
-    return AccountsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    if channel is None:
+        channel = build_gateway_locust_grpc_client(environment)
+
+    return AccountsGatewayGRPCClient(channel=channel)
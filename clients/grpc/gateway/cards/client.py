@@ -1,7 +1,7 @@
 from locust.env import Environment
 
-from clients.grpc.client import GRPCClient
-from grpc import Channel
+from clients.grpc.client import AsyncGRPCClient, GRPCClient
+from grpc import Channel, Future, aio
 
 from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_locust_grpc_client
 from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import IssuePhysicalCardRequest, \
@@ -44,6 +44,26 @@ class CardsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.IssuePhysicalCard(request)
 
+    def issue_virtual_card_future_api(self, request: IssueVirtualCardRequest) -> Future:
+        """
+        Низкоуровневый неблокирующий вызов метода IssueVirtualCard: запрос отправляется сразу,
+        ответ забирается позже через `.result()`.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: grpc.Future с ответом IssueVirtualCardResponse.
+        """
+        return self.stub.IssueVirtualCard.future(request)
+
+    def issue_physical_card_future_api(self, request: IssuePhysicalCardRequest) -> Future:
+        """
+        Низкоуровневый неблокирующий вызов метода IssuePhysicalCard: запрос отправляется сразу,
+        ответ забирается позже через `.result()`.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: grpc.Future с ответом IssuePhysicalCardResponse.
+        """
+        return self.stub.IssuePhysicalCard.future(request)
+
     def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponse:
         """
         Создание новой виртуальной карты.
@@ -68,6 +88,88 @@ class CardsGatewayGRPCClient(GRPCClient):
         )
         return self.issue_physical_card_api(request)
 
+    def issue_virtual_card_future(self, user_id: str, account_id: str) -> Future:
+        """
+        То же, что issue_virtual_card, но без ожидания ответа (для конвейерной отправки запросов).
+
+        :return: grpc.Future с ответом IssueVirtualCardResponse.
+        """
+        request = IssueVirtualCardRequest(
+            user_id=user_id,
+            account_id=account_id
+        )
+        return self.issue_virtual_card_future_api(request)
+
+    def issue_physical_card_future(self, user_id: str, account_id: str) -> Future:
+        """
+        То же, что issue_physical_card, но без ожидания ответа (для конвейерной отправки запросов).
+
+        :return: grpc.Future с ответом IssuePhysicalCardResponse.
+        """
+        request = IssuePhysicalCardRequest(
+            user_id=user_id,
+            account_id=account_id
+        )
+        return self.issue_physical_card_future_api(request)
+
+
+class CardsGatewayAsyncGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный (grpc.aio) gRPC-клиент для взаимодействия с CardsGatewayService.
+    Содержит только выпуск карт — его использует асинхронный сидер (seeds/async_builder.py).
+    """
+    def __init__(self, channel: aio.Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к CardsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = CardsGatewayServiceStub(channel)
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequest) -> IssueVirtualCardResponse:
+        """
+        Низкоуровневый вызов метода IssueVirtualCard через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с информацией о созданной карте.
+        """
+        return await self.stub.IssueVirtualCard(request)
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequest) -> IssuePhysicalCardResponse:
+        """
+        Низкоуровневый вызов метода IssuePhysicalCard через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с информацией о созданной карте.
+        """
+        return await self.stub.IssuePhysicalCard(request)
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponse:
+        """
+        Создание новой виртуальной карты.
+
+        :return: Ответ с информацией о созданной виртуальной карте.
+        """
+        request = IssueVirtualCardRequest(
+            user_id=user_id,
+            account_id=account_id
+        )
+        return await self.issue_virtual_card_api(request)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponse:
+        """
+        Создание новой физической карты.
+
+        :return: Ответ с информацией о созданной физической карте.
+        """
+        request = IssuePhysicalCardRequest(
+            user_id=user_id,
+            account_id=account_id
+        )
+        return await self.issue_physical_card_api(request)
+
 
 def build_cards_gateway_grpc_client() -> CardsGatewayGRPCClient:
     """
@@ -77,7 +179,10 @@ def build_cards_gateway_grpc_client() -> CardsGatewayGRPCClient:
     """
     return CardsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
-def build_cards_gateway_locust_grpc_client(environment: Environment) -> CardsGatewayGRPCClient:
+def build_cards_gateway_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> CardsGatewayGRPCClient:
     """
     Функция создаёт экземпляр CardsGatewayGRPCClient адаптированного под Locust.
 
@@ -85,6 +190,10 @@ def build_cards_gateway_locust_grpc_client(environment: Environment) -> CardsGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param channel: общий канал с интерцептором, если клиенты должны его разделять.
     :return: экземпляр CardsGatewayGRPCClient с хуками сбора метрик.
     """
-    return CardsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    if channel is None:
+        channel = build_gateway_locust_grpc_client(environment)
+
+    return CardsGatewayGRPCClient(channel=channel)
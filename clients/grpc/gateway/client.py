@@ -1,4 +1,8 @@
-from grpc import Channel, insecure_channel, intercept_channel
+from functools import cache
+from itertools import cycle
+from typing import Iterator
+
+from grpc import Channel, aio, insecure_channel, intercept_channel
 from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
 from locust.env import Environment
 
@@ -12,6 +16,16 @@ def build_gateway_grpc_client() -> Channel:
     """
     return insecure_channel(settings.gateway_grpc_client.client_url)
 
+def build_gateway_async_grpc_client() -> aio.Channel:
+    """
+    Фабричная функция для создания асинхронного (grpc.aio) канала к сервису grpc-gateway.
+    Канал привязывается к текущему event loop, поэтому создавать его нужно из того loop,
+    в котором он будет использоваться.
+
+    :return: Асинхронный gRPC-канал (aio.Channel).
+    """
+    return aio.insecure_channel(settings.gateway_grpc_client.client_url)
+
 def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
     """
     Фабричная функция для создания gRPC-канала, адаптированного для Locust.
@@ -21,7 +35,46 @@ def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
     :param environment: Среда выполнения Locust (необходима для отправки событий).
     :return: gRPC-канал с интерцептором, пригодный для нагрузочного тестирования.
     """
-    locust_interceptor = LocustInterceptor(environment=environment)
+    locust_interceptor = LocustInterceptor(
+        environment=environment,
+        response_size_mode=settings.gateway_grpc_client.response_size_mode,
+        response_size_sample_rate=settings.gateway_grpc_client.response_size_sample_rate
+    )
     channel = insecure_channel(settings.gateway_grpc_client.client_url)
     return intercept_channel(channel, locust_interceptor)
 
+
+@cache
+def get_gateway_locust_grpc_channel_pool(environment: Environment) -> Iterator[Channel]:
+    """
+    Возвращает общий на процесс пул gRPC-каналов с интерцептором Locust, выдаваемых по кругу (round-robin).
+    Для GATEWAY_GRPC_CLIENT.CHANNEL_SCOPE=process пул состоит из одного канала,
+    для pool — из GATEWAY_GRPC_CLIENT.CHANNEL_POOL_SIZE каналов.
+
+    :param environment: Среда выполнения Locust (необходима для отправки событий).
+    :return: Бесконечный итератор по каналам пула.
+    """
+    size = 1 if settings.gateway_grpc_client.channel_scope == "process" \
+        else settings.gateway_grpc_client.channel_pool_size
+    return cycle([build_gateway_locust_grpc_client(environment) for _ in range(max(size, 1))])
+
+
+def build_gateway_locust_grpc_channel(environment: Environment) -> Channel | None:
+    """
+    Возвращает канал, который разделяют все gRPC-клиенты одного виртуального пользователя Locust,
+    в зависимости от GATEWAY_GRPC_CLIENT.CHANNEL_SCOPE:
+    - client: None, каждый клиент создаёт собственный канал;
+    - user: новый канал на пользователя;
+    - process: один канал на процесс;
+    - pool: следующий канал из пула на CHANNEL_POOL_SIZE каналов.
+
+    :param environment: Среда выполнения Locust (необходима для отправки событий).
+    :return: gRPC-канал с интерцептором или None.
+    """
+    match settings.gateway_grpc_client.channel_scope:
+        case "user":
+            return build_gateway_locust_grpc_client(environment)
+        case "process" | "pool":
+            return next(get_gateway_locust_grpc_channel_pool(environment))
+        case _:
+            return None
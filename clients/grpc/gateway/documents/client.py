@@ -64,7 +64,10 @@ def build_documents_gateway_grpc_client() -> DocumentsGatewayGRPCClient:
     """
     return DocumentsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
-def build_documents_gateway_locust_grpc_client(environment: Environment) -> DocumentsGatewayGRPCClient:
+def build_documents_gateway_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> DocumentsGatewayGRPCClient:
     """
     Функция создаёт экземпляр DocumentsGatewayGRPCClient адаптированного под Locust.
 
@@ -72,6 +75,10 @@ def build_documents_gateway_locust_grpc_client(environment: Environment) -> Docu
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param channel: общий канал с интерцептором, если клиенты должны его разделять.
     :return: экземпляр DocumentsGatewayGRPCClient с хуками сбора метрик.
     """
-    return DocumentsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    if channel is None:
+        channel = build_gateway_locust_grpc_client(environment)
+
+    return DocumentsGatewayGRPCClient(channel=channel)
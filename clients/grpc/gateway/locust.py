@@ -1,4 +1,6 @@
-from locust import TaskSet, SequentialTaskSet
+from locust import TaskSet
+
+from clients.grpc.gateway.client import build_gateway_locust_grpc_channel
 from clients.grpc.gateway.users.client import (
     UsersGatewayGRPCClient,
     build_users_gateway_locust_grpc_client
@@ -18,6 +20,7 @@ from clients.grpc.gateway.documents.client import (
     DocumentsGatewayGRPCClient,
     build_documents_gateway_locust_grpc_client
 )
+from tools.locust.user import LocustBaseSequentialTaskSet
 
 
 class GatewayGRPCTaskSet(TaskSet):
@@ -37,16 +40,19 @@ class GatewayGRPCTaskSet(TaskSet):
         """
         Метод вызывается перед запуском задач TaskSet.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
+
+        Все клиенты пользователя работают через один канал (GATEWAY_GRPC_CLIENT.CHANNEL_SCOPE).
         """
-        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
+        channel = build_gateway_locust_grpc_channel(self.user.environment)
+        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment, channel)
+        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment, channel)
+        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment, channel)
+        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment, channel)
+        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment, channel)
 
 
 
-class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
+class GatewayGRPCSequentialTaskSet(LocustBaseSequentialTaskSet):
     """
     Базовый SequentialTaskSet для gRPC-сценариев, где важен порядок выполнения задач.
 
@@ -62,9 +68,12 @@ class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
     def on_start(self) -> None:
         """
         Создание API клиентов для последовательного сценария.
+
+        Все клиенты пользователя работают через один канал (GATEWAY_GRPC_CLIENT.CHANNEL_SCOPE).
         """
-        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
\ No newline at end of file
+        channel = build_gateway_locust_grpc_channel(self.user.environment)
+        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment, channel)
+        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment, channel)
+        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment, channel)
+        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment, channel)
+        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment, channel)
\ No newline at end of file
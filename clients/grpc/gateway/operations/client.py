@@ -1,7 +1,7 @@
 from locust.env import Environment
 
-from clients.grpc.client import GRPCClient
-from grpc import Channel
+from clients.grpc.client import AsyncGRPCClient, GRPCClient
+from grpc import Channel, Future, aio
 
 from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_locust_grpc_client
 
@@ -152,6 +152,46 @@ class OperationsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.MakeCashWithdrawalOperation(request)
 
+    def make_top_up_operation_future_api(self, request: MakeTopUpOperationRequest) -> Future:
+        """
+        Низкоуровневый неблокирующий вызов метода MakeTopUpOperation: запрос отправляется сразу,
+        ответ забирается позже через `.result()`.
+
+        :param request: gRPC-запрос для создания операции пополнения.
+        :return: grpc.Future с ответом MakeTopUpOperationResponse.
+        """
+        return self.stub.MakeTopUpOperation.future(request)
+
+    def make_purchase_operation_future_api(self, request: MakePurchaseOperationRequest) -> Future:
+        """
+        Низкоуровневый неблокирующий вызов метода MakePurchaseOperation: запрос отправляется сразу,
+        ответ забирается позже через `.result()`.
+
+        :param request: gRPC-запрос для создания операции покупки.
+        :return: grpc.Future с ответом MakePurchaseOperationResponse.
+        """
+        return self.stub.MakePurchaseOperation.future(request)
+
+    def make_transfer_operation_future_api(self, request: MakeTransferOperationRequest) -> Future:
+        """
+        Низкоуровневый неблокирующий вызов метода MakeTransferOperation: запрос отправляется сразу,
+        ответ забирается позже через `.result()`.
+
+        :param request: gRPC-запрос для создания операции перевода.
+        :return: grpc.Future с ответом MakeTransferOperationResponse.
+        """
+        return self.stub.MakeTransferOperation.future(request)
+
+    def make_cash_withdrawal_operation_future_api(self, request: MakeCashWithdrawalOperationRequest) -> Future:
+        """
+        Низкоуровневый неблокирующий вызов метода MakeCashWithdrawalOperation: запрос отправляется сразу,
+        ответ забирается позже через `.result()`.
+
+        :param request: gRPC-запрос для создания операции снятия наличных.
+        :return: grpc.Future с ответом MakeCashWithdrawalOperationResponse.
+        """
+        return self.stub.MakeCashWithdrawalOperation.future(request)
+
     def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponse:
         request = MakeFeeOperationRequest(
             status=fake.proto_enum(OperationStatus),
@@ -217,6 +257,63 @@ class OperationsGatewayGRPCClient(GRPCClient):
         )
         return self.make_cash_withdrawal_operation_api(request)
 
+    def make_top_up_operation_future(self, card_id: str, account_id: str) -> Future:
+        """
+        То же, что make_top_up_operation, но без ожидания ответа (для конвейерной отправки запросов).
+
+        :return: grpc.Future с ответом MakeTopUpOperationResponse.
+        """
+        request = MakeTopUpOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return self.make_top_up_operation_future_api(request)
+
+    def make_purchase_operation_future(self, card_id: str, account_id: str) -> Future:
+        """
+        То же, что make_purchase_operation, но без ожидания ответа (для конвейерной отправки запросов).
+
+        :return: grpc.Future с ответом MakePurchaseOperationResponse.
+        """
+        request = MakePurchaseOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            category=fake.category(),
+            account_id=account_id
+        )
+        return self.make_purchase_operation_future_api(request)
+
+    def make_transfer_operation_future(self, card_id: str, account_id: str) -> Future:
+        """
+        То же, что make_transfer_operation, но без ожидания ответа (для конвейерной отправки запросов).
+
+        :return: grpc.Future с ответом MakeTransferOperationResponse.
+        """
+        request = MakeTransferOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return self.make_transfer_operation_future_api(request)
+
+    def make_cash_withdrawal_operation_future(self, card_id: str, account_id: str) -> Future:
+        """
+        То же, что make_cash_withdrawal_operation, но без ожидания ответа (для конвейерной отправки запросов).
+
+        :return: grpc.Future с ответом MakeCashWithdrawalOperationResponse.
+        """
+        request = MakeCashWithdrawalOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return self.make_cash_withdrawal_operation_future_api(request)
+
     def get_operation(self, operation_id: str) -> GetOperationResponse:
         request = GetOperationRequest(id=operation_id)
         return self.get_operation_api(request)
@@ -234,6 +331,97 @@ class OperationsGatewayGRPCClient(GRPCClient):
         return self.get_operations_summary_api(request)
 
 
+class OperationsGatewayAsyncGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный (grpc.aio) gRPC-клиент для взаимодействия с OperationsGatewayService.
+    Содержит только операции, которые создаёт асинхронный сидер (seeds/async_builder.py).
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к OperationsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = OperationsGatewayServiceStub(channel)
+
+    async def make_top_up_operation_api(self, request: MakeTopUpOperationRequest) -> MakeTopUpOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeTopUpOperation через gRPC.
+
+        :param request: gRPC-запрос для создания операции пополнения.
+        :return: Ответ от сервиса с операцией пополнения.
+        """
+        return await self.stub.MakeTopUpOperation(request)
+
+    async def make_transfer_operation_api(self, request: MakeTransferOperationRequest) -> MakeTransferOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeTransferOperation через gRPC.
+
+        :param request: gRPC-запрос для создания операции перевода.
+        :return: Ответ от сервиса с операцией перевода.
+        """
+        return await self.stub.MakeTransferOperation(request)
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequest) -> MakePurchaseOperationResponse:
+        """
+        Низкоуровневый вызов метода MakePurchaseOperation через gRPC.
+
+        :param request: gRPC-запрос для создания операции покупки.
+        :return: Ответ от сервиса с операцией покупки.
+        """
+        return await self.stub.MakePurchaseOperation(request)
+
+    async def make_cash_withdrawal_operation_api(self,
+                                                 request: MakeCashWithdrawalOperationRequest) -> MakeCashWithdrawalOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeCashWithdrawalOperation через gRPC.
+
+        :param request: gRPC-запрос для создания операции снятия наличных.
+        :return: Ответ от сервиса с операцией снятия наличных.
+        """
+        return await self.stub.MakeCashWithdrawalOperation(request)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponse:
+        request = MakeTopUpOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return await self.make_top_up_operation_api(request)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponse:
+        request = MakeTransferOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return await self.make_transfer_operation_api(request)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponse:
+        request = MakePurchaseOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            category=fake.category(),
+            account_id=account_id
+        )
+        return await self.make_purchase_operation_api(request)
+
+    async def make_cash_withdrawal_operation(self, card_id: str,
+                                             account_id: str) -> MakeCashWithdrawalOperationResponse:
+        request = MakeCashWithdrawalOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return await self.make_cash_withdrawal_operation_api(request)
+
 def build_operations_gateway_grpc_client() -> OperationsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра OperationsGatewayGRPCClient.
@@ -242,7 +430,10 @@ def build_operations_gateway_grpc_client() -> OperationsGatewayGRPCClient:
     """
     return OperationsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
-def build_operations_gateway_locust_grpc_client(environment: Environment) -> OperationsGatewayGRPCClient:
+def build_operations_gateway_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> OperationsGatewayGRPCClient:
     """
     Функция создаёт экземпляр OperationsGatewayGRPCClient адаптированного под Locust.
 
@@ -250,6 +441,10 @@ def build_operations_gateway_locust_grpc_client(environment: Environment) -> Ope
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param channel: общий канал с интерцептором, если клиенты должны его разделять.
     :return: экземпляр OperationsGatewayGRPCClient с хуками сбора метрик.
     """
-    return OperationsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
\ No newline at end of file
+    if channel is None:
+        channel = build_gateway_locust_grpc_client(environment)
+
+    return OperationsGatewayGRPCClient(channel=channel)
@@ -1,5 +1,5 @@
-from clients.grpc.client import GRPCClient
-from grpc import Channel
+from clients.grpc.client import AsyncGRPCClient, GRPCClient
+from grpc import Channel, aio
 
 from locust.env import Environment
 from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_locust_grpc_client
@@ -12,7 +12,7 @@ from tools.fakers import fake
 class UsersGatewayGRPCClient(GRPCClient):
     """
     gRPC-клиент для взаимодействия с UsersGatewayService.
-    Предоставляет высокоуровневые методы для получения и создания пользователей.
+    Содержит только создание пользователя — его использует асинхронный сидер (seeds/async_builder.py).
     """
     def __init__(self, channel: Channel):
         """
@@ -68,6 +68,46 @@ class UsersGatewayGRPCClient(GRPCClient):
         return self.create_user_api(request)
 
 
+class UsersGatewayAsyncGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный (grpc.aio) gRPC-клиент для взаимодействия с UsersGatewayService.
+    Содержит только создание пользователя — его использует асинхронный сидер (seeds/async_builder.py).
+    """
+    def __init__(self, channel: aio.Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к UsersGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = UsersGatewayServiceStub(channel)
+
+    async def create_user_api(self, request: CreateUserRequest) -> CreateUserResponse:
+        """
+        Низкоуровневый вызов метода CreateUser через gRPC.
+
+        :param request: gRPC-запрос с данными нового пользователя.
+        :return: Ответ от сервиса с данными созданного пользователя.
+        """
+        return await self.stub.CreateUser(request)
+
+    async def create_user(self) -> CreateUserResponse:
+        """
+        Создание нового пользователя с фейковыми данными.
+
+        :return: Ответ с информацией о созданном пользователе.
+        """
+        request = CreateUserRequest(
+            email=fake.email(),
+            last_name=fake.last_name(),
+            first_name=fake.first_name(),
+            middle_name=fake.middle_name(),
+            phone_number=fake.phone_number()
+        )
+        return await self.create_user_api(request)
+
+
 def build_users_gateway_grpc_client() -> UsersGatewayGRPCClient:
     """
     Фабрика для создания экземпляра UsersGatewayGRPCClient.
@@ -76,7 +116,10 @@ def build_users_gateway_grpc_client() -> UsersGatewayGRPCClient:
     """
     return UsersGatewayGRPCClient(channel=build_gateway_grpc_client())
 
-def build_users_gateway_locust_grpc_client(environment: Environment) -> UsersGatewayGRPCClient:
+def build_users_gateway_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> UsersGatewayGRPCClient:
     """
     Функция создаёт экземпляр UsersGatewayGRPCClient адаптированного под Locust.
 
@@ -84,6 +127,10 @@ def build_users_gateway_locust_grpc_client(environment: Environment) -> UsersGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param channel: общий канал с интерцептором, если клиенты должны его разделять.
     :return: экземпляр UsersGatewayGRPCClient с хуками сбора метрик.
     """
-    return UsersGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    if channel is None:
+        channel = build_gateway_locust_grpc_client(environment)
+
+    return UsersGatewayGRPCClient(channel=channel)
@@ -1,18 +1,58 @@
 import time
+from typing import Literal
+
 from locust.env import Environment
 from grpc import UnaryUnaryClientInterceptor, RpcError
 
+ResponseSizeMode = Literal["bytesize", "sampled", "off"]
+
 
 class LocustInterceptor(UnaryUnaryClientInterceptor):
     """
     gRPC-интерцептор для сбора метрик Locust.
     Используется для измерения времени выполнения вызовов и регистрации успехов/ошибок.
     """
-    def __init__(self, environment: Environment):
+    def __init__(
+            self,
+            environment: Environment,
+            response_size_mode: ResponseSizeMode = "bytesize",
+            response_size_sample_rate: int = 100
+    ):
         """
         :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
+        :param response_size_mode: Способ подсчёта размера ответа:
+            - bytesize: ByteSize() на каждом вызове (обход всего дерева сообщения);
+            - sampled: ByteSize() на каждом N-м вызове метода, в остальных вызовах размер не считается (0).
+              Суммарный и средний размер в статистике Locust в этом режиме примерно в N раз меньше реального;
+            - off: размер ответа не считается (всегда 0).
+        :param response_size_sample_rate: N для режима sampled.
         """
         self.environment = environment
+        self.response_size_mode = response_size_mode
+        self.response_size_sample_rate = max(response_size_sample_rate, 1)
+        # Для режима sampled: метод -> количество вызовов
+        self._response_calls: dict[str, int] = {}
+
+    def get_response_length(self, method: str, result) -> int:
+        """
+        Возвращает размер ответа в соответствии с выбранным режимом.
+
+        :param method: Полное имя gRPC метода.
+        :param result: Десериализованное сообщение ответа.
+        :return: Размер ответа в байтах.
+        """
+        if self.response_size_mode == "off":
+            return 0
+
+        if self.response_size_mode == "bytesize":
+            return result.ByteSize()
+
+        calls = self._response_calls.get(method, 0)
+        self._response_calls[method] = calls + 1
+        if calls % self.response_size_sample_rate == 0:
+            return result.ByteSize()
+
+        return 0
 
     def intercept_unary_unary(self, continuation, client_call_details, request):
         """
@@ -30,7 +70,7 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
 
         try:
             response = continuation(client_call_details, request)
-            response_length = response.result().ByteSize()
+            response_length = self.get_response_length(client_call_details.method, response.result())
         except RpcError as error:
             exception = error
 
@@ -44,4 +84,4 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
             response_length=response_length
         )
 
-        return response
\ No newline at end of file
+        return response
@@ -0,0 +1,86 @@
+from grpc import Channel, Future
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.services.client import build_service_grpc_client
+from config import settings
+from contracts.services.cards.card_pb2 import CardType, CardStatus, CardPaymentSystem
+from contracts.services.cards.cards_service_pb2_grpc import CardsServiceStub
+from contracts.services.cards.rpc_create_card_pb2 import CreateCardRequest, CreateCardResponse
+from tools.fakers import fake
+
+
+class CardsServiceGRPCClient(GRPCClient):
+    """
+    gRPC-клиент для взаимодействия с внутренним CardsService (в обход gateway).
+    Используется для сидинга.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к CardsService.
+        """
+        super().__init__(channel)
+
+        self.stub = CardsServiceStub(channel)
+
+    def create_card_api(self, request: CreateCardRequest) -> CreateCardResponse:
+        """
+        Низкоуровневый вызов метода CreateCard через gRPC.
+
+        :param request: gRPC-запрос с данными новой карты.
+        :return: Ответ от сервиса с данными созданной карты.
+        """
+        return self.stub.CreateCard(request)
+
+    def create_card_future_api(self, request: CreateCardRequest) -> Future:
+        """
+        Низкоуровневый неблокирующий вызов метода CreateCard: запрос отправляется сразу,
+        ответ забирается позже через `.result()`.
+
+        :param request: gRPC-запрос с данными новой карты.
+        :return: grpc.Future с ответом CreateCardResponse.
+        """
+        return self.stub.CreateCard.future(request)
+
+    @staticmethod
+    def build_create_card_request(account_id: str, card_type: CardType.ValueType) -> CreateCardRequest:
+        return CreateCardRequest(
+            pin=fake.pin(),
+            cvv=fake.cvv(),
+            type=card_type,
+            status=CardStatus.CARD_STATUS_ACTIVE,
+            account_id=account_id,
+            card_number=fake.card_number(),
+            card_holder=fake.card_holder(),
+            expiry_date=fake.expiry_date(),
+            payment_system=fake.proto_enum(CardPaymentSystem)
+        )
+
+    def create_card(self, account_id: str, card_type: CardType.ValueType) -> CreateCardResponse:
+        """
+        Выпуск активной карты заданного типа с фейковыми реквизитами.
+
+        :param account_id: Идентификатор счёта.
+        :param card_type: Тип карты (CardType).
+        :return: Ответ с информацией о выпущенной карте.
+        """
+        return self.create_card_api(self.build_create_card_request(account_id, card_type))
+
+    def create_card_future(self, account_id: str, card_type: CardType.ValueType) -> Future:
+        """
+        То же, что create_card, но без ожидания ответа (для конвейерной отправки запросов).
+
+        :return: grpc.Future с ответом CreateCardResponse.
+        """
+        return self.create_card_future_api(self.build_create_card_request(account_id, card_type))
+
+
+def build_cards_service_grpc_client() -> CardsServiceGRPCClient:
+    """
+    Фабрика для создания экземпляра CardsServiceGRPCClient.
+
+    :return: Инициализированный клиент для CardsService.
+    """
+    return CardsServiceGRPCClient(channel=build_service_grpc_client("cards", settings.cards_grpc_client))
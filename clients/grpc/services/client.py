@@ -0,0 +1,18 @@
+from grpc import Channel, insecure_channel
+
+from tools.config.grpc import GRPCClientConfig
+
+
+def build_service_grpc_client(name: str, config: GRPCClientConfig | None) -> Channel:
+    """
+    Фабричная функция для создания grpc-канала напрямую к внутреннему сервису стенда (в обход grpc-gateway).
+
+    :param name: Имя сервиса (users, accounts, cards, operations), используется в сообщении об ошибке.
+    :param config: Настройки подключения к сервису ({NAME}_GRPC_CLIENT).
+    :return: gRPC-канал (Channel) к сервису.
+    :raises ValueError: Если адрес сервиса не задан.
+    """
+    if config is None:
+        raise ValueError(f"{name.upper()}_GRPC_CLIENT.HOST and {name.upper()}_GRPC_CLIENT.PORT must be configured")
+
+    return insecure_channel(config.client_url)
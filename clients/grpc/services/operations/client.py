@@ -0,0 +1,106 @@
+from datetime import datetime, timezone
+
+from grpc import Channel, Future
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.services.client import build_service_grpc_client
+from config import settings
+from contracts.services.operations.operation_pb2 import OperationType, OperationStatus
+from contracts.services.operations.operations_service_pb2_grpc import OperationsServiceStub
+from contracts.services.operations.rpc_create_operation_pb2 import CreateOperationRequest, CreateOperationResponse
+from tools.fakers import fake
+
+
+class OperationsServiceGRPCClient(GRPCClient):
+    """
+    gRPC-клиент для взаимодействия с внутренним OperationsService (в обход gateway).
+    Используется для сидинга: одна ручка CreateOperation создаёт операцию любого типа.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к OperationsService.
+        """
+        super().__init__(channel)
+
+        self.stub = OperationsServiceStub(channel)
+
+    def create_operation_api(self, request: CreateOperationRequest) -> CreateOperationResponse:
+        """
+        Низкоуровневый вызов метода CreateOperation через gRPC.
+
+        :param request: gRPC-запрос с данными новой операции.
+        :return: Ответ от сервиса с данными созданной операции.
+        """
+        return self.stub.CreateOperation(request)
+
+    def create_operation_future_api(self, request: CreateOperationRequest) -> Future:
+        """
+        Низкоуровневый неблокирующий вызов метода CreateOperation: запрос отправляется сразу,
+        ответ забирается позже через `.result()`.
+
+        :param request: gRPC-запрос с данными новой операции.
+        :return: grpc.Future с ответом CreateOperationResponse.
+        """
+        return self.stub.CreateOperation.future(request)
+
+    @staticmethod
+    def build_create_operation_request(
+            card_id: str,
+            account_id: str,
+            operation_type: OperationType.ValueType
+    ) -> CreateOperationRequest:
+        return CreateOperationRequest(
+            type=operation_type,
+            status=OperationStatus.OPERATION_STATUS_COMPLETED,
+            amount=fake.amount(),
+            card_id=card_id,
+            category=fake.category() if operation_type == OperationType.OPERATION_TYPE_PURCHASE else "",
+            created_at=datetime.now(timezone.utc).isoformat(),
+            account_id=account_id
+        )
+
+    def create_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            operation_type: OperationType.ValueType
+    ) -> CreateOperationResponse:
+        """
+        Создание завершённой (COMPLETED) операции заданного типа с фейковой суммой.
+        Баланс счёта при этом не меняется: в отличие от gateway, OperationsService его не обновляет.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :param operation_type: Тип операции (OperationType).
+        :return: Ответ с информацией о созданной операции.
+        """
+        return self.create_operation_api(self.build_create_operation_request(card_id, account_id, operation_type))
+
+    def create_operation_future(
+            self,
+            card_id: str,
+            account_id: str,
+            operation_type: OperationType.ValueType
+    ) -> Future:
+        """
+        То же, что create_operation, но без ожидания ответа (для конвейерной отправки запросов).
+
+        :return: grpc.Future с ответом CreateOperationResponse.
+        """
+        return self.create_operation_future_api(
+            self.build_create_operation_request(card_id, account_id, operation_type)
+        )
+
+
+def build_operations_service_grpc_client() -> OperationsServiceGRPCClient:
+    """
+    Фабрика для создания экземпляра OperationsServiceGRPCClient.
+
+    :return: Инициализированный клиент для OperationsService.
+    """
+    return OperationsServiceGRPCClient(
+        channel=build_service_grpc_client("operations", settings.operations_grpc_client)
+    )
@@ -0,0 +1,58 @@
+from grpc import Channel
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.services.client import build_service_grpc_client
+from config import settings
+from contracts.services.users.rpc_create_user_pb2 import CreateUserRequest, CreateUserResponse
+from contracts.services.users.users_service_pb2_grpc import UsersServiceStub
+from tools.fakers import fake
+
+
+class UsersServiceGRPCClient(GRPCClient):
+    """
+    gRPC-клиент для взаимодействия с внутренним UsersService (в обход gateway).
+    Используется для сидинга.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к UsersService.
+        """
+        super().__init__(channel)
+
+        self.stub = UsersServiceStub(channel)
+
+    def create_user_api(self, request: CreateUserRequest) -> CreateUserResponse:
+        """
+        Низкоуровневый вызов метода CreateUser через gRPC.
+
+        :param request: gRPC-запрос с данными нового пользователя.
+        :return: Ответ от сервиса с данными созданного пользователя.
+        """
+        return self.stub.CreateUser(request)
+
+    def create_user(self) -> CreateUserResponse:
+        """
+        Создание нового пользователя с фейковыми данными.
+
+        :return: Ответ с информацией о созданном пользователе.
+        """
+        request = CreateUserRequest(
+            email=fake.email(),
+            last_name=fake.last_name(),
+            first_name=fake.first_name(),
+            middle_name=fake.middle_name(),
+            phone_number=fake.phone_number()
+        )
+        return self.create_user_api(request)
+
+
+def build_users_service_grpc_client() -> UsersServiceGRPCClient:
+    """
+    Фабрика для создания экземпляра UsersServiceGRPCClient.
+
+    :return: Инициализированный клиент для UsersService.
+    """
+    return UsersServiceGRPCClient(channel=build_service_grpc_client("users", settings.users_grpc_client))
@@ -1,5 +1,11 @@
 from httpx import Client, URL, QueryParams, Response
-from typing import Any, TypedDict
+from typing import Any, TypedDict, TypeVar
+
+from pydantic import BaseModel
+
+from clients.http.validation import ValidationMode, parse_model
+
+T = TypeVar("T", bound=BaseModel)
 
 
 class HTTPClientExtensions(TypedDict, total=False):
@@ -11,9 +17,25 @@ class HTTPClient:
     Базовый HTTP API клиент, принимающий объект httpx.Client.
 
     :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    :param validation_mode: режим валидации ответов в высокоуровневых методах (full, lazy, ids-only, none).
+        В режиме none поля ответа недоступны (см. parse_model).
     """
-    def __init__(self, client: Client):
+    def __init__(self, client: Client, validation_mode: ValidationMode = "full"):
         self.client = client
+        self.validation_mode = validation_mode
+
+    def parse_response(self, response: Response, schema: type[T], validation_mode: ValidationMode | None = None) -> T:
+        """
+        Проверяет статус ответа и преобразует ответ в модель схемы с учётом режима валидации.
+
+        :param response: Объект Response с данными ответа.
+        :param schema: Pydantic-модель ответа.
+        :param validation_mode: Режим валидации для этого вызова. По умолчанию режим клиента.
+        :return: Модель ответа.
+        :raises httpx.HTTPStatusError: Если сервер ответил статусом 4xx или 5xx.
+        """
+        response.raise_for_status()
+        return parse_model(schema, response.content, validation_mode or self.validation_mode)
 
     def get(
             self,
@@ -1,7 +1,42 @@
-from httpx import Request, Response, HTTPError, HTTPStatusError
+from typing import Callable, Iterator, Literal
+
+from httpx import Request, Response, HTTPError, HTTPStatusError, SyncByteStream
 from locust.env import Environment
 import time
 
+HTTPMetricsMode = Literal["body", "stream", "headers"]
+
+
+class LocustResponseStream(SyncByteStream):
+    """
+    Обёртка над потоком тела ответа, которая считает байты по мере чтения
+    и по закрытию потока передаёт их количество в колбэк.
+
+    Позволяет замерить время до конца загрузки тела и его размер на проводе,
+    не читая тело в хуке повторно.
+    """
+    def __init__(self, stream: SyncByteStream, on_close: Callable[[int], None]):
+        """
+        :param stream: Исходный поток тела ответа от транспорта.
+        :param on_close: Колбэк, получающий количество прочитанных байт.
+        """
+        self.stream = stream
+        self.on_close = on_close
+        self.num_bytes = 0
+        self.closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.stream:
+            self.num_bytes += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        self.closed = True
+        self.stream.close()
+        self.on_close(self.num_bytes)
 
 
 def locust_request_event_hook(request: Request) -> None:
@@ -11,9 +46,25 @@ def locust_request_event_hook(request: Request) -> None:
     Сохраняет текущее время в `request.extensions["start_time"]`,
     чтобы потом использовать его для расчёта времени ответа.
     """
-    request.extensions["start_time"] = time.time()
+    request.extensions["start_time"] = time.perf_counter()
 
-def locust_response_event_hook(environment: Environment):
+
+def get_header_response_length(response: Response) -> int:
+    """
+    Возвращает размер тела ответа по заголовку Content-Length, не читая тело.
+    Это размер на проводе (до распаковки gzip и т.п.); без заголовка возвращается 0.
+
+    :param response: Ответ HTTPX.
+    :return: Размер тела ответа в байтах.
+    """
+    content_length = response.headers.get("Content-Length")
+    if content_length is not None and content_length.isdigit():
+        return int(content_length)
+
+    return 0
+
+
+def locust_response_event_hook(environment: Environment, mode: HTTPMetricsMode = "body"):
     """
     Возвращает HTTPX event hook, вызываемый после получения ответа.
 
@@ -22,6 +73,13 @@ def locust_response_event_hook(environment: Environment):
     Отправляет собранные метрики в `environment.events.request`, чтобы Locust мог агрегировать статистику.
 
     :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param mode: Режим замера:
+                 - body: хук дочитывает тело ответа; время включает загрузку тела,
+                   размер — длина распакованного тела (как у стандартного клиента Locust);
+                 - stream: метрика отправляется, когда клиент дочитает тело ответа; время включает загрузку тела,
+                   размер — байты, полученные по сети (до распаковки). Тело в хуке не читается;
+                 - headers: метрика отправляется сразу по получении заголовков; время — до заголовков,
+                   размер — Content-Length (0, если заголовка нет). Тело не читается.
     :return: Функция-хук для HTTPX response event hook.
     """
     def inner(response: Response) -> None:
@@ -35,18 +93,27 @@ def locust_response_event_hook(environment: Environment):
         request = response.request
 
         route = request.extensions.get("route", request.url.path)
-        start_time = request.extensions.get("start_time", time.time())
-        response_time = (time.time() - start_time) * 1000
-        response_length = len(response.read())
-
-        environment.events.request.fire(
-            name= f"{request.method} {route}",
-            context =None,
-            response=response,
-            exception=exception,
-            request_type="HTTP",
-            response_time=response_time,
-            response_length=response_length
-        )
-
-    return inner
\ No newline at end of file
+        start_time = request.extensions.get("start_time", time.perf_counter())
+
+        def fire(response_length: int) -> None:
+            environment.events.request.fire(
+                name=f"{request.method} {route}",
+                context=None,
+                response=response,
+                exception=exception,
+                request_type="HTTP",
+                response_time=(time.perf_counter() - start_time) * 1000,
+                response_length=response_length
+            )
+
+        if mode == "stream" and isinstance(response.stream, SyncByteStream) and not response.is_stream_consumed:
+            response.stream = LocustResponseStream(response.stream, on_close=fire)
+            return
+
+        if mode == "headers":
+            fire(get_header_response_length(response))
+            return
+
+        fire(len(response.read()))
+
+    return inner
@@ -1,7 +1,10 @@
 from locust.env import Environment
 
+from clients.http.validation import ValidationMode
+from config import settings
+
 from clients.http.client import HTTPClient, HTTPClientExtensions
-from httpx import Response, QueryParams
+from httpx import Response, QueryParams, HTTPTransport
 
 from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
 from clients.http.gateway.accounts.schema import (
@@ -76,27 +79,27 @@ class AccountsGatewayHTTPClient(HTTPClient):
     def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
         query = GetAccountsQuerySchema(user_id=user_id)
         response = self.get_accounts_api(query)
-        return GetAccountsResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetAccountsResponseSchema)
 
     def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
         request = OpenDepositAccountRequestSchema(user_id=user_id)
         response = self.open_deposit_account_api(request)
-        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenDepositAccountResponseSchema)
 
     def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
         request = OpenSavingsAccountRequestSchema(user_id=user_id)
         response = self.open_savings_account_api(request)
-        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenSavingsAccountResponseSchema)
 
     def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
         request = OpenDebitCardAccountRequestSchema(user_id=user_id)
         response = self.open_debit_card_account_api(request)
-        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenDebitCardAccountResponseSchema)
 
     def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
         request = OpenCreditCardAccountRequestSchema(user_id=user_id)
         response = self.open_credit_card_account_api(request)
-        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenCreditCardAccountResponseSchema)
 
 
 def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
@@ -108,7 +111,11 @@ def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
     return AccountsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_accounts_gateway_locust_http_client(environment: Environment) -> AccountsGatewayHTTPClient:
+def build_accounts_gateway_locust_http_client(
+        environment: Environment,
+        transport: HTTPTransport | None = None,
+        validation_mode: ValidationMode | None = None
+) -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient адаптированного под Locust.
 
@@ -116,6 +123,12 @@ def build_accounts_gateway_locust_http_client(environment: Environment) -> Accou
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param transport: общий транспорт (пул соединений), если клиенты должны его разделять.
+    :param validation_mode: режим валидации ответов. По умолчанию GATEWAY_HTTP_CLIENT.VALIDATION_MODE.
+        none задаётся только здесь и только для клиента, ответы которого в сценарии не используются.
     :return: экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return AccountsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, transport=transport),
+        validation_mode=validation_mode or settings.gateway_http_client.validation_mode
+    )
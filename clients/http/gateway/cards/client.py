@@ -1,7 +1,10 @@
 from locust.env import Environment
 
+from clients.http.validation import ValidationMode
+from config import settings
+
 from clients.http.client import HTTPClient
-from httpx import Response
+from httpx import Response, HTTPTransport
 
 from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
 from clients.http.gateway.cards.schema import (
@@ -39,12 +42,12 @@ class CardsGatewayHTTPClient(HTTPClient):
     def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
         request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_virtual_card_api(request)
-        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, IssueVirtualCardResponseSchema)
 
     def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
         request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_physical_card_api(request)
-        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, IssuePhysicalCardResponseSchema)
 
 
 def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
@@ -55,7 +58,11 @@ def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
     """
     return CardsGatewayHTTPClient(client=build_gateway_http_client())
 
-def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGatewayHTTPClient:
+def build_cards_gateway_locust_http_client(
+        environment: Environment,
+        transport: HTTPTransport | None = None,
+        validation_mode: ValidationMode | None = None
+) -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient адаптированного под Locust.
 
@@ -63,6 +70,12 @@ def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param transport: общий транспорт (пул соединений), если клиенты должны его разделять.
+    :param validation_mode: режим валидации ответов. По умолчанию GATEWAY_HTTP_CLIENT.VALIDATION_MODE.
+        none задаётся только здесь и только для клиента, ответы которого в сценарии не используются.
     :return: экземпляр CardsGatewayHTTPClient с хуками сбора метрик.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return CardsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, transport=transport),
+        validation_mode=validation_mode or settings.gateway_http_client.validation_mode
+    )
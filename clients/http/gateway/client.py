@@ -1,4 +1,6 @@
-from httpx import Client
+from functools import cache
+
+from httpx import Client, HTTPTransport
 from locust.env import Environment
 import logging
 from config import settings
@@ -13,11 +15,53 @@ def build_gateway_http_client() -> Client:
     :return: Готовый к использованию объект httpx.Client.
     """
     return Client(
+        limits=settings.gateway_http_client.limits,
         timeout=settings.gateway_http_client.timeout,
         base_url=settings.gateway_http_client.client_url)
 
 
-def build_gateway_locust_http_client(evironment: Environment) -> Client:
+def build_gateway_http_transport() -> HTTPTransport:
+    """
+    Функция создаёт транспорт (пул соединений) к сервису http-gateway с лимитами и keep-alive из настроек.
+
+    Один транспорт можно передать сразу нескольким httpx.Client, тогда все они будут
+    переиспользовать одни и те же TCP-соединения.
+
+    :return: Объект httpx.HTTPTransport.
+    """
+    return HTTPTransport(limits=settings.gateway_http_client.limits)
+
+
+@cache
+def get_gateway_process_http_transport() -> HTTPTransport:
+    """
+    Возвращает единый на процесс транспорт к сервису http-gateway (создаётся при первом обращении).
+
+    :return: Общий для всех виртуальных пользователей объект httpx.HTTPTransport.
+    """
+    return build_gateway_http_transport()
+
+
+def build_gateway_locust_http_transport() -> HTTPTransport | None:
+    """
+    Возвращает транспорт для API клиентов одного виртуального пользователя Locust
+    в зависимости от GATEWAY_HTTP_CLIENT.POOL_SCOPE:
+    - client: None, каждый httpx.Client создаёт собственный пул соединений;
+    - user: новый транспорт, общий для всех клиентов этого пользователя;
+    - process: общий транспорт для всех пользователей процесса.
+
+    :return: Объект httpx.HTTPTransport или None.
+    """
+    match settings.gateway_http_client.pool_scope:
+        case "user":
+            return build_gateway_http_transport()
+        case "process":
+            return get_gateway_process_http_transport()
+        case _:
+            return None
+
+
+def build_gateway_locust_http_client(evironment: Environment, transport: HTTPTransport | None = None) -> Client:
     """
     HTTP-клиент, предназначенный специально для нагрузочного тестирования с помощью Locust.
 
@@ -30,15 +74,18 @@ def build_gateway_locust_http_client(evironment: Environment) -> Client:
     при каждом выполненном HTTP-запросе.
 
     :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param transport: Общий транспорт (пул соединений). Если не передан, клиент создаёт собственный.
     :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
     """
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
     return Client(
+        limits=settings.gateway_http_client.limits,
+        transport=transport,
         timeout=settings.gateway_http_client.timeout,
         base_url=settings.gateway_http_client.client_url,
         event_hooks={
             "request": [locust_request_event_hook],
-            "response": [locust_response_event_hook(evironment)],
+            "response": [locust_response_event_hook(evironment, mode=settings.gateway_http_client.metrics_mode)],
         }
     )
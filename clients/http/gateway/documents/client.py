@@ -1,7 +1,10 @@
 from locust.env import Environment
 
+from clients.http.validation import ValidationMode
+from config import settings
+
 from clients.http.client import HTTPClient, HTTPClientExtensions
-from httpx import Response
+from httpx import Response, HTTPTransport
 
 from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
 from clients.http.gateway.documents.schema import (
@@ -41,11 +44,11 @@ class DocumentsGatewayHTTPClient(HTTPClient):
 
     def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
         response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetTariffDocumentResponseSchema)
 
     def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
         response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetContractDocumentResponseSchema)
 
 
 def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
@@ -57,7 +60,11 @@ def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
     return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_documents_gateway_locust_http_client(environment: Environment) -> DocumentsGatewayHTTPClient:
+def build_documents_gateway_locust_http_client(
+        environment: Environment,
+        transport: HTTPTransport | None = None,
+        validation_mode: ValidationMode | None = None
+) -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient адаптированного под Locust.
 
@@ -65,6 +72,12 @@ def build_documents_gateway_locust_http_client(environment: Environment) -> Docu
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param transport: общий транспорт (пул соединений), если клиенты должны его разделять.
+    :param validation_mode: режим валидации ответов. По умолчанию GATEWAY_HTTP_CLIENT.VALIDATION_MODE.
+        none задаётся только здесь и только для клиента, ответы которого в сценарии не используются.
     :return: экземпляр DocumentsGatewayHTTPClient с хуками сбора метрик.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return DocumentsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, transport=transport),
+        validation_mode=validation_mode or settings.gateway_http_client.validation_mode
+    )
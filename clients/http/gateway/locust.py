@@ -1,4 +1,6 @@
-from locust import TaskSet, SequentialTaskSet
+from locust import TaskSet
+
+from clients.http.gateway.client import build_gateway_locust_http_transport
 from clients.http.gateway.users.client import (
     UsersGatewayHTTPClient,
     build_users_gateway_locust_http_client
@@ -18,6 +20,7 @@ from clients.http.gateway.documents.client import (
     DocumentsGatewayHTTPClient,
     build_documents_gateway_locust_http_client
 )
+from tools.locust.user import LocustBaseSequentialTaskSet
 
 
 class GatewayHTTPTaskSet(TaskSet):
@@ -37,16 +40,19 @@ class GatewayHTTPTaskSet(TaskSet):
         """
         Метод вызывается перед запуском задач TaskSet.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
+
+        Все клиенты пользователя разделяют один пул соединений (GATEWAY_HTTP_CLIENT.POOL_SCOPE).
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
+        transport = build_gateway_locust_http_transport()
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment, transport)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment, transport)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment, transport)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment, transport)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment, transport)
 
 
 
-class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
+class GatewayHTTPSequentialTaskSet(LocustBaseSequentialTaskSet):
     """
     Базовый SequentialTaskSet для HTTP-сценариев, где важен порядок выполнения задач.
 
@@ -62,9 +68,12 @@ class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
     def on_start(self) -> None:
         """
         Создание API клиентов для последовательного сценария.
+
+        Все клиенты пользователя разделяют один пул соединений (GATEWAY_HTTP_CLIENT.POOL_SCOPE).
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
\ No newline at end of file
+        transport = build_gateway_locust_http_transport()
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment, transport)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment, transport)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment, transport)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment, transport)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment, transport)
\ No newline at end of file
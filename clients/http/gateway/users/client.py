@@ -1,6 +1,9 @@
 from clients.http.client import HTTPClient, HTTPClientExtensions
-from httpx import Response
+from httpx import Response, HTTPTransport
 from locust.env import Environment
+
+from clients.http.validation import ValidationMode
+from config import settings
 from clients.http.gateway.client import (
     build_gateway_http_client,
     build_gateway_locust_http_client
@@ -42,7 +45,7 @@ class UsersGatewayHTTPClient(HTTPClient):
 
     def get_user(self, user_id: str) -> GetUserResponseSchema:
         response = self.get_user_api(user_id)
-        return GetUserResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetUserResponseSchema)
 
     def create_user(self) -> CreateUserResponseSchema:
         request = CreateUserRequestSchema(
@@ -53,7 +56,7 @@ class UsersGatewayHTTPClient(HTTPClient):
             phone_number="string"
         )
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, CreateUserResponseSchema)
 
 
 def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
@@ -64,7 +67,11 @@ def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
     """
     return UsersGatewayHTTPClient(client=build_gateway_http_client())
 
-def build_users_gateway_locust_http_client(environment: Environment) -> UsersGatewayHTTPClient:
+def build_users_gateway_locust_http_client(
+        environment: Environment,
+        transport: HTTPTransport | None = None,
+        validation_mode: ValidationMode | None = None
+) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient адаптированного под Locust.
 
@@ -72,6 +79,12 @@ def build_users_gateway_locust_http_client(environment: Environment) -> UsersGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param transport: общий транспорт (пул соединений), если клиенты должны его разделять.
+    :param validation_mode: режим валидации ответов. По умолчанию GATEWAY_HTTP_CLIENT.VALIDATION_MODE.
+        none задаётся только здесь и только для клиента, ответы которого в сценарии не используются.
     :return: экземпляр UsersGatewayHTTPClient с хуками сбора метрик.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return UsersGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, transport=transport),
+        validation_mode=validation_mode or settings.gateway_http_client.validation_mode
+    )
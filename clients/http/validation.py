@@ -0,0 +1,144 @@
+from functools import cache
+from types import UnionType
+from typing import Literal, TypeVar, Any, Union, get_args, get_origin
+
+from pydantic import BaseModel, Field, create_model
+
+ValidationMode = Literal["full", "lazy", "ids-only", "none"]
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class LazyModel:
+    """
+    Отложенная валидация ответа: тело ответа валидируется в модель только при первом обращении к атрибуту.
+    Если результат вызова в сценарии не используется, валидация не выполняется вовсе.
+    """
+    __slots__ = ("_schema", "_content", "_model")
+
+    def __init__(self, schema: type[BaseModel], content: bytes):
+        """
+        :param schema: Pydantic-модель ответа.
+        :param content: Сырое тело ответа.
+        """
+        self._schema = schema
+        self._content = content
+        self._model: BaseModel | None = None
+
+    @property
+    def model(self) -> BaseModel:
+        if self._model is None:
+            self._model = self._schema.model_validate_json(self._content)
+
+        return self._model
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.model, name)
+
+    def __repr__(self) -> str:
+        return f"LazyModel({self._schema.__name__})"
+
+
+class DiscardedResponseError(RuntimeError):
+    """
+    Обращение к ответу, тело которого не разбиралось (режим валидации none).
+    """
+
+
+class DiscardedModel:
+    """
+    Заменитель ответа в режиме валидации none: тело ответа не разбирается.
+    Любое обращение к полям сразу завершается ошибкой, а не возвращает пустые значения.
+    """
+    __slots__ = ("_schema",)
+
+    def __init__(self, schema: type[BaseModel]):
+        """
+        :param schema: Pydantic-модель ответа.
+        """
+        self._schema = schema
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        raise DiscardedResponseError(
+            f"Ответ {self._schema.__name__} получен в режиме валидации none, поле {name!r} недоступно. "
+            f"Режим none допустим только для вызовов, результат которых не используется"
+        )
+
+    def __repr__(self) -> str:
+        return f"DiscardedModel({self._schema.__name__})"
+
+
+def get_model_type(annotation: Any) -> type[BaseModel] | None:
+    """
+    Возвращает pydantic-модель из аннотации поля (с учётом Optional[...] и X | None).
+    """
+    if get_origin(annotation) in (Union, UnionType):
+        annotation = next((arg for arg in get_args(annotation) if arg is not type(None)), None)
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+
+    return None
+
+
+def is_id_field(name: str) -> bool:
+    return name == "id" or name.endswith("_id")
+
+
+@cache
+def get_ids_only_schema(schema: type[T]) -> type[T]:
+    """
+    Строит (и кэширует) урезанную копию схемы, в которой остаются только идентификаторы
+    (поля id и *_id) и вложенные модели, также урезанные до идентификаторов.
+    Валидация такой схемы выполняется в pydantic-core, но пропускает datetime, enum, суммы и прочие поля.
+
+    :param schema: Pydantic-модель ответа.
+    :return: Урезанная модель с тем же доступом к идентификаторам.
+    """
+    fields = {}
+    for name, field in schema.model_fields.items():
+        if get_origin(field.annotation) is list:
+            item_schema = get_model_type(get_args(field.annotation)[0])
+            if item_schema is not None:
+                fields[name] = (list[get_ids_only_schema(item_schema)], Field(alias=field.alias))
+            continue
+
+        nested_schema = get_model_type(field.annotation)
+        if nested_schema is not None:
+            annotation = get_ids_only_schema(nested_schema)
+            if field.annotation is not nested_schema:
+                annotation = annotation | None
+            fields[name] = (annotation, Field(field.default, alias=field.alias))
+        elif is_id_field(name):
+            fields[name] = (field.annotation, Field(field.default, alias=field.alias))
+
+    return create_model(f"{schema.__name__}IdsOnly", __config__=schema.model_config, **fields)
+
+
+def parse_model(schema: type[T], content: bytes, mode: ValidationMode = "full") -> T:
+    """
+    Преобразует тело ответа в модель в соответствии с режимом валидации:
+    - full: полная валидация (model_validate_json);
+    - lazy: валидация откладывается до первого обращения к атрибутам ответа;
+    - ids-only: валидируются только идентификаторы и структура вложенных моделей;
+    - none: тело ответа не разбирается. Возвращается DiscardedModel, обращение к полям которой
+      завершается DiscardedResponseError. Режим задаётся только явно для клиента или вызова,
+      результат которого не используется; глобально (GATEWAY_HTTP_CLIENT.VALIDATION_MODE) он недоступен.
+
+    :param schema: Pydantic-модель ответа.
+    :param content: Сырое тело ответа.
+    :param mode: Режим валидации.
+    :return: Модель ответа (или её заменитель с тем же доступом к атрибутам).
+    """
+    match mode:
+        case "lazy":
+            return LazyModel(schema, content)  # type: ignore[return-value]
+        case "ids-only":
+            return get_ids_only_schema(schema).model_validate_json(content)
+        case "none":
+            return DiscardedModel(schema)  # type: ignore[return-value]
+        case _:
+            return schema.model_validate_json(content)
@@ -1,12 +1,15 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 import locust.stats
 
+from tools.config.fakers import FakeConfig
 from tools.config.grpc import GRPCClientConfig
 from tools.config.http import HTTPClientConfig
 from tools.config.locust import LocustUserConfig
+from tools.config.seeds import SeedsConfig
+from tools.config.stats import StatsConfig
 
-locust.stats.PERCENTILES_TO_REPORT = [0.50, 0.60, 0.70, 0.80, 0.90, 0.95, 0.99, 1.0]
 locust.stats.CSV_STATS_INTERVAL_SEC = 5
 locust.stats.HISTORY_STATS_INTERVAL_SEC = 5
 locust.stats.CONSOLE_STATS_INTERVAL_SEC =5
@@ -23,5 +26,15 @@ class Settings(BaseSettings):
     locust_user: LocustUserConfig
     gateway_http_client: HTTPClientConfig
     gateway_grpc_client: GRPCClientConfig
+    # Внутренние сервисы стенда (нужны только для сидинга в обход gateway, SEEDS.BACKEND=services)
+    users_grpc_client: GRPCClientConfig | None = None
+    accounts_grpc_client: GRPCClientConfig | None = None
+    cards_grpc_client: GRPCClientConfig | None = None
+    operations_grpc_client: GRPCClientConfig | None = None
+    seeds: SeedsConfig = Field(default_factory=SeedsConfig)
+    fake: FakeConfig = Field(default_factory=FakeConfig)
+    stats: StatsConfig = Field(default_factory=StatsConfig)
 
-settings = Settings()
\ No newline at end of file
+settings = Settings()
+
+locust.stats.PERCENTILES_TO_REPORT = settings.stats.percentiles
\ No newline at end of file
@@ -2,17 +2,16 @@ from clients.grpc.gateway.locust import GatewayGRPCTaskSet
 from locust import events, task
 from locust.env import Environment
 
+from seeds.distributed import init_seeds
 from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
 from seeds.schema.result import SeedUserResult
+from tools.locust.shape import ArrivalRateLoadShape  # noqa: F401 (активна при открытой модели нагрузки)
 from tools.locust.user import LocustBaseUser
 
 
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    seeds_scenario = ExistingUserGetOperationsSeedsScenario()
-    seeds_scenario.build()
-
-    environment.seeds = seeds_scenario.load()
+    init_seeds(environment, ExistingUserGetOperationsSeedsScenario())
 
 
 class GetOperationsTaskSet(GatewayGRPCTaskSet):
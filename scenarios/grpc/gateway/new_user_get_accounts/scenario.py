@@ -2,6 +2,7 @@ from locust import task
 from clients.grpc.gateway.locust import GatewayGRPCSequentialTaskSet
 from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserResponse
 from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import OpenDepositAccountResponse
+from tools.locust.shape import ArrivalRateLoadShape  # noqa: F401 (активна при открытой модели нагрузки)
 from tools.locust.user import LocustBaseUser
 
 
@@ -2,17 +2,16 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
+from seeds.distributed import init_seeds
 from seeds.scenarios.existing_user_get_documents import ExistingUserGetDocumentsSeedsScenario
 from seeds.schema.result import SeedUserResult
+from tools.locust.shape import ArrivalRateLoadShape  # noqa: F401 (активна при открытой модели нагрузки)
 from tools.locust.user import LocustBaseUser
 
 
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    seeds_scenario = ExistingUserGetDocumentsSeedsScenario()
-    seeds_scenario.build()
-
-    environment.seeds = seeds_scenario.load()
+    init_seeds(environment, ExistingUserGetDocumentsSeedsScenario())
 
 
 class ExistingUserGetDocumentsTaskSet(GatewayHTTPTaskSet):
@@ -23,6 +22,9 @@ class ExistingUserGetDocumentsTaskSet(GatewayHTTPTaskSet):
 
         self.seed_user = self.user.environment.seeds.get_next_user()
 
+    def on_stop(self) -> None:
+        self.user.environment.seeds.release_user(self.seed_user)
+
     @task(1)
     def get_accounts(self):
         self.accounts_gateway_client.get_accounts(user_id=self.seed_user.user_id)
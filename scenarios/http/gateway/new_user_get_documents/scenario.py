@@ -3,6 +3,7 @@ from clients.http.gateway.locust import GatewayHTTPSequentialTaskSet
 from locust import task
 
 from clients.http.gateway.users.schema import CreateUserResponseSchema
+from tools.locust.shape import ArrivalRateLoadShape  # noqa: F401 (активна при открытой модели нагрузки)
 from tools.locust.user import LocustBaseUser
 
 
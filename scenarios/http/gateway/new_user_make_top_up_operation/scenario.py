@@ -4,6 +4,7 @@ from clients.http.gateway.accounts.schema import OpenDebitCardAccountResponseSch
 from clients.http.gateway.locust import GatewayHTTPSequentialTaskSet
 from clients.http.gateway.operations.schema import MakeTopUpOperationResponseSchema
 from clients.http.gateway.users.schema import CreateUserResponseSchema
+from tools.locust.shape import ArrivalRateLoadShape  # noqa: F401 (активна при открытой модели нагрузки)
 from tools.locust.user import LocustBaseUser
 
 
@@ -0,0 +1,300 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, TypeVar
+
+from grpc import aio
+
+from clients.grpc.gateway.client import build_gateway_async_grpc_client
+from clients.grpc.gateway.users.client import UsersGatewayAsyncGRPCClient
+from clients.grpc.gateway.cards.client import CardsGatewayAsyncGRPCClient
+from clients.grpc.gateway.accounts.client import AccountsGatewayAsyncGRPCClient
+from clients.grpc.gateway.operations.client import OperationsGatewayAsyncGRPCClient
+from seeds.metrics import SeedsMetrics
+from seeds.retry import SeedsFailureBudgetExceededError, is_retryable_error, get_backoff_delay
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan
+from seeds.schema.result import SeedsResult, SeedUserResult, SeedAccountResult, SeedCardResult, SeedOperationResult
+from seeds.tasks import SeedAccountTask, SeedChildTask, SeedTaskContext, build_gateway_account_tasks
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("ASYNC_SEEDS_BUILDER")
+
+T = TypeVar("T")
+
+
+class AsyncSeedsBuilder:
+    """
+    AsyncSeedsBuilder — асинхронный сидер на asyncio и grpc.aio. Строит тот же SeedsResult, что и SeedsBulider,
+    но держит в полёте до `concurrency` запросов одновременно из одного процесса, поэтому скорость
+    сидинга упирается в пропускную способность стенда, а не в задержку каждого запроса.
+
+    Порядок зависимостей внутри пользователя сохраняется (пользователь → счёт → карты/операции),
+    всё независимое выполняется параллельно. Пользователей одновременно строят не больше `concurrency`
+    воркеров, так что количество задач в event loop не растёт с размером плана.
+
+    Канал к стенду открывается на время каждого вызова build() в его собственном event loop и закрывается
+    по завершении, в том числе при ошибке.
+
+    Attributes:
+        build_channel: Фабрика асинхронного gRPC-канала к grpc-gateway
+        concurrency: Максимальное количество одновременно выполняемых запросов (и строящихся пользователей)
+        retry_attempts: Сколько раз повторять запрос после временной ошибки стенда
+        retry_backoff: Базовая задержка перед повтором, с (растёт экспоненциально, с джиттером)
+        retry_backoff_max: Максимальная задержка перед повтором, с
+        max_failed_users_ratio: Доля пользователей плана, которую можно пропустить из-за ошибок
+        metrics: Метрики сидинга (задержки и ошибки запросов к стенду)
+    """
+
+    def __init__(
+            self,
+            build_channel: Callable[[], aio.Channel],
+            concurrency: int = 100,
+            retry_attempts: int = 3,
+            retry_backoff: float = 0.1,
+            retry_backoff_max: float = 5.0,
+            max_failed_users_ratio: float = 0.1
+    ):
+        self.build_channel = build_channel
+        self.concurrency = concurrency
+        self.retry_attempts = retry_attempts
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self.max_failed_users_ratio = max_failed_users_ratio
+        self.metrics = SeedsMetrics()
+
+        # Клиенты и семафор привязаны к event loop текущего вызова build() (см. build_async)
+        self.semaphore: asyncio.Semaphore | None = None
+        self.users_gateway_client: UsersGatewayAsyncGRPCClient | None = None
+        self.cards_gateway_client: CardsGatewayAsyncGRPCClient | None = None
+        self.accounts_gateway_client: AccountsGatewayAsyncGRPCClient | None = None
+        self.operations_gateway_client: OperationsGatewayAsyncGRPCClient | None = None
+
+    async def call(self, function: Callable[..., Awaitable[T]], **kwargs) -> T:
+        """
+        Выполняет запрос к стенду, ограничивая количество одновременно выполняемых запросов,
+        и записывает его длительность и результат в метрики сидинга (без времени ожидания семафора).
+        Временные ошибки стенда повторяются так же, как в SeedsBulider.call; на время задержки
+        перед повтором слот семафора освобождается.
+
+        Args:
+            function: Асинхронный метод клиента
+            kwargs: Аргументы для вызова метода
+
+        Returns:
+            Ответ клиента
+        """
+        attempt = 0
+        while True:
+            async with self.semaphore:
+                start_time = time.perf_counter()
+                try:
+                    response = await function(**kwargs)
+                except Exception as error:
+                    self.metrics.record(function.__name__, (time.perf_counter() - start_time) * 1000, failed=True)
+                    if attempt >= self.retry_attempts or not is_retryable_error(error):
+                        raise
+                else:
+                    self.metrics.record(function.__name__, (time.perf_counter() - start_time) * 1000)
+                    return response
+
+            self.metrics.record_retry(function.__name__)
+            await asyncio.sleep(get_backoff_delay(attempt, self.retry_backoff, self.retry_backoff_max))
+            attempt += 1
+
+    async def create_user(self) -> str:
+        response = await self.call(self.users_gateway_client.create_user)
+        return response.user.id
+
+    async def open_account(self, function: Callable[..., Awaitable[Any]], user_id: str) -> SeedTaskContext:
+        """
+        Открывает счёт ручкой gateway (см. SeedsBulider.open_account).
+        """
+        account = (await self.call(function, user_id=user_id)).account
+        context = {"account_id": account.id}
+        if account.cards:
+            context["card_id"] = account.cards[0].id
+
+        return context
+
+    def get_account_tasks(self) -> list[SeedAccountTask]:
+        """
+        Таблица задач сидинга — та же, что у SeedsBulider, но с асинхронными клиентами.
+        """
+        return build_gateway_account_tasks(
+            open_account=self.open_account,
+            accounts_client=self.accounts_gateway_client,
+            cards_client=self.cards_gateway_client,
+            operations_client=self.operations_gateway_client
+        )
+
+    async def execute_child(
+            self,
+            task: SeedChildTask,
+            context: SeedTaskContext
+    ) -> SeedCardResult | SeedOperationResult:
+        response = await self.call(task.function, **task.get_kwargs(context))
+        return task.get_result(response)
+
+    async def execute_account(
+            self,
+            task: SeedAccountTask,
+            plan: SeedAccountsPlan,
+            user_id: str
+    ) -> SeedAccountResult:
+        """
+        Открывает счёт, после чего параллельно создаёт на нём карты и операции по плану.
+        При первой ошибке остальные запросы счёта отменяются.
+
+        Args:
+            task: Задача открытия счёта
+            plan: План счёта (количество карт и операций каждого типа)
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID счёта и деталями карт и операций
+        """
+        context = {"user_id": user_id, **await task.open(user_id)}
+        children = task.get_children(plan)
+
+        results = await gather_all(*(
+            gather_many(count, self.execute_child, task=child, context=context) for child, count in children
+        ))
+
+        return SeedAccountResult(
+            account_id=context["account_id"],
+            **{child.kind: result for (child, _), result in zip(children, results)}
+        )
+
+    async def execute_user(self, plan: SeedUsersPlan, tasks: list[SeedAccountTask]) -> SeedUserResult:
+        """
+        Создаёт пользователя, после чего параллельно открывает все его счета согласно плану.
+        При первой ошибке остальные запросы пользователя отменяются.
+
+        Args:
+            plan: План генерации пользователя
+            tasks: Таблица задач сидинга (см. get_account_tasks)
+
+        Returns:
+            SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
+        """
+        user_id = await self.create_user()
+
+        results = await gather_all(*(
+            gather_many(getattr(plan, task.kind).count, self.execute_account, task=task,
+                        plan=getattr(plan, task.kind), user_id=user_id)
+            for task in tasks
+        ))
+
+        return SeedUserResult(user_id=user_id, **{task.kind: result for task, result in zip(tasks, results)})
+
+    async def build_async(
+            self,
+            plan: SeedsPlan,
+            completed: list[SeedUserResult] | None = None,
+            on_user_built: Callable[[SeedUserResult], None] | None = None
+    ) -> SeedsResult:
+        """
+        Асинхронно генерирует полную структуру данных на основе плана.
+        Пользователи, которых не удалось создать полностью, пропускаются (см. SeedsBulider.build).
+
+        Пользователей строят `concurrency` воркеров, каждый берёт следующий номер пользователя из плана.
+        Когда бюджет ошибок исчерпан, остальные воркеры и их запросы отменяются, канал закрывается.
+
+        Args:
+            plan: Полный план генерации данных
+            completed: Пользователи, уже созданные в предыдущем (прерванном) запуске
+            on_user_built: Колбэк, вызываемый для каждого полностью созданного пользователя
+
+        Returns:
+            SeedsResult: Результат с данными всех созданных пользователей (порядок сохраняется)
+        """
+        completed = completed or []
+        remaining = max(plan.users.count - len(completed), 0)
+        failure_budget = int(remaining * self.max_failed_users_ratio)
+        failed_users = 0
+        users: list[SeedUserResult | None] = [None] * remaining
+        indexes = iter(range(remaining))
+
+        async def build_users(tasks: list[SeedAccountTask]) -> None:
+            nonlocal failed_users
+            for index in indexes:
+                try:
+                    user = await self.execute_user(plan.users, tasks)
+                except Exception as error:
+                    failed_users += 1
+                    self.metrics.record_failed_user()
+                    if failed_users > failure_budget:
+                        raise SeedsFailureBudgetExceededError(
+                            f"Failed to seed {failed_users} users, failure budget is {failure_budget}"
+                        ) from error
+
+                    logger.warning(f"Failed to seed user, skipping it ({failed_users}/{failure_budget}): {error!r}")
+                    continue
+
+                users[index] = user
+                if on_user_built:
+                    on_user_built(user)
+
+        async with self.build_channel() as channel:
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+            self.users_gateway_client = UsersGatewayAsyncGRPCClient(channel)
+            self.cards_gateway_client = CardsGatewayAsyncGRPCClient(channel)
+            self.accounts_gateway_client = AccountsGatewayAsyncGRPCClient(channel)
+            self.operations_gateway_client = OperationsGatewayAsyncGRPCClient(channel)
+
+            tasks = self.get_account_tasks()
+            await gather_all(*(build_users(tasks) for _ in range(min(self.concurrency, remaining))))
+
+        return SeedsResult(users=[*completed, *(user for user in users if user is not None)])
+
+    def build(
+            self,
+            plan: SeedsPlan,
+            completed: list[SeedUserResult] | None = None,
+            on_user_built: Callable[[SeedUserResult], None] | None = None
+    ) -> SeedsResult:
+        """
+        Синхронная обёртка над build_async с тем же интерфейсом, что и SeedsBulider.build,
+        поэтому асинхронный сидер можно использовать в SeedsScenario без изменений.
+        Каждый вызов выполняется в новом event loop (asyncio.run).
+        """
+        return asyncio.run(self.build_async(plan, completed=completed, on_user_built=on_user_built))
+
+
+async def gather_all(*coroutines: Awaitable[T]) -> list[T]:
+    """
+    Аналог asyncio.gather: при первой ошибке отменяет остальные корутины, дожидается их отмены
+    и пробрасывает ошибку.
+    """
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def gather_many(count: int, function: Callable[..., Awaitable[T]], **kwargs) -> list[T]:
+    """
+    Запускает `count` одинаковых независимых корутин и собирает их результаты в исходном порядке.
+    """
+    return await gather_all(*(function(**kwargs) for _ in range(count)))
+
+
+def build_async_grpc_seeds_builder() -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания асинхронного сидера с использованием grpc.aio клиентов.
+
+    Returns:
+        AsyncSeedsBuilder: Инициализированный сидер, открывающий канал к grpc-gateway на время build()
+    """
+    return AsyncSeedsBuilder(
+        build_channel=build_gateway_async_grpc_client,
+        concurrency=settings.seeds.concurrency,
+        retry_attempts=settings.seeds.retry_attempts,
+        retry_backoff=settings.seeds.retry_backoff,
+        retry_backoff_max=settings.seeds.retry_backoff_max,
+        max_failed_users_ratio=settings.seeds.max_failed_users_ratio
+    )
@@ -1,3 +1,13 @@
+import time
+from collections import deque
+from typing import Any, Callable, TypeVar
+
+import gevent
+from gevent.event import AsyncResult
+from gevent.lock import BoundedSemaphore
+from gevent.pool import Pool
+from grpc import Channel, Future
+
 from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_grpc_client
 from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient, build_cards_gateway_grpc_client
 from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient, build_accounts_gateway_grpc_client
@@ -6,8 +16,35 @@ from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_user
 from clients.http.gateway.cards.client import CardsGatewayHTTPClient, build_cards_gateway_http_client
 from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_http_client
 from clients.http.gateway.operations.client import OperationsGatewayHTTPClient, build_operations_gateway_http_client
+from seeds.metrics import SeedsMetrics
+from seeds.retry import SeedsFailureBudgetExceededError, is_retryable_error, get_backoff_delay
 from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan
 from seeds.schema.result import SeedsResult, SeedUserResult, SeedAccountResult, SeedCardResult, SeedOperationResult
+from seeds.tasks import SeedAccountTask, SeedChildTask, SeedTaskContext, build_gateway_account_tasks
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_BUILDER")
+
+T = TypeVar("T")
+
+
+class SeedsTask:
+    """
+    Создание сущности, запущенное через SeedsBulider.submit.
+
+    Attributes:
+        result: Результат или ошибка создания
+        greenlet: Гринлет, в котором выполняется создание (None в последовательном режиме)
+    """
+    __slots__ = ("result", "greenlet")
+
+    def __init__(self):
+        self.result = AsyncResult()
+        self.greenlet: gevent.Greenlet | None = None
+
+    def get(self) -> Any:
+        return self.result.get()
 
 
 class SeedsBulider:
@@ -15,11 +52,27 @@ class SeedsBulider:
     SeedsBuilder — генератор (сидер), формирующий необходимые тестовые или демонстрационные данные
     на основании входного плана. Работает одинаково как с HTTP, так и с gRPC клиентами.
 
+    Дерево плана обходит один исполнитель (execute_user -> execute_account -> execute_child) по таблице
+    задач из get_account_tasks, поэтому параллельность, конвейер и повторы одинаково применяются
+    ко всем типам счетов, карт и операций.
+
     Attributes:
         users_gateway_client: Клиент для работы с пользователями (HTTP или gRPC)
         cards_gateway_client: Клиент для выпуска карт
         accounts_gateway_client: Клиент для открытия счетов
         operations_gateway_client: Клиент для операций (топ-ап, покупки и т.д.)
+        workers: Количество пользователей, создаваемых параллельно. При значении 1 сидинг
+                 выполняется строго последовательно, как и раньше.
+        concurrency: Максимальное количество одновременно выполняемых запросов (счета и их дочерние
+                     сущности создаются в отдельных гринлетах, поэтому `workers` их не ограничивает)
+        retry_attempts: Сколько раз повторять запрос после временной ошибки стенда
+        retry_backoff: Базовая задержка перед повтором, с (растёт экспоненциально, с джиттером)
+        retry_backoff_max: Максимальная задержка перед повтором, с
+        max_failed_users_ratio: Доля пользователей плана, которую можно пропустить из-за ошибок,
+                                прежде чем сидинг будет прерван
+        pipeline_depth: Максимальное число одновременно ожидающих ответа grpc.Future на один канал
+                        при конвейерном создании карт и операций счёта (0 — без конвейера)
+        metrics: Метрики сидинга (задержки и ошибки запросов к стенду)
     """
 
     def __init__(
@@ -27,225 +80,400 @@ class SeedsBulider:
             users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
             cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
             accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
-            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient
+            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient,
+            workers: int = 1,
+            concurrency: int = 100,
+            retry_attempts: int = 3,
+            retry_backoff: float = 0.1,
+            retry_backoff_max: float = 5.0,
+            max_failed_users_ratio: float = 0.1,
+            pipeline_depth: int = 32
     ):
         self.users_gateway_client = users_gateway_client
         self.cards_gateway_client = cards_gateway_client
         self.accounts_gateway_client = accounts_gateway_client
         self.operations_gateway_client = operations_gateway_client
-
-    def build_virtual_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
-        response = self.cards_gateway_client.issue_virtual_card(
-            user_id=user_id,
-            account_id=account_id
-        )
-        return SeedCardResult(card_id=response.card.id)
-
-    def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        self.workers = workers
+        self.concurrency = concurrency
+        self.semaphore = BoundedSemaphore(max(concurrency, 1))
+        self.retry_attempts = retry_attempts
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self.max_failed_users_ratio = max_failed_users_ratio
+        self.pipeline_depth = pipeline_depth
+        self.pipeline_slots: dict[Channel, BoundedSemaphore] = {}
+        self.metrics = SeedsMetrics()
+
+    @property
+    def concurrent(self) -> bool:
+        return self.workers > 1
+
+    def call(self, function: Callable[..., T], **kwargs) -> T:
         """
-        Выпускает физическую карту для заданного пользователя и счёта.
+        Выполняет запрос к стенду, ограничивая количество одновременно выполняемых запросов (`concurrency`),
+        и записывает его длительность и результат в метрики сидинга (без времени ожидания семафора).
+
+        Временные ошибки (сетевые, HTTP 5xx, gRPC UNAVAILABLE и т.п.) повторяются до `retry_attempts` раз
+        с экспоненциальной задержкой и джиттером. Повтор неидемпотентного запроса может оставить на стенде
+        лишнюю сущность, но в результат сидинга попадает только та, чей ответ получен.
 
         Args:
-            user_id: Идентификатор пользователя
-            account_id: Идентификатор счёта
+            function: Метод клиента
+            kwargs: Аргументы для вызова метода
 
         Returns:
-            SeedCardResult: Результат с ID выпущенной карты
+            Ответ клиента
         """
-        response = self.cards_gateway_client.issue_physical_card(
-            user_id=user_id,
-            account_id=account_id
-        )
-        return SeedCardResult(card_id=response.card.id)
-
-    def build_top_up_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        attempt = 0
+        while True:
+            with self.semaphore:
+                start_time = time.perf_counter()
+                try:
+                    response = function(**kwargs)
+                except Exception as error:
+                    self.metrics.record(function.__name__, (time.perf_counter() - start_time) * 1000, failed=True)
+                    if attempt >= self.retry_attempts or not is_retryable_error(error):
+                        raise
+                else:
+                    self.metrics.record(function.__name__, (time.perf_counter() - start_time) * 1000)
+                    return response
+
+            # На время задержки перед повтором слот семафора освобождается
+            self.metrics.record_retry(function.__name__)
+            gevent.sleep(get_backoff_delay(attempt, self.retry_backoff, self.retry_backoff_max))
+            attempt += 1
+
+    def get_pipeline_slots(self, function: Callable[..., Future]) -> BoundedSemaphore:
+        """
+        Возвращает семафор, ограничивающий число запросов в полёте на канале клиента, которому принадлежит метод.
         """
-        Выполняет операцию пополнения на карту.
+        channel = function.__self__.channel
+        slots = self.pipeline_slots.get(channel)
+        if slots is None:
+            slots = self.pipeline_slots[channel] = BoundedSemaphore(max(self.pipeline_depth, 1))
 
-        Args:
-            card_id: Идентификатор карты
-            account_id: Идентификатор счёта
+        return slots
 
-        Returns:
-            SeedOperationResult: Результат с ID выполненной операции
+    def resolve_future(self, function: Callable[..., Future], kwargs: dict[str, Any], future: Future,
+                       start_time: float) -> Any:
         """
-        response = self.operations_gateway_client.make_top_up_operation(
-            card_id=card_id,
-            account_id=account_id
-        )
-        return SeedOperationResult(operation_id=response.operation.id)
-
-    def build_purchase_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        Дожидается ответа конвейерного запроса и записывает его в метрики сидинга.
+        Временные ошибки повторяются так же, как в call(): запрос отправляется заново.
         """
-        Выполняет операцию покупки по карте.
+        name = function.__name__.removesuffix("_future")
+        attempt = 0
+        while True:
+            try:
+                response = future.result()
+            except Exception as error:
+                self.metrics.record(name, (time.perf_counter() - start_time) * 1000, failed=True)
+                if attempt >= self.retry_attempts or not is_retryable_error(error):
+                    raise
+
+                self.metrics.record_retry(name)
+                gevent.sleep(get_backoff_delay(attempt, self.retry_backoff, self.retry_backoff_max))
+                attempt += 1
+                start_time, future = time.perf_counter(), function(**kwargs)
+                continue
+
+            self.metrics.record(name, (time.perf_counter() - start_time) * 1000)
+            return response
+
+    def call_pipelined(self, calls: list[tuple[Callable[..., Future], dict[str, Any]]]) -> list[Any]:
+        """
+        Конвейерно выполняет независимые запросы: отправляет их через grpc.Future, не дожидаясь ответов,
+        и собирает ответы в исходном порядке. Время создания группы сущностей сокращается
+        с суммы задержек до примерно максимальной задержки.
+
+        На каждом канале одновременно ожидают ответа не более `pipeline_depth` запросов (лимит общий
+        для всех гринлетов билдера). Если лимит исчерпан, сначала забирается ответ самого старого
+        собственного запроса.
 
         Args:
-            card_id: Идентификатор карты
-            account_id: Идентификатор счёта
+            calls: Пары (метод клиента, возвращающий grpc.Future; аргументы вызова)
 
         Returns:
-            SeedOperationResult: Результат с ID выполненной операции
+            Ответы в порядке запросов
         """
-        response = self.operations_gateway_client.make_purchase_operation(
-            card_id=card_id,
-            account_id=account_id
-        )
-        return SeedOperationResult(operation_id=response.operation.id)
-
-    def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
+        responses: list[Any] = [None] * len(calls)
+        in_flight: deque[tuple[int, Future, float, BoundedSemaphore]] = deque()
+
+        def collect() -> None:
+            index, future, start_time, slots = in_flight.popleft()
+            try:
+                function, kwargs = calls[index]
+                responses[index] = self.resolve_future(function, kwargs, future, start_time)
+            finally:
+                slots.release()
+
+        try:
+            for index, (function, kwargs) in enumerate(calls):
+                slots = self.get_pipeline_slots(function)
+                while not slots.acquire(blocking=False):
+                    if not in_flight:
+                        slots.acquire()
+                        break
+                    collect()
+
+                try:
+                    in_flight.append((index, function(**kwargs), time.perf_counter(), slots))
+                except Exception:
+                    slots.release()
+                    raise
+
+            while in_flight:
+                collect()
+        except Exception:
+            for _, future, _, slots in in_flight:
+                future.cancel()
+                slots.release()
+            raise
+
+        return responses
+
+    def submit(self, function: Callable[..., T], **kwargs) -> SeedsTask:
         """
-        Открывает депозитный счёт для пользователя.
+        Запускает создание независимой сущности.
+
+        В конкурентном режиме функция выполняется в отдельном гринлете, в последовательном —
+        сразу же. В обоих случаях результаты забираются через gather(), поэтому порядок
+        элементов в итоговом SeedsResult совпадает с последовательным режимом.
+        Ошибка создания сущности тоже передаётся через gather(), а не печатается гринлетом.
 
         Args:
-            user_id: Идентификатор пользователя
+            function: Метод билдера, создающий сущность
+            kwargs: Аргументы для вызова метода
 
         Returns:
-            SeedAccountResult: Результат с ID созданного счёта
+            SeedsTask: Запущенное создание сущности
         """
-        response = self.accounts_gateway_client.open_deposit_account(user_id=user_id)
-        return SeedAccountResult(account_id=response.account.id)
+        task = SeedsTask()
 
-    def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
-        """
-        Открывает дебетовый счёт для пользователя и при необходимости:
-        - выпускает физические карты
-        - выполняет операции пополнения (top-up)
-        - выполняет операции покупки
+        def run() -> None:
+            try:
+                task.result.set(function(**kwargs))
+            except Exception as error:
+                task.result.set_exception(error)
 
-        Args:
-            plan: План создания дебетового счёта (кол-во карт, операций и т.п.)
-            user_id: Идентификатор пользователя
+        if self.concurrent:
+            task.greenlet = gevent.spawn(run)
+        else:
+            run()
 
-        Returns:
-            SeedAccountResult: Результат с ID счёта и дополнительными действиями (карты, операции)
+        return task
+
+    @staticmethod
+    def gather(submitted: dict[str, list[SeedsTask]]) -> dict[str, list[Any]]:
         """
-        response = self.accounts_gateway_client.open_debit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[self.build_physical_card_result(user_id=user_id, account_id=account_id) for _ in
-                            range(plan.physical_cards.count)],
-            virtual_cards=[self.build_virtual_card_result(user_id=user_id, account_id=account_id) for _ in
-                           range(plan.virtual_cards.count)],
-            top_up_operations=[self.build_top_up_operation_result(card_id=card_id, account_id=account_id) for _ in
-                               range(plan.top_up_operations.count)],
-            purchase_operations=[self.build_purchase_operation_result(card_id=card_id, account_id=account_id) for _ in
-                                 range(plan.purchase_operations.count)],
-            transfer_operations=[self.build_transfer_operation_result(card_id=card_id, account_id=account_id) for _ in
-                                 range(plan.transfer_operations.count)],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id) for _ in
-                range(plan.cash_withdrawal_operations.count)]
-        )
+        Возвращает результаты задач по видам сущностей в исходном порядке. Если одна из задач упала
+        (или сам гринлет, который ждёт результаты, останавливают), остальные задачи останавливаются:
+        сущности пользователя, который всё равно будет пропущен, не создаются на стенде. Остановка
+        каскадная — задача, ожидающая своих дочерних задач, останавливает и их.
+        """
+        try:
+            # Ждём задачи в порядке завершения, чтобы заметить ошибку сразу, а не когда до неё дойдёт очередь
+            for result in gevent.iwait([task.result for tasks in submitted.values() for task in tasks]):
+                result.get()
+
+            return {kind: [task.get() for task in tasks] for kind, tasks in submitted.items()}
+        except BaseException:
+            gevent.killall([
+                task.greenlet for tasks in submitted.values() for task in tasks if task.greenlet is not None
+            ])
+            raise
+
+    def create_user(self) -> str:
+        """
+        Создаёт пользователя и возвращает его ID (корень дерева плана).
+        """
+        response = self.call(self.users_gateway_client.create_user)
+        return response.user.id
 
-    def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+    def open_account(self, function: Callable[..., Any], user_id: str) -> SeedTaskContext:
         """
-        Открывает кредитный счёт и выполняет действия согласно плану:
-        - выпускает физические карты
-        - выполняет операции пополнения (top-up)
-        - выполняет операции покупки
+        Открывает счёт ручкой gateway. Карточные счета открываются сразу с основной картой,
+        на неё создаются операции счёта.
 
         Args:
-            plan: План создания кредитного счёта
+            function: Метод клиента, открывающий счёт нужного типа
             user_id: Идентификатор пользователя
 
         Returns:
-            SeedAccountResult: Результат с ID счёта и деталями операций
+            SeedTaskContext: account_id и, для карточных счетов, card_id
         """
-        response = self.accounts_gateway_client.open_credit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[self.build_physical_card_result(user_id=user_id, account_id=account_id) for _ in
-                            range(plan.physical_cards.count)],
-            virtual_cards=[self.build_virtual_card_result(user_id=user_id, account_id=account_id) for _ in
-                           range(plan.virtual_cards.count)],
-            top_up_operations=[self.build_top_up_operation_result(card_id=card_id, account_id=account_id) for _ in
-                               range(plan.top_up_operations.count)],
-            purchase_operations=[self.build_purchase_operation_result(card_id=card_id, account_id=account_id) for _
-                                 in
-                                 range(plan.purchase_operations.count)],
-            transfer_operations=[self.build_transfer_operation_result(card_id=card_id, account_id=account_id) for _ in
-                                 range(plan.transfer_operations.count)],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id) for _ in
-                range(plan.cash_withdrawal_operations.count)]
+        account = self.call(function, user_id=user_id).account
+        context = {"account_id": account.id}
+        if account.cards:
+            context["card_id"] = account.cards[0].id
+
+        return context
+
+    def get_account_tasks(self) -> list[SeedAccountTask]:
+        """
+        Таблица задач сидинга: какой запрос создаёт сущность каждого типа плана.
+        Переопределяется наследниками, которые создают данные другими клиентами (см. ServicesSeedsBuilder).
+        """
+        return build_gateway_account_tasks(
+            open_account=self.open_account,
+            accounts_client=self.accounts_gateway_client,
+            cards_client=self.cards_gateway_client,
+            operations_client=self.operations_gateway_client
         )
 
-    def build_savings_account_result(self, user_id: str) -> SeedAccountResult:
+    def can_pipeline(self, children: list[tuple[SeedChildTask, int]]) -> bool:
+        """
+        Дочерние сущности счёта создаются конвейером grpc.Future, если его поддерживают клиенты всех задач.
         """
-        Открывает сберегательный счёт для пользователя.
+        return self.pipeline_depth > 0 and all(child.future_function for child, count in children if count)
+
+    def execute_child(self, task: SeedChildTask, context: SeedTaskContext) -> SeedCardResult | SeedOperationResult:
+        response = self.call(task.function, **task.get_kwargs(context))
+        return task.get_result(response)
+
+    def execute_account(self, task: SeedAccountTask, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        """
+        Открывает счёт и создаёт на нём карты и операции по плану.
+        Все дочерние сущности счёта независимы друг от друга: если клиенты это поддерживают, они создаются
+        конвейером grpc.Future (см. call_pipelined), иначе в конкурентном режиме — параллельно в гринлетах.
 
         Args:
+            task: Задача открытия счёта
+            plan: План счёта (количество карт и операций каждого типа)
             user_id: Идентификатор пользователя
 
         Returns:
-            SeedAccountResult: Результат с ID созданного счёта
+            SeedAccountResult: Результат с ID счёта и деталями карт и операций
         """
-        response = self.accounts_gateway_client.open_savings_account(user_id=user_id)
-        return SeedAccountResult(account_id=response.account.id)
-
-    def build_transfer_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
-        response = self.operations_gateway_client.make_transfer_operation(
-            card_id=card_id,
-            account_id=account_id
-        )
-        return SeedOperationResult(operation_id=response.operation.id)
-
-    def build_cash_withdrawal_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
-        response = self.operations_gateway_client.make_cash_withdrawal_operation(
-            card_id=card_id,
-            account_id=account_id
-        )
-        return SeedOperationResult(operation_id=response.operation.id)
-
-    def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
+        context = {"user_id": user_id, **task.open(user_id)}
+        children = task.get_children(plan)
+
+        if self.can_pipeline(children):
+            responses = iter(self.call_pipelined([
+                (child.future_function, child.get_kwargs(context)) for child, count in children for _ in range(count)
+            ]))
+            results = {
+                child.kind: [child.get_result(next(responses)) for _ in range(count)] for child, count in children
+            }
+        else:
+            submitted = {
+                child.kind: [self.submit(self.execute_child, task=child, context=context) for _ in range(count)]
+                for child, count in children
+            }
+            results = self.gather(submitted)
+
+        return SeedAccountResult(account_id=context["account_id"], **results)
+
+    def execute_user(self, plan: SeedUsersPlan, tasks: list[SeedAccountTask]) -> SeedUserResult:
         """
-        Создаёт пользователя и согласно переданному плану:
-        - открывает сберегательные и депозитные счета
-        - создаёт дебетовые и кредитные счета с картами и операциями
+        Создаёт пользователя и все его счета (с картами и операциями) согласно плану.
+        Счета пользователя независимы друг от друга и в конкурентном режиме открываются параллельно.
 
         Args:
             plan: План генерации пользователя
+            tasks: Таблица задач сидинга (см. get_account_tasks)
 
         Returns:
             SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
         """
-        response = self.users_gateway_client.create_user()
-
-        return SeedUserResult(
-            user_id=response.user.id,
-            deposit_accounts=[self.build_deposit_account_result(user_id=response.user.id) for _ in
-                              range(plan.deposit_accounts.count)],
-            savings_accounts=[self.build_savings_account_result(user_id=response.user.id) for _ in
-                              range(plan.savings_accounts.count)],
-            debit_card_accounts=[
-                self.build_debit_card_account_result(plan=plan.debit_card_accounts, user_id=response.user.id) for _
-                in
-                range(plan.debit_card_accounts.count)],
-            credit_card_accounts=[
-                self.build_credit_card_account_result(plan=plan.credit_card_accounts, user_id=response.user.id) for
-                _ in
-                range(plan.credit_card_accounts.count)],
-        )
+        user_id = self.create_user()
+
+        submitted = {
+            task.kind: [
+                self.submit(self.execute_account, task=task, plan=getattr(plan, task.kind), user_id=user_id)
+                for _ in range(getattr(plan, task.kind).count)
+            ]
+            for task in tasks
+        }
+
+        return SeedUserResult(user_id=user_id, **self.gather(submitted))
 
-    def build(self, plan: SeedsPlan) -> SeedsResult:
+    def build(
+            self,
+            plan: SeedsPlan,
+            completed: list[SeedUserResult] | None = None,
+            on_user_built: Callable[[SeedUserResult], None] | None = None
+    ) -> SeedsResult:
         """
         Генерирует полную структуру данных на основе плана:
         - создаёт указанное количество пользователей
         - каждому пользователю присваиваются счета, карты и операции
 
+        В конкурентном режиме одновременно создаётся не более `workers` пользователей,
+        порядок пользователей в результате сохраняется.
+
+        Пользователь, которого не удалось создать полностью (ошибка не исчезла после повторов),
+        пропускается и не попадает в результат. Если пропущено больше `max_failed_users_ratio`
+        пользователей плана, сидинг прерывается с SeedsFailureBudgetExceededError.
+
         Args:
             plan: Полный план генерации данных
+            completed: Пользователи, уже созданные в предыдущем (прерванном) запуске.
+                       Они попадают в начало результата и не создаются повторно.
+            on_user_built: Колбэк, вызываемый для каждого полностью созданного пользователя
+                           сразу после его создания (например, для записи чекпоинта)
 
         Returns:
             SeedsResult: Результат с данными всех созданных пользователей
         """
-        return SeedsResult(users=[self.build_user(plan.users) for _ in range(plan.users.count)])
+        completed = completed or []
+        remaining = max(plan.users.count - len(completed), 0)
+        failure_budget = int(remaining * self.max_failed_users_ratio)
+        failed_users = 0
+        tasks = self.get_account_tasks()
+
+        def build_user(users_plan: SeedUsersPlan) -> SeedUserResult | None:
+            nonlocal failed_users
+            try:
+                user = self.execute_user(users_plan, tasks)
+            except Exception as error:
+                failed_users += 1
+                self.metrics.record_failed_user()
+                if failed_users > failure_budget:
+                    raise SeedsFailureBudgetExceededError(
+                        f"Failed to seed {failed_users} users, failure budget is {failure_budget}"
+                    ) from error
+
+                logger.warning(f"Failed to seed user, skipping it ({failed_users}/{failure_budget}): {error!r}")
+                return None
+
+            if on_user_built:
+                on_user_built(user)
+
+            return user
+
+        if not self.concurrent:
+            users = [build_user(plan.users) for _ in range(remaining)]
+        else:
+            pool = Pool(size=self.workers)
+            errors: list[SeedsFailureBudgetExceededError] = []
+
+            def build_user_or_abort(users_plan: SeedUsersPlan) -> SeedUserResult | None:
+                try:
+                    return build_user(users_plan)
+                except SeedsFailureBudgetExceededError as error:
+                    # После превышения бюджета ошибок остальные пользователи не должны создаваться дальше
+                    errors.append(error)
+                    gevent.spawn(pool.kill)
+                    return None
+
+            greenlets = []
+            try:
+                for _ in range(remaining):
+                    if errors:
+                        break
+                    # spawn ждёт, пока в пуле освободится место
+                    greenlets.append(pool.spawn(build_user_or_abort, plan.users))
+
+                pool.join()
+            finally:
+                pool.kill()
+
+            if errors:
+                raise errors[0]
+
+            users = [greenlet.value for greenlet in greenlets]
+
+        return SeedsResult(users=[*completed, *(user for user in users if user is not None)])
 
 
 def build_grpc_seeds_builder() -> SeedsBulider:
@@ -260,6 +488,13 @@ def build_grpc_seeds_builder() -> SeedsBulider:
         cards_gateway_client=build_cards_gateway_grpc_client(),
         accounts_gateway_client=build_accounts_gateway_grpc_client(),
         operations_gateway_client=build_operations_gateway_grpc_client(),
+        workers=settings.seeds.workers,
+        concurrency=settings.seeds.concurrency,
+        retry_attempts=settings.seeds.retry_attempts,
+        retry_backoff=settings.seeds.retry_backoff,
+        retry_backoff_max=settings.seeds.retry_backoff_max,
+        max_failed_users_ratio=settings.seeds.max_failed_users_ratio,
+        pipeline_depth=settings.seeds.pipeline_depth
     )
 
 
@@ -275,4 +510,11 @@ def build_http_seeds_builder() -> SeedsBulider:
         cards_gateway_client=build_cards_gateway_http_client(),
         accounts_gateway_client=build_accounts_gateway_http_client(),
         operations_gateway_client=build_operations_gateway_http_client(),
+        workers=settings.seeds.workers,
+        concurrency=settings.seeds.concurrency,
+        retry_attempts=settings.seeds.retry_attempts,
+        retry_backoff=settings.seeds.retry_backoff,
+        retry_backoff_max=settings.seeds.retry_backoff_max,
+        max_failed_users_ratio=settings.seeds.max_failed_users_ratio,
+        pipeline_depth=settings.seeds.pipeline_depth
     )
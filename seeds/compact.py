@@ -0,0 +1,353 @@
+import json
+import random
+import struct
+import sys
+import uuid
+from array import array
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Sequence
+
+from seeds.dispenser import SeedsDispenser, ExhaustionPolicy
+from seeds.schema.result import SeedsResult, SeedUserResult
+from seeds.tasks import USER_ACCOUNT_KINDS, ACCOUNT_CHILD_KINDS
+
+ID_SIZE = 16
+
+# Бинарный формат дампа: сигнатура, длины пяти секций в байтах (uint64 little-endian),
+# затем сами секции, каждая выровнена по 8 байт. Таблицы смещений тоже хранятся как uint64 little-endian:
+# на little-endian машинах они отображаются из mmap без копирования, на big-endian — копируются с byteswap
+BINARY_MAGIC = b"SEEDSB01"
+BINARY_SECTIONS = ("user_ids", "account_ids", "child_ids", "user_account_offsets", "account_child_offsets")
+BINARY_HEADER = struct.Struct(f"<8s{len(BINARY_SECTIONS)}Q")
+BINARY_ALIGNMENT = 8
+
+
+def pack_id(value: str) -> bytes:
+    """
+    Упаковывает UUID-идентификатор в 16 байт. Компактное хранилище поддерживает только UUID.
+    """
+    packed = bytes.fromhex(value.replace("-", ""))
+    if len(packed) != ID_SIZE:
+        raise ValueError(f"Compact seeds storage supports only UUID identifiers, got: {value!r}")
+
+    return packed
+
+
+def unpack_id(ids: bytearray | memoryview, index: int) -> str:
+    return str(uuid.UUID(bytes=bytes(ids[index * ID_SIZE:(index + 1) * ID_SIZE])))
+
+
+class CompactSeedChild:
+    """
+    Представление карты или операции из колоночного хранилища (card_id / operation_id).
+    """
+    __slots__ = ("store", "index", "id_field")
+
+    def __init__(self, store: "CompactSeedsResult", index: int, id_field: str):
+        self.store = store
+        self.index = index
+        self.id_field = id_field
+
+    def __getattr__(self, name: str) -> str:
+        if name != self.id_field:
+            raise AttributeError(name)
+
+        return unpack_id(self.store.child_ids, self.index)
+
+    def __repr__(self) -> str:
+        return f"{self.id_field}={getattr(self, self.id_field)!r}"
+
+
+class CompactSeedAccount:
+    """
+    Представление счёта из колоночного хранилища с тем же API, что и SeedAccountResult.
+    """
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: "CompactSeedsResult", index: int):
+        self.store = store
+        self.index = index
+
+    @property
+    def account_id(self) -> str:
+        return unpack_id(self.store.account_ids, self.index)
+
+    def __getattr__(self, name: str) -> "CompactSeedsView":
+        for kind, (child_kind, id_field) in enumerate(ACCOUNT_CHILD_KINDS):
+            if child_kind == name:
+                offset = self.index * len(ACCOUNT_CHILD_KINDS) + kind
+                return CompactSeedsView(
+                    start=self.store.account_child_offsets[offset],
+                    stop=self.store.account_child_offsets[offset + 1],
+                    factory=lambda index: CompactSeedChild(self.store, index, id_field)
+                )
+
+        raise AttributeError(name)
+
+    def __repr__(self) -> str:
+        return f"CompactSeedAccount(account_id={self.account_id!r})"
+
+
+class CompactSeedUser:
+    """
+    Представление пользователя из колоночного хранилища с тем же API, что и SeedUserResult
+    (например, `seed_user.credit_card_accounts[0].account_id`).
+    """
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: "CompactSeedsResult", index: int):
+        self.store = store
+        self.index = index
+
+    @property
+    def user_id(self) -> str:
+        return unpack_id(self.store.user_ids, self.index)
+
+    def __getattr__(self, name: str) -> "CompactSeedsView":
+        if name not in USER_ACCOUNT_KINDS:
+            raise AttributeError(name)
+
+        offset = self.index * len(USER_ACCOUNT_KINDS) + USER_ACCOUNT_KINDS.index(name)
+        return CompactSeedsView(
+            start=self.store.user_account_offsets[offset],
+            stop=self.store.user_account_offsets[offset + 1],
+            factory=lambda index: CompactSeedAccount(self.store, index)
+        )
+
+    def __repr__(self) -> str:
+        return f"CompactSeedUser(user_id={self.user_id!r})"
+
+
+class CompactSeedsView(Sequence):
+    """
+    Ленивый список элементов хранилища в диапазоне [start, stop): объекты создаются при обращении.
+    """
+
+    def __init__(self, start: int, stop: int, factory: Callable[[int], Any]):
+        self.start = start
+        self.stop = stop
+        self.factory = factory
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("seeds view index out of range")
+
+        return self.factory(self.start + index)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self.factory(index) for index in range(self.start, self.stop))
+
+
+class CompactSeedsResult:
+    """
+    Компактное колоночное хранилище результата сидинга для очень больших пулов пользователей.
+
+    Вместо дерева pydantic-моделей хранятся три таблицы идентификаторов (UUID по 16 байт подряд
+    в bytearray) и таблицы смещений (array) для связей:
+    - user_account_offsets: счета пользователя u вида k лежат в [off[u * 4 + k], off[u * 4 + k + 1]);
+    - account_child_offsets: карты/операции счёта a вида k лежат в [off[a * 6 + k], off[a * 6 + k + 1]).
+
+    Доступ к данным — через ленивые представления с тем же API атрибутов, что и у SeedsResult.
+    Таблицы могут быть как собственными буферами, так и memoryview поверх mmap бинарного дампа
+    (см. from_buffer): тогда данные не копируются в память процесса и разделяются через page cache.
+    """
+
+    def __init__(self):
+        self.user_ids: bytearray | memoryview = bytearray()
+        self.account_ids: bytearray | memoryview = bytearray()
+        self.child_ids: bytearray | memoryview = bytearray()
+        self.user_account_offsets: array | memoryview = array("Q", [0])
+        self.account_child_offsets: array | memoryview = array("Q", [0])
+        self.buffer: Any = None
+        self._dispenser: SeedsDispenser[int] | None = None
+
+    def __len__(self) -> int:
+        return len(self.user_ids) // ID_SIZE
+
+    @property
+    def users(self) -> CompactSeedsView:
+        return CompactSeedsView(start=0, stop=len(self), factory=self.user)
+
+    def user(self, index: int) -> CompactSeedUser:
+        return CompactSeedUser(self, index)
+
+    def append_user(self, user: dict) -> int:
+        """
+        Добавляет пользователя (словарь в формате SeedUserResult) в хранилище.
+
+        :param user: Пользователь со счетами, картами и операциями.
+        :return: Индекс пользователя в хранилище.
+        """
+        self.ensure_writable()
+
+        index = len(self)
+        self.user_ids += pack_id(user["user_id"])
+
+        for kind in USER_ACCOUNT_KINDS:
+            for account in user.get(kind, []):
+                self.account_ids += pack_id(account["account_id"])
+
+                for child_kind, id_field in ACCOUNT_CHILD_KINDS:
+                    for child in account.get(child_kind, []):
+                        self.child_ids += pack_id(child[id_field])
+
+                    self.account_child_offsets.append(len(self.child_ids) // ID_SIZE)
+
+            self.user_account_offsets.append(len(self.account_ids) // ID_SIZE)
+
+        return index
+
+    def ensure_writable(self) -> None:
+        """
+        Копирует таблицы из read-only буфера (mmap) в собственную память перед изменением хранилища.
+        """
+        if self.buffer is None:
+            return
+
+        self.user_ids = bytearray(self.user_ids)
+        self.account_ids = bytearray(self.account_ids)
+        self.child_ids = bytearray(self.child_ids)
+        self.user_account_offsets = array("Q", self.user_account_offsets)
+        self.account_child_offsets = array("Q", self.account_child_offsets)
+        self.buffer = None
+
+    def write(self, file: BinaryIO) -> None:
+        """
+        Записывает хранилище в бинарном формате: заголовок с длинами секций и сами секции
+        (идентификаторы фиксированной ширины и таблицы смещений).
+
+        :param file: Файл, открытый на запись в бинарном режиме.
+        """
+        sections = []
+        for name in BINARY_SECTIONS:
+            section = getattr(self, name)
+            if name.endswith("offsets") and sys.byteorder == "big":
+                section = array("Q", section)
+                section.byteswap()
+
+            sections.append(memoryview(section).cast("B"))
+
+        file.write(BINARY_HEADER.pack(BINARY_MAGIC, *(len(section) for section in sections)))
+
+        for section in sections:
+            file.write(section)
+            file.write(b"\0" * (-len(section) % BINARY_ALIGNMENT))
+
+    @classmethod
+    def from_buffer(cls, buffer: Any) -> "CompactSeedsResult":
+        """
+        Открывает хранилище поверх буфера с бинарным дампом (например, mmap) без копирования данных.
+
+        :param buffer: Объект с buffer protocol, содержащий дамп в формате write().
+        :return: Хранилище, таблицы которого — memoryview поверх buffer
+            (на big-endian машинах таблицы смещений — копии с byteswap).
+        """
+        view = memoryview(buffer)
+        magic, *sizes = BINARY_HEADER.unpack_from(view)
+        if magic != BINARY_MAGIC:
+            raise ValueError("Unsupported seeds binary dump format")
+
+        store = cls()
+        offset = BINARY_HEADER.size
+        for name, size in zip(BINARY_SECTIONS, sizes):
+            section = view[offset:offset + size]
+            if name.endswith("offsets"):
+                section = section.cast("Q")
+                if sys.byteorder == "big":
+                    section = array("Q", section)
+                    section.byteswap()
+
+            setattr(store, name, section)
+            offset += size + (-size % BINARY_ALIGNMENT)
+
+        store.buffer = buffer
+        return store
+
+    def dump_user(self, index: int) -> dict:
+        """
+        Возвращает пользователя в виде словаря в формате SeedUserResult.
+        """
+        user = self.user(index)
+        return {
+            "user_id": user.user_id,
+            **{
+                kind: [
+                    {
+                        "account_id": account.account_id,
+                        **{
+                            child_kind: [{id_field: getattr(child, id_field)} for child in getattr(account, child_kind)]
+                            for child_kind, id_field in ACCOUNT_CHILD_KINDS
+                        }
+                    }
+                    for account in getattr(user, kind)
+                ]
+                for kind in USER_ACCOUNT_KINDS
+            }
+        }
+
+    @classmethod
+    def from_users(cls, users: Iterable[dict]) -> "CompactSeedsResult":
+        store = cls()
+        for user in users:
+            store.append_user(user)
+
+        return store
+
+    @classmethod
+    def from_json(cls, content: str | bytes) -> "CompactSeedsResult":
+        """
+        Собирает хранилище из JSON-дампа SeedsResult без построения pydantic-моделей.
+        """
+        return cls.from_users(json.loads(content).get("users", []))
+
+    @classmethod
+    def from_result(cls, result: SeedsResult) -> "CompactSeedsResult":
+        return cls.from_users(user.model_dump() for user in result.users)
+
+    def to_result(self) -> SeedsResult:
+        return SeedsResult(users=[SeedUserResult.model_validate(self.dump_user(index)) for index in range(len(self))])
+
+    @property
+    def dispenser(self) -> SeedsDispenser[int]:
+        if self._dispenser is None:
+            self._dispenser = SeedsDispenser(range(len(self)))
+
+        return self._dispenser
+
+    def attach_dispenser(
+            self,
+            policy: ExhaustionPolicy,
+            reseed: Callable[[], list[SeedUserResult]] | None = None
+    ) -> None:
+        """
+        Настраивает раздатчик пользователей. Пользователи, досозданные через reseed,
+        дописываются в хранилище.
+        """
+        def reseed_indexes() -> range:
+            start = len(self)
+            for user in reseed():
+                self.append_user(user.model_dump())
+
+            return range(start, len(self))
+
+        self._dispenser = SeedsDispenser(
+            range(len(self)),
+            policy=policy,
+            reseed=reseed_indexes if reseed else None
+        )
+
+    def get_next_user(self) -> CompactSeedUser:
+        return self.user(self.dispenser.lease())
+
+    def release_user(self, user: CompactSeedUser) -> None:
+        self.dispenser.release(user.index)
+
+    def get_random_user(self) -> CompactSeedUser:
+        return self.user(random.randrange(len(self)))
@@ -0,0 +1,190 @@
+import threading
+from collections import deque
+from typing import Callable, Generic, Literal, Sequence, TypeVar
+
+from pydantic import BaseModel
+
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_DISPENSER")
+
+T = TypeVar("T")
+
+ExhaustionPolicy = Literal["wrap", "fail", "reseed"]
+
+
+class SeedsExhaustedError(Exception):
+    """
+    Пул сидинговых пользователей исчерпан, а политика исчерпания — fail.
+    """
+
+
+class SeedsDispenserStats(BaseModel):
+    """
+    Статистика использования пула сидинговых пользователей.
+
+    Attributes:
+        total (int): Всего пользователей в пуле (включая досозданных).
+        available (int): Свободных пользователей, ещё не выданных в аренду.
+        leased (int): Пользователей, выданных в аренду и не возвращённых.
+        peak_leased (int): Максимальное число одновременно арендованных пользователей.
+        leases (int): Всего выдач.
+        releases (int): Всего возвратов.
+        wrapped_leases (int): Выдач уже арендованных пользователей по кругу (политика wrap).
+        reseeds (int): Сколько раз пул досоздавался (политика reseed).
+    """
+    total: int = 0
+    available: int = 0
+    leased: int = 0
+    peak_leased: int = 0
+    leases: int = 0
+    releases: int = 0
+    wrapped_leases: int = 0
+    reseeds: int = 0
+
+
+class SeedsDispenser(Generic[T]):
+    """
+    Раздатчик сидинговых пользователей виртуальным пользователям Locust.
+
+    Пул (items) — последовательность пользователей: список моделей или range индексов компактного хранилища.
+    Ещё не выданные пользователи берутся из пула по курсору, возвращённые — из deque, поэтому выдача
+    и возврат выполняются за O(1), а на непрочитанную часть пула память не расходуется.
+    Выдача защищена блокировкой (под gevent — гринлет-безопасной), в том числе на время досоздания пула.
+
+    Когда свободных пользователей не осталось, поведение определяется политикой:
+    - wrap: пользователи выдаются повторно по кругу (курсор по всему пулу);
+    - fail: выбрасывается SeedsExhaustedError;
+    - reseed: через колбэк reseed досоздаётся новая партия пользователей.
+    """
+
+    def __init__(
+            self,
+            items: Sequence[T],
+            policy: ExhaustionPolicy = "fail",
+            reseed: Callable[[], Sequence[T]] | None = None
+    ):
+        """
+        :param items: Пользователи, доступные для выдачи. range хранится как есть, без списка индексов.
+        :param policy: Политика исчерпания пула.
+        :param reseed: Функция, создающая новую партию пользователей (обязательна для политики reseed).
+        """
+        if policy == "reseed" and reseed is None:
+            raise ValueError("Reseed exhaustion policy requires a reseed callback")
+
+        self.items: Sequence[T] = items if isinstance(items, range) else list(items)
+        self.policy = policy
+        self.reseed = reseed
+        # Пользователи items[fresh:] ещё ни разу не выдавались
+        self.fresh = 0
+        self.released: deque[T] = deque()
+        self.cursor = 0
+        self.lock = threading.Lock()
+        self.leased = 0
+        self.peak_leased = 0
+        self.leases = 0
+        self.releases = 0
+        self.wrapped_leases = 0
+        self.reseeds = 0
+
+    @property
+    def available(self) -> int:
+        """
+        Количество свободных пользователей: ещё не выданных и возвращённых.
+        """
+        return len(self.items) - self.fresh + len(self.released)
+
+    @property
+    def stats(self) -> SeedsDispenserStats:
+        """
+        Текущая статистика использования пула.
+        """
+        return SeedsDispenserStats(
+            total=len(self.items),
+            available=self.available,
+            leased=self.leased,
+            peak_leased=self.peak_leased,
+            leases=self.leases,
+            releases=self.releases,
+            wrapped_leases=self.wrapped_leases,
+            reseeds=self.reseeds
+        )
+
+    def lease(self) -> T:
+        """
+        Выдаёт свободного пользователя: сначала ещё не выданных, затем возвращённых.
+
+        :return: Пользователь из пула.
+        :raises SeedsExhaustedError: Если пул исчерпан при политике fail (или reseed не дал новых пользователей).
+        """
+        with self.lock:
+            if not self.available:
+                self.on_exhausted()
+
+            if self.fresh < len(self.items):
+                item = self.items[self.fresh]
+                self.fresh += 1
+            elif self.released:
+                item = self.released.popleft()
+            else:
+                item = self.items[self.cursor % len(self.items)]
+                self.cursor += 1
+                self.wrapped_leases += 1
+
+            self.leases += 1
+            self.leased += 1
+            self.peak_leased = max(self.peak_leased, self.leased)
+            return item
+
+    def release(self, item: T) -> None:
+        """
+        Возвращает пользователя в пул, после чего его можно выдать снова.
+
+        :param item: Ранее выданный пользователь.
+        """
+        with self.lock:
+            self.released.append(item)
+            self.releases += 1
+            self.leased = max(self.leased - 1, 0)
+
+    def extend(self, items: Sequence[T]) -> None:
+        """
+        Добавляет в пул новых свободных пользователей (например, догруженных из дампа).
+
+        :param items: Новые пользователи. range, продолжающий range пула, расширяет его без списка индексов.
+        """
+        with self.lock:
+            self.add(items)
+
+    def add(self, items: Sequence[T]) -> None:
+        """
+        Дописывает пользователей в конец пула. Вызывается под блокировкой.
+        """
+        if isinstance(self.items, range) and isinstance(items, range) \
+                and self.items.step == items.step == 1 and items.start == self.items.stop:
+            self.items = range(self.items.start, items.stop)
+            return
+
+        if isinstance(self.items, range):
+            self.items = list(self.items)
+
+        self.items.extend(items)
+
+    def on_exhausted(self) -> None:
+        """
+        Применяет политику исчерпания пула. Вызывается под блокировкой.
+        """
+        if self.policy == "reseed":
+            logger.info(f"Seeded users pool is exhausted ({len(self.items)} users), reseeding.")
+            self.add(self.reseed())
+            self.reseeds += 1
+
+        if self.available:
+            return
+
+        if self.policy == "wrap" and self.items:
+            if self.wrapped_leases == 0:
+                logger.warning(f"Seeded users pool is exhausted ({len(self.items)} users), reusing leased users.")
+            return
+
+        raise SeedsExhaustedError(f"Seeded users pool is exhausted: {len(self.items)} users leased")
@@ -0,0 +1,171 @@
+from gevent.event import Event
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+from config import settings
+from seeds.compact import CompactSeedsResult
+from seeds.scenario import SeedsScenario
+from seeds.schema.result import SeedsResult
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_DISTRIBUTED")
+
+# Тип сообщения Locust, в котором мастер передаёт воркеру его часть сидинговых данных
+SEEDS_SHARD_MESSAGE = "seeds_shard"
+# Тип сообщения, которым воркер запрашивает свою часть (нужно воркерам, подключившимся после старта теста)
+SEEDS_SHARD_REQUEST_MESSAGE = "seeds_shard_request"
+# Сколько секунд пользователи воркера ждут его часть сидинговых данных
+SEEDS_SHARD_TIMEOUT = 30.0
+
+
+class SeedsShardError(Exception):
+    """
+    Воркер не получил свою часть сидинговых данных от мастера.
+    """
+
+
+class PendingSeedsShard:
+    """
+    Заглушка `environment.seeds` на воркере, пока от мастера не пришла его часть сидинговых данных.
+
+    Воркеру, подключившемуся после старта теста, мастер может отправить spawn раньше, чем придёт часть:
+    обращения пользователей к заглушке ждут её (не дольше SEEDS_SHARD_TIMEOUT) и передаются полученному результату.
+    """
+
+    def __init__(self, environment: Environment):
+        self.environment = environment
+        self.received = Event()
+        self.error: str | None = None
+
+    def __getattr__(self, name: str):
+        if not self.received.wait(SEEDS_SHARD_TIMEOUT):
+            raise SeedsShardError(f"No seeds shard received from master in {SEEDS_SHARD_TIMEOUT}s")
+
+        if self.error is not None:
+            raise SeedsShardError(self.error)
+
+        return getattr(self.environment.seeds, name)
+
+
+def dump_seeds_shard(result: SeedsResult | CompactSeedsResult, index: int, shards: int) -> dict:
+    """
+    Возвращает одну из непересекающихся частей результата сидинга (пользователи делятся по кругу)
+    в виде словаря для передачи воркеру.
+
+    :param result: Полный результат сидинга.
+    :param index: Номер части.
+    :param shards: Количество частей.
+    :return: Словарь в формате SeedsResult; каждый пользователь попадает ровно в одну часть.
+    """
+    if isinstance(result, CompactSeedsResult):
+        return {"users": [result.dump_user(user) for user in range(index, len(result), shards)]}
+
+    return {"users": [user.model_dump(mode="json") for user in result.users[index::shards]]}
+
+
+def load_seeds_shard(data: dict) -> SeedsResult | CompactSeedsResult:
+    """
+    Восстанавливает часть результата сидинга, полученную от мастера, в формате SEEDS.STORAGE.
+    """
+    if settings.seeds.storage == "compact":
+        return CompactSeedsResult.from_users(data["users"])
+
+    return SeedsResult.model_validate(data)
+
+
+def init_seeds(environment: Environment, seeds_scenario: SeedsScenario) -> None:
+    """
+    Подготавливает сидинговые данные для сценария и кладёт их в `environment.seeds`.
+
+    - Локальный запуск: сидинг выполняется в процессе, как и раньше.
+    - Мастер: сидинг выполняется один раз на мастере. При старте теста пользователи делятся
+      на непересекающиеся части по числу подключённых воркеров, и каждая часть отправляется
+      своему воркеру сообщением SEEDS_SHARD_MESSAGE (до сообщений spawn, поэтому к моменту
+      создания виртуальных пользователей данные на воркере уже есть). Ещё SEEDS.SPARE_SHARDS частей
+      откладываются для воркеров, подключившихся после старта: такой воркер запрашивает часть при
+      подключении и получает отложенную; если их не осталось, мастер пишет ошибку в лог и сообщает её воркеру.
+    - Воркер: сидинг не выполняется, данные приходят от мастера; до их прихода `environment.seeds` —
+      PendingSeedsShard, обращения к которому ждут данных.
+
+    :param environment: Окружение Locust.
+    :param seeds_scenario: Сценарий сидинга.
+    """
+    runner = environment.runner
+
+    if isinstance(runner, WorkerRunner):
+        pending = environment.seeds = PendingSeedsShard(environment)
+
+        def on_seeds_shard(environment: Environment, msg, **kwargs):
+            if "error" in msg.data:
+                pending.error = msg.data["error"]
+                logger.error(f"[{seeds_scenario.scenario}] {pending.error}")
+            else:
+                result = load_seeds_shard(msg.data)
+                result.attach_dispenser(policy=settings.seeds.exhaustion_policy, reseed=seeds_scenario.reseed)
+                environment.seeds = result
+                logger.info(f"[{seeds_scenario.scenario}] Received seeds shard: {len(result.users)} users.")
+
+            pending.received.set()
+
+        runner.register_message(SEEDS_SHARD_MESSAGE, on_seeds_shard)
+        # Воркеры, подключённые к старту теста, получат часть и без запроса, а опоздавшим мастер
+        # не может отправить её сам: сообщение пришло бы раньше, чем зарегистрирован обработчик
+        runner.send_message(SEEDS_SHARD_REQUEST_MESSAGE)
+        return
+
+    seeds_scenario.build()
+    # Мастер делит пользователей на части при старте теста, поэтому загружает дамп целиком:
+    # пользователи, догруженные в фоне после раздачи частей, не попали бы ни одному воркеру
+    environment.seeds = seeds_scenario.load(background=not isinstance(runner, MasterRunner))
+
+    if isinstance(runner, MasterRunner):
+        # Части, отложенные для воркеров, которые подключатся после старта теста, и воркеры, уже получившие часть
+        state: dict[str, list[dict] | set[str] | None] = {"spare": None, "assigned": set()}
+
+        def on_test_start(environment: Environment, **kwargs):
+            workers = sorted(
+                runner.clients.ready + runner.clients.running + runner.clients.spawning,
+                key=lambda worker: runner.get_worker_index(worker.id)
+            )
+            if not workers:
+                return
+
+            shards = len(workers) + settings.seeds.spare_shards
+            for index, worker in enumerate(workers):
+                shard = dump_seeds_shard(environment.seeds, index, shards)
+                runner.send_message(SEEDS_SHARD_MESSAGE, shard, client_id=worker.id)
+
+            state["assigned"] = {worker.id for worker in workers}
+            state["spare"] = [
+                dump_seeds_shard(environment.seeds, index, shards) for index in range(len(workers), shards)
+            ]
+
+            logger.info(
+                f"[{seeds_scenario.scenario}] Sent {len(environment.seeds.users)} seeded users "
+                f"to {len(workers)} workers ({settings.seeds.spare_shards} spare shards kept for late workers)."
+            )
+
+        def on_seeds_shard_request(environment: Environment, msg, **kwargs):
+            # До старта теста части раздаются всем подключённым воркерам в on_test_start.
+            if state["spare"] is None or msg.node_id in state["assigned"]:
+                return
+
+            state["assigned"].add(msg.node_id)
+            if not state["spare"]:
+                error = (
+                    f"Worker {msg.node_id} joined after the test started and no spare seeds shards are left "
+                    f"(SEEDS.SPARE_SHARDS={settings.seeds.spare_shards}); restart the test to reshard."
+                )
+                logger.error(f"[{seeds_scenario.scenario}] {error}")
+                runner.send_message(SEEDS_SHARD_MESSAGE, {"error": error}, client_id=msg.node_id)
+                return
+
+            shard = state["spare"].pop(0)
+            runner.send_message(SEEDS_SHARD_MESSAGE, shard, client_id=msg.node_id)
+            logger.info(
+                f"[{seeds_scenario.scenario}] Sent a spare seeds shard ({len(shard['users'])} users) "
+                f"to late worker {msg.node_id}, {len(state['spare'])} spare shards left."
+            )
+
+        environment.events.test_start.add_listener(on_test_start)
+        runner.register_message(SEEDS_SHARD_REQUEST_MESSAGE, on_seeds_shard_request)
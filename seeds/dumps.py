@@ -1,6 +1,13 @@
+import gzip
+import mmap
+import shutil
+from itertools import islice
 from pathlib import Path
+from typing import IO, Iterable, Iterator
 
-from seeds.schema.result import SeedsResult
+from seeds.compact import CompactSeedsResult
+from seeds.schema.metadata import SeedsMetadata
+from seeds.schema.result import SeedsResult, SeedUserResult
 import os
 from tools.logger import get_logger
 
@@ -16,6 +23,49 @@ def get_seeds_file_path(scenario: str) -> Path:
     """
     return Path(f"./dumps/{scenario}_seeds.json")
 
+
+def get_seeds_binary_file_path(scenario: str) -> Path:
+    """
+    Возвращает путь к бинарному дампу сидинга для указанного сценария.
+
+    :param scenario: Название сценария нагрузки
+    :return: Полный путь к файлу
+    """
+    return Path(f"./dumps/{scenario}_seeds.bin")
+
+
+def get_seeds_jsonl_file_path(scenario: str, compress: bool = False) -> Path:
+    """
+    Возвращает путь к построчному (JSONL) дампу сидинга для указанного сценария.
+
+    :param scenario: Название сценария нагрузки
+    :param compress: Дамп сжат gzip
+    :return: Полный путь к файлу
+    """
+    return Path(f"./dumps/{scenario}_seeds.jsonl{'.gz' if compress else ''}")
+
+
+def get_seeds_metadata_file_path(scenario: str) -> Path:
+    """
+    Возвращает путь к файлу с метаданными дампа сидинга для указанного сценария.
+
+    :param scenario: Название сценария нагрузки
+    :return: Полный путь к файлу
+    """
+    return Path(f"./dumps/{scenario}_seeds.meta.json")
+
+
+def get_seeds_checkpoint_file_path(scenario: str, fingerprint: str) -> Path:
+    """
+    Возвращает путь к файлу чекпоинта сидинга. Отпечаток плана входит в имя файла,
+    чтобы чекпоинт другого плана никогда не использовался для продолжения.
+
+    :param scenario: Название сценария нагрузки
+    :param fingerprint: Отпечаток плана сидинга
+    :return: Полный путь к файлу
+    """
+    return Path(f"./dumps/{scenario}_seeds.{fingerprint[:16]}.checkpoint.jsonl")
+
 def save_seeds_results(result: SeedsResult, scenario: str):
     """
     Сохраняет результат сидинга (SeedsResult) в JSON-файл.
@@ -48,3 +98,245 @@ def load_seeds_results(scenario: str) -> SeedsResult:
     with open(f"./dumps/{scenario}_seeds.json", "r", encoding="utf-8") as file:
         return SeedsResult.model_validate_json(file.read())
 
+
+def load_compact_seeds_results(scenario: str) -> CompactSeedsResult:
+    """
+    Загружает результат сидинга из JSON-файла сразу в компактное колоночное хранилище,
+    минуя построение дерева pydantic-моделей.
+
+    :param scenario: Название сценария нагрузки, данные которого нужно загрузить.
+    :return: Объект CompactSeedsResult, восстановленный из файла.
+    """
+    seeds_file = get_seeds_file_path(scenario)
+
+    logger.debug(f"Compact seeding result loaded from file: {seeds_file}")
+
+    with open(seeds_file, "rb") as file:
+        return CompactSeedsResult.from_json(file.read())
+
+
+def save_binary_seeds_results(result: SeedsResult | CompactSeedsResult, scenario: str):
+    """
+    Сохраняет результат сидинга в бинарном формате (идентификаторы фиксированной ширины и индексы связей).
+    Файл сначала пишется во временный и затем атомарно заменяет старый,
+    чтобы процессы, которые уже отобразили старый дамп в память, его дочитали.
+
+    :param result: Результат сидинга, сгенерированный билдером.
+    :param scenario: Название сценария нагрузки, для которого создаются данные.
+    """
+    seeds_file = get_seeds_binary_file_path(scenario)
+    temp_file = seeds_file.with_suffix(".bin.tmp")
+
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    if isinstance(result, SeedsResult):
+        result = CompactSeedsResult.from_result(result)
+
+    with open(temp_file, "wb") as file:
+        result.write(file)
+
+    os.replace(temp_file, seeds_file)
+    logger.debug(f"Binary seeding result saved to file: {seeds_file}")
+
+
+def load_binary_seeds_results(scenario: str) -> CompactSeedsResult:
+    """
+    Открывает бинарный дамп сидинга через mmap (только чтение).
+    Данные не копируются в память процесса: страницы файла разделяются всеми процессами
+    через page cache, а пользователи декодируются лениво при обращении.
+
+    :param scenario: Название сценария нагрузки, данные которого нужно загрузить.
+    :return: Объект CompactSeedsResult поверх отображённого в память файла.
+    """
+    seeds_file = get_seeds_binary_file_path(scenario)
+
+    with open(seeds_file, "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    logger.debug(f"Binary seeding result mapped from file: {seeds_file}")
+    return CompactSeedsResult.from_buffer(buffer)
+
+
+def open_seeds_jsonl(path: Path, mode: str) -> IO[str]:
+    """
+    Открывает JSONL-дамп в текстовом режиме, прозрачно (раз)сжимая gzip по расширению .gz.
+    """
+    if path.suffix == ".gz":
+        return gzip.open(path, f"{mode}t", encoding="utf-8")
+
+    return open(path, mode, encoding="utf-8")
+
+
+def save_jsonl_seeds_results(users: Iterable[SeedUserResult], scenario: str, compress: bool = False):
+    """
+    Сохраняет пользователей в JSONL-дамп: по одному SeedUserResult на строку.
+
+    :param users: Пользователи (можно передать генератор — запись идёт потоково).
+    :param scenario: Название сценария нагрузки.
+    :param compress: Сжимать дамп gzip.
+    """
+    seeds_file = get_seeds_jsonl_file_path(scenario, compress)
+
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    with open_seeds_jsonl(seeds_file, "w") as file:
+        for user in users:
+            file.write(user.model_dump_json() + "\n")
+
+    logger.debug(f"JSONL seeding result saved to file: {seeds_file}")
+
+
+def promote_seeds_checkpoint(scenario: str, fingerprint: str, compress: bool = False):
+    """
+    Превращает чекпоинт сидинга в JSONL-дамп. Чекпоинт пишется построчно по мере создания
+    пользователей, поэтому после завершения сидинга он уже содержит готовый дамп.
+
+    :param scenario: Название сценария нагрузки.
+    :param fingerprint: Отпечаток плана сидинга.
+    :param compress: Сжать дамп gzip.
+    """
+    checkpoint_file = get_seeds_checkpoint_file_path(scenario, fingerprint)
+    seeds_file = get_seeds_jsonl_file_path(scenario, compress)
+
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    checkpoint_file.touch()
+    if compress:
+        with open(checkpoint_file, "rb") as source, gzip.open(seeds_file, "wb") as target:
+            shutil.copyfileobj(source, target)
+        checkpoint_file.unlink()
+    else:
+        os.replace(checkpoint_file, seeds_file)
+
+    logger.debug(f"Seeding checkpoint promoted to JSONL dump: {seeds_file}")
+
+
+def iter_jsonl_seeds_lines(
+        scenario: str,
+        compress: bool = False,
+        start: int = 0,
+        stop: int | None = None
+) -> Iterator[str]:
+    """
+    Построчно читает JSONL-дамп. Диапазон строк [start, stop) позволяет нескольким
+    сценариям читать непересекающиеся части одного файла.
+
+    :param scenario: Название сценария нагрузки.
+    :param compress: Дамп сжат gzip.
+    :param start: Первая строка диапазона.
+    :param stop: Строка, на которой чтение останавливается (не включительно); None — до конца файла.
+    :return: Генератор строк JSON, по одной на пользователя.
+    """
+    seeds_file = get_seeds_jsonl_file_path(scenario, compress)
+
+    logger.debug(f"JSONL seeding result streamed from file: {seeds_file}")
+
+    with open_seeds_jsonl(seeds_file, "r") as file:
+        yield from islice(file, start, stop)
+
+
+def iter_jsonl_seeds_results(
+        scenario: str,
+        compress: bool = False,
+        start: int = 0,
+        stop: int | None = None
+) -> Iterator[SeedUserResult]:
+    """
+    Генератор пользователей из JSONL-дампа (см. iter_jsonl_seeds_lines).
+    """
+    for line in iter_jsonl_seeds_lines(scenario, compress, start, stop):
+        yield SeedUserResult.model_validate_json(line)
+
+
+def save_seeds_metadata(metadata: SeedsMetadata, scenario: str):
+    """
+    Сохраняет метаданные дампа сидинга (отпечаток плана и время создания).
+
+    :param metadata: Метаданные дампа.
+    :param scenario: Название сценария нагрузки.
+    """
+    metadata_file = get_seeds_metadata_file_path(scenario)
+
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    with open(metadata_file, "w+", encoding="utf-8") as file:
+        file.write(metadata.model_dump_json())
+
+    logger.debug(f"Seeding metadata saved to file: {metadata_file}")
+
+
+def load_seeds_metadata(scenario: str) -> SeedsMetadata | None:
+    """
+    Загружает метаданные дампа сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Метаданные дампа или None, если дамп ещё ни разу не сохранялся с метаданными.
+    """
+    metadata_file = get_seeds_metadata_file_path(scenario)
+
+    if not metadata_file.exists():
+        return None
+
+    with open(metadata_file, "r", encoding="utf-8") as file:
+        return SeedsMetadata.model_validate_json(file.read())
+
+
+def append_seeds_checkpoint(user: SeedUserResult, scenario: str, fingerprint: str):
+    """
+    Дописывает полностью созданного пользователя в чекпоинт (одна строка JSON на пользователя).
+
+    :param user: Созданный пользователь со всеми счетами, картами и операциями.
+    :param scenario: Название сценария нагрузки.
+    :param fingerprint: Отпечаток плана сидинга.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    with open(get_seeds_checkpoint_file_path(scenario, fingerprint), "a", encoding="utf-8") as file:
+        file.write(user.model_dump_json() + "\n")
+        file.flush()
+
+
+def load_seeds_checkpoint(scenario: str, fingerprint: str) -> list[SeedUserResult]:
+    """
+    Загружает пользователей, сохранённых в чекпоинте прерванного запуска.
+    Последняя строка, оборванная посреди записи, отбрасывается и обрезается в файле,
+    чтобы следующая запись append_seeds_checkpoint начиналась с новой строки.
+
+    :param scenario: Название сценария нагрузки.
+    :param fingerprint: Отпечаток плана сидинга.
+    :return: Список уже созданных пользователей (пустой, если чекпоинта нет).
+    """
+    checkpoint_file = get_seeds_checkpoint_file_path(scenario, fingerprint)
+
+    if not checkpoint_file.exists():
+        return []
+
+    users: list[SeedUserResult] = []
+    with open(checkpoint_file, "r+b") as file:
+        complete_size = 0
+        for line in file:
+            if not line.endswith(b"\n"):
+                logger.warning(f"Dropping incomplete checkpoint record in file: {checkpoint_file}")
+                file.truncate(complete_size)
+                break
+
+            users.append(SeedUserResult.model_validate_json(line))
+            complete_size += len(line)
+
+    logger.debug(f"Seeding checkpoint loaded from file: {checkpoint_file}")
+    return users
+
+
+def clear_seeds_checkpoint(scenario: str, fingerprint: str):
+    """
+    Удаляет чекпоинт сидинга (после успешного сохранения итогового результата).
+
+    :param scenario: Название сценария нагрузки.
+    :param fingerprint: Отпечаток плана сидинга.
+    """
+    get_seeds_checkpoint_file_path(scenario, fingerprint).unlink(missing_ok=True)
@@ -0,0 +1,243 @@
+import bisect
+import threading
+import time
+from pathlib import Path
+
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_METRICS")
+
+# Верхние границы корзин гистограммы задержек, мс (последняя корзина — всё, что больше)
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+
+
+class SeedsOperationMetrics:
+    """
+    Метрики одного вида запросов сидинга (например, create_user или make_top_up_operation):
+    количество, ошибки, повторы и гистограмма задержек.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.failures = 0
+        self.retries = 0
+        self.total_time_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, duration_ms: float, failed: bool) -> None:
+        self.count += 1
+        self.failures += failed
+        self.total_time_ms += duration_ms
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+
+    @property
+    def average_ms(self) -> float:
+        return self.total_time_ms / self.count if self.count else 0.0
+
+    def percentile_ms(self, percentile: float) -> float:
+        """
+        Оценка перцентиля по гистограмме (верхняя граница корзины, в которую он попадает).
+        """
+        threshold = self.count * percentile
+        seen = 0
+        for bound, bucket in zip((*LATENCY_BUCKETS_MS, float("inf")), self.buckets):
+            seen += bucket
+            if seen >= threshold and seen > 0:
+                return bound
+
+        return 0.0
+
+
+class SeedsMetrics:
+    """
+    Метрики прогона сидинга: задержки и ошибки по видам запросов, созданные пользователи,
+    скорость (сущностей и пользователей в секунду) и оценка оставшегося времени.
+    """
+
+    def __init__(self, scenario: str = "", total_users: int = 0):
+        """
+        :param scenario: Название сценария сидинга (для логов и экспорта).
+        :param total_users: Сколько пользователей нужно создать в этом прогоне (для ETA).
+        """
+        self.scenario = scenario
+        self.total_users = total_users
+        self.users_built = 0
+        self.users_failed = 0
+        self.started_at = time.perf_counter()
+        self.operations: dict[str, SeedsOperationMetrics] = {}
+
+    def get_operation(self, name: str) -> SeedsOperationMetrics:
+        operation = self.operations.get(name)
+        if operation is None:
+            operation = self.operations[name] = SeedsOperationMetrics()
+
+        return operation
+
+    def record(self, name: str, duration_ms: float, failed: bool = False) -> None:
+        """
+        Регистрирует выполненный запрос к стенду.
+
+        :param name: Название запроса.
+        :param duration_ms: Длительность запроса, мс.
+        :param failed: Запрос завершился ошибкой.
+        """
+        self.get_operation(name).record(duration_ms, failed)
+
+    def record_retry(self, name: str) -> None:
+        """
+        Регистрирует повтор запроса.
+        """
+        self.get_operation(name).retries += 1
+
+    def record_user(self) -> None:
+        """
+        Регистрирует полностью созданного пользователя.
+        """
+        self.users_built += 1
+
+    def record_failed_user(self) -> None:
+        """
+        Регистрирует пользователя, которого не удалось создать полностью (он пропущен).
+        """
+        self.users_failed += 1
+
+    @property
+    def snapshot(self) -> list[SeedsOperationMetrics]:
+        # Копия списка: сводку может читать поток репортёра, пока билдер добавляет новые виды запросов
+        return list(self.operations.values())
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def entities(self) -> int:
+        return sum(operation.count - operation.failures for operation in self.snapshot)
+
+    @property
+    def eta(self) -> float | None:
+        """
+        Оценка оставшегося времени сидинга, с (None, если ещё ни один пользователь не создан).
+        """
+        if not (self.users_built or self.users_failed) or not self.total_users:
+            return None
+
+        done = self.users_built + self.users_failed
+        return max(self.total_users - done, 0) * self.elapsed / done
+
+    def summary(self) -> str:
+        """
+        Однострочная сводка прогресса для логов.
+        """
+        elapsed = max(self.elapsed, 1e-9)
+        operations = self.snapshot
+        failures = sum(operation.failures for operation in operations)
+        retries = sum(operation.retries for operation in operations)
+        eta = f"{self.eta:.0f}s" if self.eta is not None else "n/a"
+
+        return (
+            f"[{self.scenario}] users {self.users_built}/{self.total_users}, "
+            f"{self.entities / elapsed:.1f} entities/s, {self.users_built / elapsed:.2f} users/s, "
+            f"failures {failures}, retries {retries}, skipped users {self.users_failed}, "
+            f"elapsed {elapsed:.0f}s, ETA {eta}"
+        )
+
+    def log(self) -> None:
+        """
+        Логирует сводку и задержки по каждому виду запросов.
+        """
+        logger.info(self.summary())
+        for name, operation in sorted(self.operations.items()):
+            logger.info(
+                f"[{self.scenario}]   {name}: count {operation.count}, failures {operation.failures}, "
+                f"retries {operation.retries}, avg {operation.average_ms:.1f}ms, "
+                f"p50 {operation.percentile_ms(0.5):g}ms, p95 {operation.percentile_ms(0.95):g}ms, "
+                f"p99 {operation.percentile_ms(0.99):g}ms"
+            )
+
+    def to_csv(self) -> str:
+        """
+        Метрики по видам запросов в формате CSV.
+        """
+        lines = ["name,count,failures,retries,avg_ms,p50_ms,p95_ms,p99_ms"]
+        for name, operation in sorted(self.operations.items()):
+            lines.append(
+                f"{name},{operation.count},{operation.failures},{operation.retries},{operation.average_ms:.3f},"
+                f"{operation.percentile_ms(0.5):g},{operation.percentile_ms(0.95):g},{operation.percentile_ms(0.99):g}"
+            )
+
+        return "\n".join(lines) + "\n"
+
+    def to_prometheus(self) -> str:
+        """
+        Метрики в текстовом формате Prometheus (гистограммы задержек, счётчики ошибок и повторов).
+        """
+        labels = f'scenario="{self.scenario}"'
+        lines = [
+            "# TYPE seeds_request_duration_ms histogram",
+        ]
+        for name, operation in sorted(self.operations.items()):
+            cumulative = 0
+            for bound, bucket in zip((*LATENCY_BUCKETS_MS, "+Inf"), operation.buckets):
+                cumulative += bucket
+                lines.append(f'seeds_request_duration_ms_bucket{{{labels},name="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'seeds_request_duration_ms_sum{{{labels},name="{name}"}} {operation.total_time_ms:.3f}')
+            lines.append(f'seeds_request_duration_ms_count{{{labels},name="{name}"}} {operation.count}')
+
+        lines.append("# TYPE seeds_request_failures_total counter")
+        lines.extend(
+            f'seeds_request_failures_total{{{labels},name="{name}"}} {operation.failures}'
+            for name, operation in sorted(self.operations.items())
+        )
+        lines.append("# TYPE seeds_request_retries_total counter")
+        lines.extend(
+            f'seeds_request_retries_total{{{labels},name="{name}"}} {operation.retries}'
+            for name, operation in sorted(self.operations.items())
+        )
+        lines.append("# TYPE seeds_users_built gauge")
+        lines.append(f"seeds_users_built{{{labels}}} {self.users_built}")
+        lines.append("# TYPE seeds_users_failed gauge")
+        lines.append(f"seeds_users_failed{{{labels}}} {self.users_failed}")
+        lines.append("# TYPE seeds_elapsed_seconds gauge")
+        lines.append(f"seeds_elapsed_seconds{{{labels}}} {self.elapsed:.3f}")
+
+        return "\n".join(lines) + "\n"
+
+    def export(self, formats: list[str]) -> None:
+        """
+        Сохраняет метрики в ./dumps/{scenario}_seeds.metrics.csv и/или ./dumps/{scenario}_seeds.metrics.prom.
+
+        :param formats: Форматы экспорта: csv, prometheus.
+        """
+        Path("./dumps").mkdir(exist_ok=True)
+
+        if "csv" in formats:
+            Path(f"./dumps/{self.scenario}_seeds.metrics.csv").write_text(self.to_csv(), encoding="utf-8")
+        if "prometheus" in formats:
+            Path(f"./dumps/{self.scenario}_seeds.metrics.prom").write_text(self.to_prometheus(), encoding="utf-8")
+
+
+class SeedsMetricsReporter:
+    """
+    Периодически логирует сводку метрик сидинга в фоновом потоке
+    (под gevent — в гринлете, так как threading пропатчен).
+    """
+
+    def __init__(self, metrics: SeedsMetrics, interval: float):
+        self.metrics = metrics
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            logger.info(self.metrics.summary())
+
+    def __enter__(self) -> "SeedsMetricsReporter":
+        if self.interval > 0:
+            self.thread.start()
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stopped.set()
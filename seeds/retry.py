@@ -0,0 +1,57 @@
+import random
+
+import grpc
+import httpx
+
+# Коды gRPC, при которых запрос имеет смысл повторить: стенд временно недоступен или перегружен
+RETRYABLE_GRPC_CODES = {
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+    grpc.StatusCode.ABORTED,
+}
+
+# HTTP-статусы, при которых запрос имеет смысл повторить (помимо 5xx)
+RETRYABLE_HTTP_STATUSES = {408, 429}
+
+
+class SeedsFailureBudgetExceededError(Exception):
+    """
+    Пропущено больше пользователей, чем допускает SEEDS.MAX_FAILED_USERS_RATIO: сидинг прерывается.
+    Бюджет считается в пользователях: ошибка любого его счёта, карты или операции пропускает пользователя целиком.
+    """
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    Проверяет, является ли ошибка запроса к стенду временной (её имеет смысл повторить):
+    сетевые ошибки и таймауты HTTP, HTTP 5xx/408/429, gRPC UNAVAILABLE, DEADLINE_EXCEEDED и т.п.
+
+    :param error: Исключение, выброшенное клиентом.
+    :return: True, если запрос можно повторить.
+    """
+    if isinstance(error, httpx.TransportError):
+        return True
+
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        return status_code >= 500 or status_code in RETRYABLE_HTTP_STATUSES
+
+    if isinstance(error, grpc.RpcError) and callable(getattr(error, "code", None)):
+        return error.code() in RETRYABLE_GRPC_CODES
+
+    return False
+
+
+def get_backoff_delay(attempt: int, backoff: float, backoff_max: float) -> float:
+    """
+    Задержка перед повтором: экспоненциальный рост с полным джиттером
+    (случайное значение от 0 до min(backoff_max, backoff * 2 ** attempt)), чтобы одновременно
+    упавшие запросы не повторялись синхронной волной.
+
+    :param attempt: Номер неудачной попытки, начиная с 0.
+    :param backoff: Базовая задержка, с.
+    :param backoff_max: Максимальная задержка, с.
+    :return: Задержка, с.
+    """
+    return random.uniform(0, min(backoff_max, backoff * 2 ** attempt))
@@ -1,9 +1,26 @@
+import hashlib
+import json
 from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from itertools import islice
 
+import gevent
+from gevent import monkey
+
+from config import settings
+from seeds.async_builder import build_async_grpc_seeds_builder
 from seeds.builder import build_grpc_seeds_builder
-from seeds.dumps import save_seeds_results, load_seeds_results
+from seeds.services_builder import build_services_seeds_builder
+from seeds.compact import CompactSeedsResult
+from seeds.dumps import save_seeds_results, load_seeds_results, save_seeds_metadata, load_seeds_metadata, \
+    get_seeds_file_path, append_seeds_checkpoint, load_seeds_checkpoint, clear_seeds_checkpoint, \
+    load_compact_seeds_results, get_seeds_binary_file_path, save_binary_seeds_results, load_binary_seeds_results, \
+    get_seeds_jsonl_file_path, save_jsonl_seeds_results, promote_seeds_checkpoint, iter_jsonl_seeds_lines, \
+    iter_jsonl_seeds_results
+from seeds.metrics import SeedsMetrics, SeedsMetricsReporter
+from seeds.schema.metadata import SeedsMetadata
 from seeds.schema.plan import SeedsPlan
-from seeds.schema.result import SeedsResult
+from seeds.schema.result import SeedsResult, SeedUserResult
 from tools.logger import get_logger
 
 # Инициализируем логгер с именем SEEDS_SCENARIO
@@ -18,7 +35,28 @@ class SeedsScenario(ABC):
         """
         Инициализация класса SeedsScenario.
         Создаёт экземпляр билдера для генерации сидинговых данных через gRPC.
+        При SEEDS.BACKEND=async используется асинхронный билдер на grpc.aio.
+
+        grpc.aio не работает в процессе, пропатченном gevent (Locust делает monkey.patch_all()
+        при импорте), поэтому асинхронный билдер доступен только при отдельном запуске сидинга
+        с LOCUST_SKIP_MONKEY_PATCH=1. Внутри Locust используется gevent-билдер.
+
+        При SEEDS.BACKEND=services данные создаются напрямую во внутренних сервисах стенда, минуя gateway.
         """
+        if settings.seeds.backend == "services":
+            self.builder = build_services_seeds_builder()
+            return
+
+        if settings.seeds.backend == "async" and not monkey.is_module_patched("threading"):
+            self.builder = build_async_grpc_seeds_builder()
+            return
+
+        if settings.seeds.backend == "async":
+            logger.warning(
+                "Async seeding backend is unavailable in a gevent-patched process, falling back to gevent builder. "
+                "Run seeding separately with LOCUST_SKIP_MONKEY_PATCH=1 to use it."
+            )
+
         self.builder = build_grpc_seeds_builder()
 
     @property
@@ -39,6 +77,68 @@ class SeedsScenario(ABC):
         """
         ...
 
+    @property
+    def users_range(self) -> tuple[int, int | None]:
+        """
+        Диапазон строк [start, stop) JSONL-дампа, который загружает сценарий.
+        Переопределяется, если несколько сценариев используют непересекающиеся части одного дампа.
+        """
+        return 0, None
+
+    @property
+    def stand_urls(self) -> list[str]:
+        """
+        Адреса стенда, на которых создаются данные выбранным бэкендом сидинга (SEEDS.BACKEND):
+        внутренние сервисы users, accounts, cards и operations для services, grpc-gateway для sync и async.
+        """
+        if settings.seeds.backend == "services":
+            configs = [
+                settings.users_grpc_client,
+                settings.accounts_grpc_client,
+                settings.cards_grpc_client,
+                settings.operations_grpc_client
+            ]
+            return [config.client_url for config in configs if config is not None]
+
+        return [settings.gateway_grpc_client.client_url]
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Отпечаток плана сидинга: хэш от плана и адресов стенда, через которые работает бэкенд сидинга.
+        Если отпечаток совпадает с сохранённым в дампе, данные можно переиспользовать.
+        """
+        urls = "\n".join(self.stand_urls)
+        payload = f"{urls}\n{self.plan.model_dump_json()}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def is_cached(self) -> bool:
+        """
+        Проверяет, есть ли уже дамп, созданный для такого же плана на том же стенде,
+        и не истёк ли его срок жизни (SEEDS.CACHE_TTL, в секундах).
+        """
+        metadata = load_seeds_metadata(scenario=self.scenario)
+        if metadata is None or metadata.fingerprint != self.fingerprint:
+            return False
+
+        if settings.seeds.dump_format == "binary":
+            seeds_file = get_seeds_binary_file_path(self.scenario)
+        elif settings.seeds.dump_format == "jsonl":
+            seeds_file = get_seeds_jsonl_file_path(self.scenario, settings.seeds.compress)
+        else:
+            seeds_file = get_seeds_file_path(self.scenario)
+
+        if not seeds_file.exists():
+            return False
+
+        if settings.seeds.cache_ttl is not None:
+            age = (datetime.now(timezone.utc) - metadata.created_at).total_seconds()
+            if age > settings.seeds.cache_ttl:
+                logger.info(f"[{self.scenario}] Cached seeding result expired ({age:.0f}s old).")
+                return False
+
+        return True
+
     def save(self, result: SeedsResult) -> None:
         """
         Сохраняет результат сидинга в файл.
@@ -46,33 +146,158 @@ class SeedsScenario(ABC):
         """
         # Логируем начало сохранения
         logger.info(f"[{self.scenario}] Saving seeding result to file.")
-        save_seeds_results(result=result, scenario=self.scenario)
+        if settings.seeds.dump_format == "binary":
+            save_binary_seeds_results(result=result, scenario=self.scenario)
+        elif settings.seeds.dump_format == "jsonl":
+            save_jsonl_seeds_results(users=result.users, scenario=self.scenario, compress=settings.seeds.compress)
+        else:
+            save_seeds_results(result=result, scenario=self.scenario)
+        self.save_metadata()
         # Логируем успешное завершение
         logger.info(f"[{self.scenario}] Seeding result saved successfully.")
 
-    def load(self) -> SeedsResult:
+    def save_metadata(self) -> None:
+        """
+        Сохраняет метаданные дампа (отпечаток плана и время создания).
+        """
+        save_seeds_metadata(
+            metadata=SeedsMetadata(fingerprint=self.fingerprint, created_at=datetime.now(timezone.utc)),
+            scenario=self.scenario
+        )
+
+    def load(self, background: bool = True) -> SeedsResult | CompactSeedsResult:
         """
         Загружает результаты сидинга из файла.
-        :return: Объект SeedsResult, содержащий данные, загруженные из файла.
+        При SEEDS.STORAGE=compact данные загружаются в компактное колоночное хранилище,
+        при SEEDS.DUMP_FORMAT=binary дамп отображается в память (mmap) без копирования.
+        :param background: Разрешить фоновую догрузку JSONL-дампа (SEEDS.INITIAL_LOAD).
+                           Без неё дамп загружается целиком до возврата.
+        :return: Объект SeedsResult (или CompactSeedsResult), содержащий данные, загруженные из файла.
         """
         # Логируем начало загрузки
         logger.info(f"[{self.scenario}] Loading seeding result from file.")
-        result = load_seeds_results(scenario=self.scenario)
+        if settings.seeds.dump_format == "binary":
+            result = load_binary_seeds_results(scenario=self.scenario)
+        elif settings.seeds.dump_format == "jsonl":
+            return self.load_jsonl(background=background)
+        elif settings.seeds.storage == "compact":
+            result = load_compact_seeds_results(scenario=self.scenario)
+        else:
+            result = load_seeds_results(scenario=self.scenario)
+        result.attach_dispenser(policy=settings.seeds.exhaustion_policy, reseed=self.reseed)
         # Логируем успешную загрузку
         logger.info(f"[{self.scenario}] Seeding result loaded successfully.")
         return result
 
-    def build(self) -> None:
+    def load_jsonl(self, background: bool = True) -> SeedsResult | CompactSeedsResult:
+        """
+        Загружает JSONL-дамп (строки из users_range).
+
+        Если задан SEEDS.INITIAL_LOAD и background=True, сразу загружаются только первые K пользователей,
+        а остальные догружаются порциями в фоновом гринлете и добавляются в пул раздачи,
+        так что тест может стартовать, не дожидаясь разбора всего файла.
+        """
+        start, stop = self.users_range
+        compress = settings.seeds.compress
+
+        if settings.seeds.storage == "compact":
+            lines = iter_jsonl_seeds_lines(self.scenario, compress, start, stop)
+            result = CompactSeedsResult.from_users(map(json.loads, lines))
+            result.attach_dispenser(policy=settings.seeds.exhaustion_policy, reseed=self.reseed)
+            logger.info(f"[{self.scenario}] Seeding result loaded successfully.")
+            return result
+
+        users = iter_jsonl_seeds_results(self.scenario, compress, start, stop)
+        batch = settings.seeds.initial_load if background else None
+
+        result = SeedsResult(users=list(islice(users, batch)))
+        result.attach_dispenser(policy=settings.seeds.exhaustion_policy, reseed=self.reseed)
+
+        if batch is None:
+            logger.info(f"[{self.scenario}] Seeding result loaded successfully.")
+            return result
+
+        def load_rest():
+            while chunk := list(islice(users, batch)):
+                result.extend_users(chunk)
+                gevent.sleep(0)
+
+            logger.info(f"[{self.scenario}] Seeding result loaded successfully: {len(result.users)} users.")
+
+        logger.info(f"[{self.scenario}] First {len(result.users)} seeded users loaded, loading the rest in background.")
+        gevent.spawn(load_rest)
+        return result
+
+    def build(self, force: bool | None = None) -> None:
         """
         Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат.
+        Если для этого плана уже есть актуальный дамп, генерация пропускается.
+
+        Каждый созданный пользователь сразу дописывается в чекпоинт, поэтому после падения
+        повторный вызов build() продолжит сидинг с места остановки, а не начнёт заново.
+
+        Во время генерации каждые SEEDS.METRICS_INTERVAL секунд логируется прогресс (пользователи,
+        сущности в секунду, ошибки, ETA), по завершении — задержки по видам запросов.
+        Метрики можно выгрузить в CSV или формат Prometheus (SEEDS.METRICS_EXPORT).
+
+        :param force: Пересоздать данные даже при наличии актуального дампа.
+                      По умолчанию берётся из SEEDS.FORCE_RESEED.
         """
+        force = settings.seeds.force_reseed if force is None else force
+        if not force and self.is_cached():
+            logger.info(f"[{self.scenario}] Seeding result for this plan already exists, skipping generation.")
+            return
+
+        fingerprint = self.fingerprint
+        if force:
+            clear_seeds_checkpoint(scenario=self.scenario, fingerprint=fingerprint)
+
+        # Подхватываем пользователей, созданных в прерванном запуске
+        completed = load_seeds_checkpoint(scenario=self.scenario, fingerprint=fingerprint)
+        if completed:
+            logger.info(f"[{self.scenario}] Resuming seeding from checkpoint: {len(completed)} users already created.")
+
         # Преобразуем план сидинга в JSON для логов (без значений по умолчанию)
         plan_json = self.plan.model_dump_json(indent=2, exclude_defaults=True)
         # Логируем начало генерации
         logger.info(f"[{self.scenario}] Starting seeding data generation for plan: {plan_json}")
+        metrics = self.builder.metrics = SeedsMetrics(
+            scenario=self.scenario,
+            total_users=max(self.plan.users.count - len(completed), 0)
+        )
+
+        def on_user_built(user: SeedUserResult) -> None:
+            append_seeds_checkpoint(user=user, scenario=self.scenario, fingerprint=fingerprint)
+            metrics.record_user()
+
         # Запускаем генерацию
-        result = self.builder.build(self.plan)
+        with SeedsMetricsReporter(metrics, interval=settings.seeds.metrics_interval):
+            result = self.builder.build(self.plan, completed=completed, on_user_built=on_user_built)
         # Логируем завершение генерации
         logger.info(f"[{self.scenario}] Seeding data generation completed.")
+        metrics.log()
+        metrics.export(settings.seeds.metrics_export)
+
+        if settings.seeds.dump_format == "jsonl":
+            # Пользователи уже записаны в чекпоинт построчно по мере создания — он и становится дампом
+            promote_seeds_checkpoint(scenario=self.scenario, fingerprint=fingerprint, compress=settings.seeds.compress)
+            self.save_metadata()
+            return
+
         # Сохраняем результат
-        self.save(result)
\ No newline at end of file
+        self.save(result)
+        # Итоговый дамп сохранён — чекпоинт больше не нужен
+        clear_seeds_checkpoint(scenario=self.scenario, fingerprint=fingerprint)
+
+    def reseed(self) -> list[SeedUserResult]:
+        """
+        Досоздаёт партию пользователей (SEEDS.RESEED_BATCH) по тому же плану.
+        Используется раздатчиком пользователей, когда пул исчерпан и политика исчерпания — reseed.
+
+        :return: Список новых пользователей.
+        """
+        plan = self.plan.model_copy(deep=True)
+        plan.users.count = settings.seeds.reseed_batch
+
+        logger.info(f"[{self.scenario}] Reseeding {plan.users.count} users on demand.")
+        return self.builder.build(plan).users
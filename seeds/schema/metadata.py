@@ -0,0 +1,15 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class SeedsMetadata(BaseModel):
+    """
+    Метаданные дампа сидинга, сохраняемые рядом с файлом результата.
+
+    Attributes:
+        fingerprint (str): Хэш плана сидинга и адреса стенда, для которого были созданы данные.
+        created_at (datetime): Момент сохранения дампа.
+    """
+    fingerprint: str
+    created_at: datetime
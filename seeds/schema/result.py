@@ -1,6 +1,10 @@
-from pydantic import BaseModel, Field
+from typing import Callable
+
+from pydantic import BaseModel, Field, PrivateAttr
 import random
 
+from seeds.dispenser import SeedsDispenser, ExhaustionPolicy
+
 class SeedCardResult(BaseModel):
     """
     Результат генерации карты.
@@ -67,17 +71,65 @@ class SeedsResult(BaseModel):
     """
     users: list[SeedUserResult] = Field(default_factory=list)
 
+    _dispenser: SeedsDispenser[SeedUserResult] | None = PrivateAttr(default=None)
+
+    @property
+    def dispenser(self) -> SeedsDispenser[SeedUserResult]:
+        """
+        Раздатчик пользователей для get_next_user/release_user.
+        Если не был настроен через attach_dispenser, создаётся с политикой fail.
+        """
+        if self._dispenser is None:
+            self._dispenser = SeedsDispenser(self.users)
+
+        return self._dispenser
+
+    def attach_dispenser(
+            self,
+            policy: ExhaustionPolicy,
+            reseed: Callable[[], list[SeedUserResult]] | None = None
+    ) -> None:
+        """
+        Настраивает раздатчик пользователей.
+
+        Args:
+            policy: Политика исчерпания пула (wrap, fail, reseed).
+            reseed: Функция, создающая новую партию пользователей для политики reseed.
+        """
+        self._dispenser = SeedsDispenser(self.users, policy=policy, reseed=reseed)
+
+    def extend_users(self, users: list[SeedUserResult]) -> None:
+        """
+        Добавляет пользователей в результат и в пул раздачи (используется при поэтапной загрузке дампа).
+
+        Args:
+            users: Новые пользователи.
+        """
+        self.users.extend(users)
+        if self._dispenser is not None:
+            self._dispenser.extend(users)
+
     def get_next_user(self) -> SeedUserResult:
         """
-        Возвращает и удаляет первого пользователя из списка.
+        Выдаёт следующего свободного пользователя (за O(1)).
 
         Используется в случае, когда на каждый виртуальный юзер нужен новый тестовый пользователь.
         Удобно при строго последовательной раздаче пользователей в тестовых сценариях.
+        Поведение при исчерпании пула задаётся политикой раздатчика (см. attach_dispenser).
 
         Returns:
             SeedUserResult: Следующий пользователь из списка.
         """
-        return self.users.pop(0)
+        return self.dispenser.lease()
+
+    def release_user(self, user: SeedUserResult) -> None:
+        """
+        Возвращает пользователя, полученного через get_next_user, обратно в пул.
+
+        Args:
+            user: Ранее выданный пользователь.
+        """
+        self.dispenser.release(user)
 
     def get_random_user(self) -> SeedUserResult:
         """
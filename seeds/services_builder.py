@@ -0,0 +1,135 @@
+from functools import partial
+
+from clients.grpc.services.users.client import UsersServiceGRPCClient, build_users_service_grpc_client
+from clients.grpc.services.accounts.client import AccountsServiceGRPCClient, build_accounts_service_grpc_client
+from clients.grpc.services.cards.client import CardsServiceGRPCClient, build_cards_service_grpc_client
+from clients.grpc.services.operations.client import OperationsServiceGRPCClient, \
+    build_operations_service_grpc_client
+from contracts.services.accounts.account_pb2 import AccountType
+from contracts.services.cards.card_pb2 import CardType
+from contracts.services.operations.operation_pb2 import OperationType
+from seeds.builder import SeedsBulider
+from seeds.tasks import SeedAccountTask, SeedChildTask, SeedTaskContext
+from config import settings
+
+
+class ServicesSeedsBuilder(SeedsBulider):
+    """
+    ServicesSeedsBuilder — сидер, который создаёт данные напрямую во внутренних сервисах стенда
+    (users, accounts, cards, operations), минуя gateway. Строит тот же SeedsResult, что и SeedsBulider,
+    и так же поддерживает параллельное создание пользователей, повторы и метрики.
+
+    От SeedsBulider отличается только таблицей задач (get_account_tasks). Карты и операции счёта
+    создаются конвейером: запросы CreateCard/CreateOperation отправляются через grpc.Future
+    (см. SeedsBulider.call_pipelined), поэтому дочерние сущности счёта не ждут друг друга.
+
+    Attributes:
+        users_service_client: Клиент UsersService
+        accounts_service_client: Клиент AccountsService
+        cards_service_client: Клиент CardsService
+        operations_service_client: Клиент OperationsService
+    """
+
+    def __init__(
+            self,
+            users_service_client: UsersServiceGRPCClient,
+            accounts_service_client: AccountsServiceGRPCClient,
+            cards_service_client: CardsServiceGRPCClient,
+            operations_service_client: OperationsServiceGRPCClient,
+            **kwargs
+    ):
+        """
+        :param kwargs: Параметры SeedsBulider (workers, retry_attempts и т.д.).
+        """
+        # Клиенты gateway этим сидером не используются
+        super().__init__(
+            users_gateway_client=None,
+            cards_gateway_client=None,
+            accounts_gateway_client=None,
+            operations_gateway_client=None,
+            **kwargs
+        )
+        self.users_service_client = users_service_client
+        self.accounts_service_client = accounts_service_client
+        self.cards_service_client = cards_service_client
+        self.operations_service_client = operations_service_client
+
+    def create_user(self) -> str:
+        response = self.call(self.users_service_client.create_user)
+        return response.user.id
+
+    def open_service_account(self, account_type: AccountType.ValueType, user_id: str) -> SeedTaskContext:
+        response = self.call(self.accounts_service_client.create_account, user_id=user_id, account_type=account_type)
+        return {"account_id": response.account.id}
+
+    def open_service_card_account(self, account_type: AccountType.ValueType, user_id: str) -> SeedTaskContext:
+        """
+        Открывает карточный счёт и выпускает к нему основную виртуальную карту
+        (gateway делает то же одной ручкой OpenDebitCardAccount/OpenCreditCardAccount).
+        """
+        context = self.open_service_account(account_type, user_id)
+        response = self.call(
+            self.cards_service_client.create_card,
+            account_id=context["account_id"],
+            card_type=CardType.CARD_TYPE_VIRTUAL
+        )
+        return {**context, "card_id": response.card.id}
+
+    def get_account_tasks(self) -> list[SeedAccountTask]:
+        """
+        Таблица задач сидинга через внутренние сервисы: одна ручка CreateCard/CreateOperation
+        на все типы карт и операций, тип передаётся аргументом.
+        """
+        cards, operations = self.cards_service_client, self.operations_service_client
+
+        def card(kind: str, card_type: CardType.ValueType) -> SeedChildTask:
+            return SeedChildTask(kind, cards.create_card, ("account_id",), kwargs={"card_type": card_type},
+                                 future_function=cards.create_card_future)
+
+        def operation(kind: str, operation_type: OperationType.ValueType) -> SeedChildTask:
+            return SeedChildTask(kind, operations.create_operation, ("card_id", "account_id"),
+                                 kwargs={"operation_type": operation_type},
+                                 future_function=operations.create_operation_future)
+
+        children = [
+            card("physical_cards", CardType.CARD_TYPE_PHYSICAL),
+            card("virtual_cards", CardType.CARD_TYPE_VIRTUAL),
+            operation("top_up_operations", OperationType.OPERATION_TYPE_TOP_UP),
+            operation("purchase_operations", OperationType.OPERATION_TYPE_PURCHASE),
+            operation("transfer_operations", OperationType.OPERATION_TYPE_TRANSFER),
+            operation("cash_withdrawal_operations", OperationType.OPERATION_TYPE_CASH_WITHDRAWAL),
+        ]
+
+        return [
+            SeedAccountTask("deposit_accounts",
+                            partial(self.open_service_account, AccountType.ACCOUNT_TYPE_DEPOSIT)),
+            SeedAccountTask("savings_accounts",
+                            partial(self.open_service_account, AccountType.ACCOUNT_TYPE_SAVINGS)),
+            SeedAccountTask("debit_card_accounts",
+                            partial(self.open_service_card_account, AccountType.ACCOUNT_TYPE_DEBIT_CARD), children),
+            SeedAccountTask("credit_card_accounts",
+                            partial(self.open_service_card_account, AccountType.ACCOUNT_TYPE_CREDIT_CARD), children),
+        ]
+
+
+def build_services_seeds_builder() -> ServicesSeedsBuilder:
+    """
+    Фабрика для создания сидера, работающего напрямую с внутренними сервисами стенда.
+    Адреса сервисов задаются в USERS_GRPC_CLIENT, ACCOUNTS_GRPC_CLIENT, CARDS_GRPC_CLIENT и OPERATIONS_GRPC_CLIENT.
+
+    Returns:
+        ServicesSeedsBuilder: Инициализированный сидер с клиентами внутренних сервисов
+    """
+    return ServicesSeedsBuilder(
+        users_service_client=build_users_service_grpc_client(),
+        accounts_service_client=build_accounts_service_grpc_client(),
+        cards_service_client=build_cards_service_grpc_client(),
+        operations_service_client=build_operations_service_grpc_client(),
+        workers=settings.seeds.workers,
+        concurrency=settings.seeds.concurrency,
+        retry_attempts=settings.seeds.retry_attempts,
+        retry_backoff=settings.seeds.retry_backoff,
+        retry_backoff_max=settings.seeds.retry_backoff_max,
+        max_failed_users_ratio=settings.seeds.max_failed_users_ratio,
+        pipeline_depth=settings.seeds.pipeline_depth
+    )
@@ -0,0 +1,91 @@
+"""
+Локальный gRPC-стаб внутренних сервисов стенда (users, accounts, cards, operations) для проверки
+сидинга в обход gateway (SEEDS.BACKEND=services) без поднятого стенда.
+
+Все четыре сервиса обслуживаются на одном порту; ручки создания возвращают сущность
+из запроса с новым UUID, остальные ручки не реализованы (UNIMPLEMENTED).
+
+Запуск:
+    python -m seeds.stub_server 9100
+
+После чего в .env:
+    USERS_GRPC_CLIENT.HOST=localhost
+    USERS_GRPC_CLIENT.PORT=9100
+    (и то же для ACCOUNTS_GRPC_CLIENT, CARDS_GRPC_CLIENT, OPERATIONS_GRPC_CLIENT)
+"""
+import sys
+import uuid
+from concurrent import futures
+
+import grpc
+from google.protobuf.message import Message
+
+from contracts.services.accounts.account_pb2 import Account
+from contracts.services.accounts.accounts_service_pb2_grpc import AccountsServiceServicer, \
+    add_AccountsServiceServicer_to_server
+from contracts.services.accounts.rpc_create_account_pb2 import CreateAccountRequest, CreateAccountResponse
+from contracts.services.cards.card_pb2 import Card
+from contracts.services.cards.cards_service_pb2_grpc import CardsServiceServicer, add_CardsServiceServicer_to_server
+from contracts.services.cards.rpc_create_card_pb2 import CreateCardRequest, CreateCardResponse
+from contracts.services.operations.operation_pb2 import Operation
+from contracts.services.operations.operations_service_pb2_grpc import OperationsServiceServicer, \
+    add_OperationsServiceServicer_to_server
+from contracts.services.operations.rpc_create_operation_pb2 import CreateOperationRequest, CreateOperationResponse
+from contracts.services.users.rpc_create_user_pb2 import CreateUserRequest, CreateUserResponse
+from contracts.services.users.user_pb2 import User
+from contracts.services.users.users_service_pb2_grpc import UsersServiceServicer, add_UsersServiceServicer_to_server
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_STUB_SERVER")
+
+
+def get_fields(request: Message) -> dict:
+    """
+    Возвращает поля запроса создания сущности — они совпадают по именам с полями самой сущности.
+    """
+    return {field.name: getattr(request, field.name) for field in request.DESCRIPTOR.fields}
+
+
+class UsersServiceStub(UsersServiceServicer):
+    def CreateUser(self, request: CreateUserRequest, context) -> CreateUserResponse:
+        return CreateUserResponse(user=User(id=str(uuid.uuid4()), **get_fields(request)))
+
+
+class AccountsServiceStub(AccountsServiceServicer):
+    def CreateAccount(self, request: CreateAccountRequest, context) -> CreateAccountResponse:
+        return CreateAccountResponse(account=Account(id=str(uuid.uuid4()), **get_fields(request)))
+
+
+class CardsServiceStub(CardsServiceServicer):
+    def CreateCard(self, request: CreateCardRequest, context) -> CreateCardResponse:
+        return CreateCardResponse(card=Card(id=str(uuid.uuid4()), **get_fields(request)))
+
+
+class OperationsServiceStub(OperationsServiceServicer):
+    def CreateOperation(self, request: CreateOperationRequest, context) -> CreateOperationResponse:
+        return CreateOperationResponse(operation=Operation(id=str(uuid.uuid4()), **get_fields(request)))
+
+
+def build_stub_server(port: int, max_workers: int = 100) -> grpc.Server:
+    """
+    Создаёт (но не запускает) gRPC-сервер со стабами внутренних сервисов.
+
+    :param port: Порт, на котором будет слушать сервер.
+    :param max_workers: Количество потоков обработки запросов.
+    :return: gRPC-сервер.
+    """
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+    add_UsersServiceServicer_to_server(UsersServiceStub(), server)
+    add_AccountsServiceServicer_to_server(AccountsServiceStub(), server)
+    add_CardsServiceServicer_to_server(CardsServiceStub(), server)
+    add_OperationsServiceServicer_to_server(OperationsServiceStub(), server)
+    server.add_insecure_port(f"[::]:{port}")
+    return server
+
+
+if __name__ == '__main__':
+    stub_port = int(sys.argv[1]) if len(sys.argv) > 1 else 9100
+    stub_server = build_stub_server(stub_port)
+    stub_server.start()
+    logger.info(f"Internal services stub is listening on port {stub_port}.")
+    stub_server.wait_for_termination()
@@ -0,0 +1,152 @@
+"""
+План сидинга как дерево типизированных задач: пользователь -> счета -> карты и операции.
+
+Билдеры описывают только таблицу задач — какой запрос создаёт сущность каждого типа. Обход дерева
+и планирование запросов (параллельность, конвейер grpc.Future, повторы) реализованы в одном месте —
+в execute_* методах билдера. Имена связей совпадают в плане (SeedUsersPlan, SeedAccountsPlan)
+и в результате (SeedUserResult, SeedAccountResult), поэтому новый тип сущности добавляется
+одной строкой таблицы.
+"""
+from functools import partial
+from typing import Any, Callable
+
+from seeds.schema.plan import SeedAccountsPlan
+from seeds.schema.result import SeedCardResult, SeedOperationResult
+
+# Связи пользователь -> счета, в порядке хранения
+USER_ACCOUNT_KINDS = (
+    "deposit_accounts",
+    "savings_accounts",
+    "debit_card_accounts",
+    "credit_card_accounts",
+)
+
+# Связи счёт -> карты/операции, в порядке хранения: (имя связи, имя поля идентификатора)
+ACCOUNT_CHILD_KINDS = (
+    ("physical_cards", "card_id"),
+    ("virtual_cards", "card_id"),
+    ("top_up_operations", "operation_id"),
+    ("purchase_operations", "operation_id"),
+    ("transfer_operations", "operation_id"),
+    ("cash_withdrawal_operations", "operation_id"),
+)
+
+CHILD_RESULT_TYPES = {"card_id": SeedCardResult, "operation_id": SeedOperationResult}
+
+# Контекст задачи: идентификаторы уже созданных родительских сущностей (user_id, account_id, card_id)
+SeedTaskContext = dict[str, str]
+
+
+class SeedChildTask:
+    """
+    Задача создания карты или операции на счёте.
+
+    Attributes:
+        kind: Имя связи в SeedAccountsPlan/SeedAccountResult (например, "purchase_operations")
+        function: Метод клиента, создающий сущность
+        arguments: Идентификаторы из контекста, передаваемые в вызов (например, ("card_id", "account_id"))
+        kwargs: Постоянные аргументы вызова (например, тип карты)
+        future_function: Тот же запрос, возвращающий grpc.Future, если клиент это поддерживает
+        id_field: Поле идентификатора в результате (card_id или operation_id)
+    """
+    __slots__ = ("kind", "function", "arguments", "kwargs", "future_function", "id_field")
+
+    def __init__(
+            self,
+            kind: str,
+            function: Callable[..., Any],
+            arguments: tuple[str, ...],
+            kwargs: dict[str, Any] | None = None,
+            future_function: Callable[..., Any] | None = None
+    ):
+        self.kind = kind
+        self.function = function
+        self.arguments = arguments
+        self.kwargs = kwargs or {}
+        self.future_function = future_function
+        self.id_field = dict(ACCOUNT_CHILD_KINDS)[kind]
+
+    def get_kwargs(self, context: SeedTaskContext) -> dict[str, Any]:
+        return {**{name: context[name] for name in self.arguments}, **self.kwargs}
+
+    def get_result(self, response: Any) -> SeedCardResult | SeedOperationResult:
+        """
+        Строит результат из ответа клиента: идентификатор берётся из response.card / response.operation.
+        """
+        entity = getattr(response, self.id_field.removesuffix("_id"))
+        return CHILD_RESULT_TYPES[self.id_field](**{self.id_field: entity.id})
+
+
+class SeedAccountTask:
+    """
+    Задача открытия счёта одного типа.
+
+    Attributes:
+        kind: Имя связи в SeedUsersPlan/SeedUserResult (например, "debit_card_accounts")
+        open: Открывает счёт пользователя по user_id и возвращает контекст для дочерних задач
+              (account_id и, для карточных счетов, card_id основной карты)
+        children: Задачи, создающие карты и операции на счёте
+    """
+    __slots__ = ("kind", "open", "children")
+
+    def __init__(
+            self,
+            kind: str,
+            open: Callable[[str], Any],
+            children: list[SeedChildTask] | None = None
+    ):
+        self.kind = kind
+        self.open = open
+        self.children = children or []
+
+    def get_children(self, plan: SeedAccountsPlan) -> list[tuple[SeedChildTask, int]]:
+        """
+        Возвращает дочерние задачи счёта вместе с количеством сущностей каждого типа по плану.
+        """
+        return [(child, getattr(plan, child.kind).count) for child in self.children]
+
+
+def build_gateway_account_tasks(
+        open_account: Callable[[Callable[..., Any], str], Any],
+        accounts_client: Any,
+        cards_client: Any,
+        operations_client: Any
+) -> list[SeedAccountTask]:
+    """
+    Таблица задач сидинга через gateway. Подходит для синхронных и асинхронных HTTP и gRPC клиентов:
+    имена их методов совпадают.
+
+    Args:
+        open_account: Метод билдера, открывающий счёт ручкой gateway: (метод клиента, user_id) -> контекст
+        accounts_client: Клиент для открытия счетов
+        cards_client: Клиент для выпуска карт
+        operations_client: Клиент для операций
+
+    Returns:
+        list[SeedAccountTask]: Задачи по всем типам счетов в порядке USER_ACCOUNT_KINDS
+    """
+    def child(kind: str, client: Any, name: str, arguments: tuple[str, ...]) -> SeedChildTask:
+        # *_future-методы есть только у синхронных gRPC-клиентов
+        return SeedChildTask(kind, getattr(client, name), arguments,
+                             future_function=getattr(client, f"{name}_future", None))
+
+    card_arguments = ("user_id", "account_id")
+    operation_arguments = ("card_id", "account_id")
+    children = [
+        child("physical_cards", cards_client, "issue_physical_card", card_arguments),
+        child("virtual_cards", cards_client, "issue_virtual_card", card_arguments),
+        child("top_up_operations", operations_client, "make_top_up_operation", operation_arguments),
+        child("purchase_operations", operations_client, "make_purchase_operation", operation_arguments),
+        child("transfer_operations", operations_client, "make_transfer_operation", operation_arguments),
+        child("cash_withdrawal_operations", operations_client, "make_cash_withdrawal_operation",
+              operation_arguments),
+    ]
+
+    return [
+        SeedAccountTask("deposit_accounts", partial(open_account, accounts_client.open_deposit_account)),
+        SeedAccountTask("savings_accounts", partial(open_account, accounts_client.open_savings_account)),
+        SeedAccountTask("debit_card_accounts", partial(open_account, accounts_client.open_debit_card_account),
+                        children),
+        SeedAccountTask("credit_card_accounts", partial(open_account, accounts_client.open_credit_card_account),
+                        children),
+    ]
@@ -0,0 +1,30 @@
+import numpy as np
+
+from tools.analytics import LATENCY_QUANTIZER, TimelineBucket, get_latency_indices
+
+
+def test_latency_indices_match_histogram():
+    response_times = np.concatenate((
+        np.array([0, 0.0004, 0.001, 0.1275, 1, 255.5, 1_000, 3_600_000, 10_000_000], dtype=np.float32),
+        np.random.default_rng(0).lognormal(3, 2, 10_000).astype(np.float32)
+    ))
+
+    expected = [
+        LATENCY_QUANTIZER.get_index(min(round(float(value) * 1000), LATENCY_QUANTIZER.highest_value))
+        for value in response_times
+    ]
+    assert get_latency_indices(response_times).tolist() == expected
+
+
+def test_timeline_bucket_merge_and_percentiles():
+    first, second = TimelineBucket(), TimelineBucket()
+    first.count, second.count = 3, 2
+    first.add_latencies(np.array([1, 5, 9]), np.array([1, 1, 1]))
+    second.add_latencies(np.array([5, 20]), np.array([1, 1]))
+
+    first.merge(second)
+    assert first.count == 5
+    assert first.latency_indices.tolist() == [1, 5, 9, 20]
+    assert first.latency_counts.tolist() == [1, 2, 1, 1]
+    assert first.get_percentile_ms(50) == LATENCY_QUANTIZER.get_value(5) / 1000
+    assert first.get_percentile_ms(100) == LATENCY_QUANTIZER.get_value(20) / 1000
@@ -0,0 +1,86 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from seeds.async_builder import AsyncSeedsBuilder
+from seeds.retry import SeedsFailureBudgetExceededError
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan, SeedOperationsPlan
+
+
+class FakeChannel:
+    """
+    Асинхронный канал без стенда: каждый вызов занимает `delay` секунд, MakePurchaseOperation падает.
+    Считает начатые вызовы по методам и одновременно выполняемые вызовы.
+    """
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.calls: dict[str, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+
+    async def __aenter__(self) -> "FakeChannel":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.closed = True
+
+    def unary_unary(self, method: str, *args, **kwargs):
+        name = method.rsplit("/", 1)[-1]
+
+        async def call(request):
+            self.calls[name] = self.calls.get(name, 0) + 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                if method.endswith("/MakePurchaseOperation"):
+                    await asyncio.sleep(self.delay / 2)
+                    raise RuntimeError("purchase failed")
+
+                await asyncio.sleep(self.delay)
+            finally:
+                self.in_flight -= 1
+
+            entity = SimpleNamespace(id=str(uuid.uuid4()), cards=[SimpleNamespace(id=str(uuid.uuid4()))])
+            return SimpleNamespace(user=entity, account=entity, card=entity, operation=entity)
+
+        return call
+
+
+def build_plan(users: int, top_up_operations: int, purchase_operations: int) -> SeedsPlan:
+    return SeedsPlan(users=SeedUsersPlan(
+        count=users,
+        debit_card_accounts=SeedAccountsPlan(
+            count=2,
+            top_up_operations=SeedOperationsPlan(count=top_up_operations),
+            purchase_operations=SeedOperationsPlan(count=purchase_operations)
+        )
+    ))
+
+
+def test_concurrency_bounds_requests_in_flight():
+    channel = FakeChannel()
+    builder = AsyncSeedsBuilder(build_channel=lambda: channel, concurrency=4)
+
+    result = builder.build(build_plan(users=20, top_up_operations=5, purchase_operations=0))
+
+    assert len(result.users) == 20
+    assert channel.max_in_flight == 4
+    assert channel.closed
+
+
+def test_failure_budget_cancels_remaining_users_and_closes_channel():
+    channel = FakeChannel()
+    builder = AsyncSeedsBuilder(build_channel=lambda: channel, concurrency=4, retry_attempts=0,
+                                max_failed_users_ratio=0)
+
+    with pytest.raises(SeedsFailureBudgetExceededError):
+        builder.build(build_plan(users=20, top_up_operations=10, purchase_operations=1))
+
+    assert channel.in_flight == 0
+    # Бюджет исчерпан на первых пользователях: остальные не начаты, начатые запросы отменены
+    assert channel.calls["CreateUser"] < 20
+    assert channel.closed
@@ -0,0 +1,83 @@
+import uuid
+from types import SimpleNamespace
+
+import gevent
+import pytest
+
+from seeds.builder import SeedsBulider
+from seeds.retry import SeedsFailureBudgetExceededError
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan, SeedOperationsPlan
+
+
+class FakeGatewayClient:
+    """
+    Клиент gateway без стенда: считает вызовы, каждый запрос занимает `delay` секунд,
+    make_purchase_operation падает.
+    """
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.calls = 0
+
+    def request(self, **kwargs) -> SimpleNamespace:
+        gevent.sleep(self.delay)
+        self.calls += 1
+        entity = SimpleNamespace(id=str(uuid.uuid4()), cards=[SimpleNamespace(id=str(uuid.uuid4()))])
+        return SimpleNamespace(user=entity, account=entity, card=entity, operation=entity)
+
+    def make_purchase_operation(self, **kwargs):
+        gevent.sleep(self.delay / 2)
+        raise RuntimeError("purchase failed")
+
+    def __getattr__(self, name: str):
+        return self.request
+
+
+def build_seeds_builder(client: FakeGatewayClient, workers: int) -> SeedsBulider:
+    return SeedsBulider(
+        users_gateway_client=client,
+        cards_gateway_client=client,
+        accounts_gateway_client=client,
+        operations_gateway_client=client,
+        workers=workers,
+        retry_attempts=0,
+        max_failed_users_ratio=0,
+        pipeline_depth=0
+    )
+
+
+def build_plan(users: int, top_up_operations: int, purchase_operations: int) -> SeedsPlan:
+    return SeedsPlan(users=SeedUsersPlan(
+        count=users,
+        debit_card_accounts=SeedAccountsPlan(
+            count=2,
+            top_up_operations=SeedOperationsPlan(count=top_up_operations),
+            purchase_operations=SeedOperationsPlan(count=purchase_operations)
+        )
+    ))
+
+
+def test_failure_budget_stops_remaining_users():
+    client = FakeGatewayClient()
+    builder = build_seeds_builder(client, workers=4)
+
+    with pytest.raises(SeedsFailureBudgetExceededError):
+        builder.build(build_plan(users=20, top_up_operations=3, purchase_operations=1))
+
+    calls = client.calls
+    gevent.sleep(0.2)
+    assert client.calls == calls
+    assert calls < 20
+
+
+def test_failed_user_stops_its_other_entities():
+    client = FakeGatewayClient(delay=0.05)
+    builder = build_seeds_builder(client, workers=2)
+
+    with pytest.raises(SeedsFailureBudgetExceededError):
+        builder.build(build_plan(users=1, top_up_operations=10, purchase_operations=1))
+
+    # Пользователь и два счёта созданы, пополнения не успели завершиться до ошибки покупки
+    calls = client.calls
+    gevent.sleep(0.2)
+    assert client.calls == calls == 3
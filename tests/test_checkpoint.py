@@ -0,0 +1,29 @@
+import uuid
+
+from seeds.dumps import append_seeds_checkpoint, get_seeds_checkpoint_file_path, load_seeds_checkpoint
+from seeds.schema.result import SeedUserResult
+
+FINGERPRINT = "0" * 64
+
+
+def build_user() -> SeedUserResult:
+    return SeedUserResult.model_validate({
+        "user_id": str(uuid.uuid4()),
+        "debit_card_accounts": [{"account_id": str(uuid.uuid4()), "physical_cards": [{"card_id": str(uuid.uuid4())}]}]
+    })
+
+
+def test_resume_after_crash_mid_write(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    users = [build_user() for _ in range(3)]
+    for user in users[:2]:
+        append_seeds_checkpoint(user, "test", FINGERPRINT)
+
+    # Процесс упал посреди записи третьего пользователя
+    with open(get_seeds_checkpoint_file_path("test", FINGERPRINT), "a", encoding="utf-8") as file:
+        file.write(users[2].model_dump_json()[:40])
+
+    assert load_seeds_checkpoint("test", FINGERPRINT) == users[:2]
+
+    append_seeds_checkpoint(users[2], "test", FINGERPRINT)
+    assert load_seeds_checkpoint("test", FINGERPRINT) == users
@@ -0,0 +1,65 @@
+import uuid
+
+import pytest
+
+from seeds.compact import CompactSeedsResult
+from seeds.dumps import load_binary_seeds_results, save_binary_seeds_results
+from seeds.schema.result import SeedUserResult
+
+
+def build_user(accounts: int = 2, operations: int = 3) -> dict:
+    return {
+        "user_id": str(uuid.uuid4()),
+        "credit_card_accounts": [
+            {
+                "account_id": str(uuid.uuid4()),
+                "physical_cards": [{"card_id": str(uuid.uuid4())}],
+                "purchase_operations": [{"operation_id": str(uuid.uuid4())} for _ in range(operations)]
+            }
+            for _ in range(accounts)
+        ],
+        "deposit_accounts": [{"account_id": str(uuid.uuid4())}]
+    }
+
+
+@pytest.fixture
+def users() -> list[dict]:
+    return [build_user(accounts=index % 3 + 1, operations=index) for index in range(10)]
+
+
+def test_binary_dump_round_trip(tmp_path, monkeypatch, users):
+    monkeypatch.chdir(tmp_path)
+    save_binary_seeds_results(CompactSeedsResult.from_users(users), "test")
+
+    store = load_binary_seeds_results("test")
+    assert isinstance(store.user_account_offsets, memoryview)
+    assert len(store) == len(users)
+
+    for index, user in enumerate(users):
+        assert store.to_result().users[index] == SeedUserResult.model_validate(user)
+
+    assert store.users[4].credit_card_accounts[1].purchase_operations[3].operation_id == (
+        users[4]["credit_card_accounts"][1]["purchase_operations"][3]["operation_id"]
+    )
+
+
+def test_binary_dump_reseed_appends_to_mapped_store(tmp_path, monkeypatch, users):
+    monkeypatch.chdir(tmp_path)
+    save_binary_seeds_results(CompactSeedsResult.from_users(users), "test")
+
+    store = load_binary_seeds_results("test")
+    extra = [SeedUserResult.model_validate(build_user()) for _ in range(2)]
+    store.attach_dispenser("reseed", reseed=lambda: extra)
+
+    leased = [store.get_next_user() for _ in range(len(users) + len(extra))]
+    assert [user.index for user in leased] == list(range(len(users) + len(extra)))
+    assert store.buffer is None
+    assert leased[-1].user_id == extra[-1].user_id
+    assert store.dump_user(len(users)) == extra[0].model_dump()
+    assert store.dump_user(3) == SeedUserResult.model_validate(users[3]).model_dump()
+
+    save_binary_seeds_results(store, "test")
+    reloaded = load_binary_seeds_results("test")
+    assert [reloaded.dump_user(index) for index in range(len(reloaded))] == [
+        store.dump_user(index) for index in range(len(store))
+    ]
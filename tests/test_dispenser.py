@@ -0,0 +1,44 @@
+import pytest
+
+from seeds.dispenser import SeedsDispenser, SeedsExhaustedError
+
+
+def test_range_pool_is_not_materialized():
+    dispenser = SeedsDispenser(range(1_000_000))
+
+    assert [dispenser.lease() for _ in range(3)] == [0, 1, 2]
+    dispenser.release(1)
+    assert isinstance(dispenser.items, range)
+    assert len(dispenser.released) == 1
+    assert dispenser.stats.available == 1_000_000 - 2
+
+
+def test_released_users_are_leased_after_fresh_ones():
+    dispenser = SeedsDispenser(range(3))
+
+    first = dispenser.lease()
+    dispenser.release(first)
+
+    assert [dispenser.lease() for _ in range(3)] == [1, 2, 0]
+    with pytest.raises(SeedsExhaustedError):
+        dispenser.lease()
+
+
+def test_reseed_extends_range_pool():
+    def reseed() -> range:
+        return range(len(dispenser.items), len(dispenser.items) + 2)
+
+    dispenser = SeedsDispenser(range(2), policy="reseed", reseed=reseed)
+
+    assert [dispenser.lease() for _ in range(6)] == [0, 1, 2, 3, 4, 5]
+    assert dispenser.items == range(6)
+    assert dispenser.stats.reseeds == 2
+
+
+def test_wrap_reuses_pool_in_order():
+    dispenser = SeedsDispenser(["a", "b"], policy="wrap")
+
+    assert [dispenser.lease() for _ in range(5)] == ["a", "b", "a", "b", "a"]
+    assert dispenser.stats.wrapped_leases == 3
+    dispenser.extend(["c"])
+    assert dispenser.lease() == "c"
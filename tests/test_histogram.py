@@ -0,0 +1,81 @@
+import math
+import random
+
+import pytest
+
+from tools.histogram import LatencyHistogram
+
+PERCENTILES = [0, 1, 25, 50, 75, 90, 99, 99.9, 99.99, 100]
+
+
+def get_reference_percentile(values: list[int], percentile: float) -> int:
+    return values[max(math.ceil(percentile / 100 * len(values)), 1) - 1]
+
+
+@pytest.mark.parametrize("significant_figures", [2, 3, 4])
+def test_percentiles_match_sorted_reference(significant_figures):
+    generator = random.Random(significant_figures)
+    values = [round(generator.lognormvariate(9, 1.5)) for _ in range(20_000)] + [0, 1, 2_000]
+
+    histogram = LatencyHistogram(highest_value=60_000_000, significant_figures=significant_figures)
+    for value in values:
+        histogram.record(value)
+
+    values.sort()
+    assert histogram.total_count == len(values)
+    assert histogram.max_value == values[-1]
+
+    for percentile in PERCENTILES:
+        reference = get_reference_percentile(values, percentile)
+        value = histogram.get_value_at_percentile(percentile)
+        assert reference <= value <= reference * (1 + 10 ** -significant_figures), percentile
+
+
+def test_values_above_highest_value_are_clamped():
+    histogram = LatencyHistogram(highest_value=1_000, significant_figures=2)
+    histogram.record(5_000)
+
+    assert histogram.max_value == 1_000
+    assert histogram.get_value_at_percentile(100) == 1_000
+
+
+def test_dump_merge_dump_round_trip():
+    generator = random.Random(0)
+    first, second = LatencyHistogram(), LatencyHistogram()
+    for value in (generator.randrange(100, 5_000_000) for _ in range(5_000)):
+        first.record(value)
+    for value in (generator.randrange(100, 50_000) for _ in range(5_000)):
+        second.record(value)
+
+    merged = LatencyHistogram()
+    merged.merge_dump(first.dump())
+    merged.merge_dump(second.dump())
+
+    expected = LatencyHistogram()
+    expected.merge(first)
+    expected.merge(second)
+
+    assert merged.counts == expected.counts
+    assert merged.total_count == first.total_count + second.total_count
+    assert merged.max_value == max(first.max_value, second.max_value)
+    for percentile in PERCENTILES:
+        assert merged.get_value_at_percentile(percentile) == expected.get_value_at_percentile(percentile)
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        LatencyHistogram(highest_value=60_000_000, significant_figures=2),
+        LatencyHistogram(highest_value=1_000_000, significant_figures=3),
+    ]
+)
+def test_merge_rejects_incompatible_histogram(other):
+    histogram = LatencyHistogram(highest_value=60_000_000, significant_figures=3)
+    other.record(1_000)
+
+    with pytest.raises(ValueError):
+        histogram.merge(other)
+    with pytest.raises(ValueError):
+        histogram.merge_dump(other.dump())
+
+    assert histogram.total_count == 0
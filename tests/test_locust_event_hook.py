@@ -0,0 +1,52 @@
+import gzip
+from types import SimpleNamespace
+
+import pytest
+from httpx import ByteStream, Client, MockTransport, Response
+
+from clients.http.event_hooks.locust_event_hook import locust_request_event_hook, locust_response_event_hook
+
+BODY = b'{"operations": []}' * 100
+
+
+class FakeRequestEvent:
+    def __init__(self):
+        self.calls = []
+
+    def fire(self, **kwargs):
+        self.calls.append(kwargs)
+
+
+def build_client(mode: str) -> tuple[Client, FakeRequestEvent]:
+    request_event = FakeRequestEvent()
+    environment = SimpleNamespace(events=SimpleNamespace(request=request_event))
+    content = gzip.compress(BODY)
+
+    def handler(_):
+        headers = {"Content-Encoding": "gzip", "Content-Length": str(len(content))}
+        return Response(200, stream=ByteStream(content), headers=headers)
+
+    client = Client(
+        base_url="http://gateway",
+        transport=MockTransport(handler),
+        event_hooks={
+            "request": [locust_request_event_hook],
+            "response": [locust_response_event_hook(environment, mode=mode)]
+        }
+    )
+    return client, request_event
+
+
+@pytest.mark.parametrize(
+    "mode, expected_length",
+    [("body", len(BODY)), ("stream", len(gzip.compress(BODY))), ("headers", len(gzip.compress(BODY)))]
+)
+def test_response_length_by_mode(mode, expected_length):
+    client, request_event = build_client(mode)
+
+    response = client.get("/api/v1/operations", extensions={"route": "/api/v1/operations"})
+
+    assert response.content == BODY
+    assert len(request_event.calls) == 1
+    assert request_event.calls[0]["name"] == "GET /api/v1/operations"
+    assert request_event.calls[0]["response_length"] == expected_length
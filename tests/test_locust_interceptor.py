@@ -0,0 +1,30 @@
+from types import SimpleNamespace
+
+from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
+from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserResponse
+
+
+class FakeRequestEvent:
+    def __init__(self):
+        self.calls = []
+
+    def fire(self, **kwargs):
+        self.calls.append(kwargs)
+
+
+def test_sampled_mode_reports_zero_for_unsampled_calls():
+    request_event = FakeRequestEvent()
+    environment = SimpleNamespace(events=SimpleNamespace(request=request_event))
+    interceptor = LocustInterceptor(environment, response_size_mode="sampled", response_size_sample_rate=3)
+
+    response = GetUserResponse()
+    response.user.id = "user-id"
+    response.user.email = "user@example.com"
+    call = SimpleNamespace(result=lambda: response)
+    details = SimpleNamespace(method="/gateway.UsersGatewayService/GetUser")
+
+    for _ in range(6):
+        interceptor.intercept_unary_unary(lambda *_: call, details, None)
+
+    size = response.ByteSize()
+    assert [fired["response_length"] for fired in request_event.calls] == [size, 0, 0, size, 0, 0]
@@ -0,0 +1,61 @@
+import io
+
+from tools.samples import SAMPLE_LOG_MAGIC, SampleBlock, read_sample_blocks
+
+NAMES = [("GET", "/api/v1/users"), ("POST", "/api/v1/accounts"), ("GET", "/api/v1/documents")]
+
+
+def build_sample_log(worker: int, blocks: int, block_size: int = 10) -> bytes:
+    """
+    Журнал, как его пишет SampleLogWriter: имя передаётся только в первом блоке, где оно встретилось.
+    """
+    chunks, name_ids = [SAMPLE_LOG_MAGIC], {}
+    for block_index in range(blocks):
+        block = SampleBlock()
+        for index in range(block_index * block_size, (block_index + 1) * block_size):
+            key = NAMES[index % len(NAMES)]
+            if key not in name_ids:
+                name_ids[key] = len(name_ids)
+                block.names[name_ids[key]] = key
+
+            block.append(1_700_000_000 + index, name_ids[key], index, index * 2, index % 2, worker)
+
+        chunks.append(block.encode())
+
+    return b"".join(chunks)
+
+
+def read_sample_log(content: bytes) -> list[tuple]:
+    names, samples = {}, []
+    for block in read_sample_blocks(io.BytesIO(content)):
+        names.update(block.names)
+        columns = block.columns
+        for index in range(len(block)):
+            samples.append((
+                names[columns["name_id"][index]],
+                columns["timestamp"][index],
+                columns["response_time"][index],
+                columns["response_length"][index],
+                columns["status"][index],
+                columns["worker"][index]
+            ))
+
+    return samples
+
+
+def test_sample_log_round_trip():
+    samples = read_sample_log(build_sample_log(worker=70_000, blocks=3))
+
+    assert len(samples) == 30
+    assert samples[0] == (NAMES[0], 1_700_000_000, 0, 0, 0, 70_000)
+    assert samples[29] == (NAMES[2], 1_700_000_029, 29, 58, 1, 70_000)
+
+
+def test_truncated_last_block_is_skipped():
+    content = build_sample_log(worker=1, blocks=3)
+
+    samples = read_sample_log(content[:-5])
+    assert len(samples) == 20
+    # Блоки после первого ссылаются на имена, переданные в первом блоке
+    assert [sample[0] for sample in samples] == [NAMES[index % len(NAMES)] for index in range(20)]
+    assert samples[-1] == (NAMES[1], 1_700_000_019, 19, 38, 1, 1)
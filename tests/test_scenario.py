@@ -0,0 +1,35 @@
+from config import settings
+from seeds.scenario import SeedsScenario
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan
+from tools.config.grpc import GRPCClientConfig
+
+
+class FakeSeedsScenario(SeedsScenario):
+    plan = SeedsPlan(users=SeedUsersPlan(count=10))
+    scenario = "fake"
+
+    def __init__(self):
+        # Билдер для отпечатка не нужен
+        pass
+
+
+def test_fingerprint_follows_backend_urls(monkeypatch):
+    scenario = FakeSeedsScenario()
+    for name, port in [("users", 9101), ("accounts", 9102), ("cards", 9103), ("operations", 9104)]:
+        monkeypatch.setattr(settings, f"{name}_grpc_client", GRPCClientConfig(host="localhost", port=port))
+
+    monkeypatch.setattr(settings.seeds, "backend", "sync")
+    gateway_fingerprint = scenario.fingerprint
+
+    monkeypatch.setattr(settings.seeds, "backend", "services")
+    services_fingerprint = scenario.fingerprint
+    assert scenario.stand_urls == ["localhost:9101", "localhost:9102", "localhost:9103", "localhost:9104"]
+    assert services_fingerprint != gateway_fingerprint
+
+    monkeypatch.setattr(settings, "cards_grpc_client", GRPCClientConfig(host="localhost", port=9203))
+    assert scenario.fingerprint != services_fingerprint
+
+    # Адрес gateway не влияет на отпечаток данных, созданных напрямую в сервисах
+    monkeypatch.setattr(settings, "cards_grpc_client", GRPCClientConfig(host="localhost", port=9103))
+    monkeypatch.setattr(settings, "gateway_grpc_client", GRPCClientConfig(host="stand", port=9003))
+    assert scenario.fingerprint == services_fingerprint
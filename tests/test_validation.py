@@ -0,0 +1,18 @@
+import pytest
+from pydantic import ValidationError
+
+from clients.http.validation import DiscardedResponseError, parse_model
+from tools.config.http import HTTPClientConfig
+from clients.http.gateway.users.schema import CreateUserResponseSchema
+
+
+def test_none_mode_fails_fast_on_field_access():
+    response = parse_model(CreateUserResponseSchema, b"{}", "none")
+
+    with pytest.raises(DiscardedResponseError, match="CreateUserResponseSchema"):
+        _ = response.user
+
+
+def test_none_mode_is_not_a_global_option():
+    with pytest.raises(ValidationError):
+        HTTPClientConfig(url="http://localhost:8003", validation_mode="none")
@@ -0,0 +1,453 @@
+"""
+Офлайн-анализ артефактов прогонов: CSV истории статистики Locust (*_stats_history.csv, --csv-full-history)
+и журналов сырых замеров (*_samples*.bin, STATS.SAMPLE_LOG).
+
+    python -m tools.analytics history locust_a_stats_history.csv locust_b_stats_history.csv --csv compare
+    python -m tools.analytics samples locust_samples_0.bin locust_samples_1.bin --interval 1 --csv run
+
+Данные загружаются в колонки (array), по каждому запросу считаются пропускная способность и задержки во времени,
+доля ошибок и точка насыщения (knee) — уровень нагрузки с максимальной «мощностью» системы (пропускная
+способность / медианная задержка, по Клейнроку): дальше рост нагрузки даёт больше задержки, чем пропускной способности.
+
+Каждый CSV истории — отдельный прогон (для сравнения прогонов). Журналы замеров — один прогон (файлы воркеров
+объединяются); они читаются поблочно, каждый блок агрегируется целиком средствами numpy, а задержки по интервалам
+хранятся в разреженных HDR-гистограммах, поэтому память зависит от длительности прогона и числа запросов,
+но не от количества замеров.
+"""
+import argparse
+import csv
+import math
+import os
+from array import array
+from datetime import datetime
+
+import numpy as np
+
+from tools.histogram import LatencyHistogram
+from tools.samples import RequestName, SampleBlock, read_sample_blocks
+from tools.tables import format_table
+
+# Имя строки с суммой по всем запросам, как в таблицах Locust
+AGGREGATED_NAME = "Aggregated"
+# Колонки CSV истории, загружаемые в массивы
+HISTORY_COLUMNS = (
+    "Timestamp",
+    "User Count",
+    "Requests/s",
+    "Failures/s",
+    "50%",
+    "99%",
+    "Total Request Count",
+    "Total Failure Count"
+)
+TIMELINE_PERCENTILES = (50, 90, 99)
+
+# Квантование задержек: 2 значащие цифры (погрешность до 1%), до часа
+LATENCY_QUANTIZER = LatencyHistogram(highest_value=3_600_000_000, significant_figures=2)
+
+Columns = dict[str, array]
+
+
+def get_latency_indices(response_times: np.ndarray) -> np.ndarray:
+    """
+    Индексы подкорзин LATENCY_QUANTIZER для массива времён ответа (мс), как у LatencyHistogram.get_index.
+    """
+    values = np.clip(np.rint(response_times.astype(np.float64) * 1000), 0, LATENCY_QUANTIZER.highest_value)
+    values = values.astype(np.int64)
+    magnitude = LATENCY_QUANTIZER.sub_bucket_half_count_magnitude
+    # frexp возвращает показатель степени, равный bit_length целого числа (точно для значений меньше 2^53)
+    bucket_indices = np.frexp((values | LATENCY_QUANTIZER.sub_bucket_mask).astype(np.float64))[1] - (magnitude + 1)
+    return ((bucket_indices + 1) << magnitude) + (values >> bucket_indices) - LATENCY_QUANTIZER.sub_bucket_half_count
+
+
+def parse_float(value: str) -> float:
+    return float(value) if value not in ("", "N/A") else math.nan
+
+
+def format_float(value: float) -> float | str:
+    return "N/A" if math.isnan(value) else value
+
+
+def get_run_name(path: str) -> str:
+    return os.path.basename(path).removesuffix(".csv").removesuffix("_stats_history")
+
+
+def find_knee(load: list[float], throughput: list[float], latency: list[float]) -> int | None:
+    """
+    Возвращает индекс уровня нагрузки с максимальной мощностью (пропускная способность / задержка)
+    или None, если уровней меньше трёх и точку насыщения не определить.
+    """
+    power = [
+        rps / latency_ms if latency_ms > 0 and not math.isnan(latency_ms) else math.nan
+        for rps, latency_ms in zip(throughput, latency)
+    ]
+    candidates = [index for index, value in enumerate(power) if not math.isnan(value)]
+    if len(set(load[index] for index in candidates)) < 3:
+        return None
+
+    return max(candidates, key=lambda index: power[index])
+
+
+def load_stats_history(path: str) -> dict[RequestName, Columns]:
+    """
+    Загружает CSV истории статистики Locust в колонки по каждому запросу (тип, имя).
+    """
+    requests: dict[RequestName, Columns] = {}
+    with open(path, newline="") as file:
+        for row in csv.DictReader(file):
+            key = (row["Type"], row["Name"])
+            if key not in requests:
+                requests[key] = {column: array("d") for column in HISTORY_COLUMNS}
+
+            for column, values in requests[key].items():
+                values.append(parse_float(row.get(column, "")))
+
+    return requests
+
+
+def get_history_rows(run: str, requests: dict[RequestName, Columns]) -> list[dict[str, str | int | float]]:
+    """
+    Сводка прогона по запросам: длительность, средняя и пиковая пропускная способность, задержки, доля ошибок.
+    """
+    rows = []
+    for (request_type, name), columns in sorted(requests.items(), key=lambda item: item[0][1] == AGGREGATED_NAME):
+        active = [index for index, rps in enumerate(columns["Requests/s"]) if rps > 0]
+        if not active:
+            continue
+
+        total_requests = columns["Total Request Count"][-1]
+        total_failures = columns["Total Failure Count"][-1]
+        p50 = [columns["50%"][index] for index in active if not math.isnan(columns["50%"][index])]
+        p99 = [columns["99%"][index] for index in active if not math.isnan(columns["99%"][index])]
+        rows.append({
+            "Run": run,
+            "Type": request_type,
+            "Name": name,
+            "Duration, s": int(columns["Timestamp"][active[-1]] - columns["Timestamp"][active[0]]),
+            "Requests": int(total_requests),
+            "Avg RPS": round(sum(columns["Requests/s"][index] for index in active) / len(active), 2),
+            "Peak RPS": round(max(columns["Requests/s"][index] for index in active), 2),
+            "Median 50%": round(sorted(p50)[len(p50) // 2], 1) if p50 else "N/A",
+            "Max 99%": round(max(p99), 1) if p99 else "N/A",
+            "Error Rate, %": round(total_failures / total_requests * 100, 3) if total_requests else 0.0
+        })
+
+    return rows
+
+
+def get_history_knee(requests: dict[RequestName, Columns]) -> dict[str, float] | None:
+    """
+    Точка насыщения по строкам Aggregated: строки группируются по числу пользователей.
+    """
+    columns = requests.get(("", AGGREGATED_NAME))
+    if columns is None:
+        return None
+
+    levels: dict[float, list[tuple[float, float]]] = {}
+    for users, rps, p50 in zip(columns["User Count"], columns["Requests/s"], columns["50%"]):
+        if users > 0 and rps > 0 and not math.isnan(p50):
+            levels.setdefault(users, []).append((rps, p50))
+
+    users = sorted(levels)
+    throughput = [sum(rps for rps, _ in levels[level]) / len(levels[level]) for level in users]
+    latency = [sum(p50 for _, p50 in levels[level]) / len(levels[level]) for level in users]
+    knee = find_knee(users, throughput, latency)
+    if knee is None:
+        return None
+
+    return {"users": int(users[knee]), "rps": round(throughput[knee], 2), "p50": round(latency[knee], 1)}
+
+
+class TimelineBucket:
+    """
+    Замеры запроса за интервал времени.
+
+    Attributes:
+        count: Количество запросов
+        failures: Количество ошибок
+        response_length: Суммарный размер ответов, байт
+        latency_indices: Непустые подкорзины LATENCY_QUANTIZER по возрастанию (разреженная гистограмма задержек)
+        latency_counts: Количество задержек в каждой из latency_indices
+    """
+    __slots__ = ("count", "failures", "response_length", "latency_indices", "latency_counts")
+
+    def __init__(self):
+        self.count = 0
+        self.failures = 0
+        self.response_length = 0
+        self.latency_indices = np.empty(0, dtype=np.int64)
+        self.latency_counts = np.empty(0, dtype=np.int64)
+
+    def add_latencies(self, indices: np.ndarray, counts: np.ndarray) -> None:
+        """
+        Добавляет задержки: `counts[i]` значений в подкорзину `indices[i]` (индексы уникальны и отсортированы).
+        """
+        if not len(self.latency_indices):
+            self.latency_indices, self.latency_counts = indices, counts
+            return
+
+        indices, positions = np.unique(np.concatenate((self.latency_indices, indices)), return_inverse=True)
+        merged_counts = np.zeros(len(indices), dtype=np.int64)
+        np.add.at(merged_counts, positions, np.concatenate((self.latency_counts, counts)))
+        self.latency_indices, self.latency_counts = indices, merged_counts
+
+    def merge(self, other: "TimelineBucket") -> None:
+        self.count += other.count
+        self.failures += other.failures
+        self.response_length += other.response_length
+        self.add_latencies(other.latency_indices, other.latency_counts)
+
+    def get_percentile_ms(self, percentile: float) -> float:
+        if not len(self.latency_indices):
+            return 0.0
+
+        target = max(math.ceil(percentile / 100 * self.count), 1)
+        position = min(int(np.searchsorted(np.cumsum(self.latency_counts), target)), len(self.latency_indices) - 1)
+        return LATENCY_QUANTIZER.get_value(int(self.latency_indices[position])) / 1000
+
+
+class SampleTimeline:
+    """
+    Агрегация журналов замеров по интервалам времени и запросам.
+
+    Attributes:
+        interval: Ширина интервала, с
+        files: Количество добавленных файлов
+        names: Имена запросов по (номер файла, id имени)
+        buckets: Интервалы: (номер интервала, имя запроса) -> замеры
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.files = 0
+        self.names: dict[tuple[int, int], RequestName] = {}
+        self.buckets: dict[tuple[int, RequestName], TimelineBucket] = {}
+
+    def add_file(self, path: str) -> None:
+        file_index, self.files = self.files, self.files + 1
+        with open(path, "rb") as file:
+            for block in read_sample_blocks(file):
+                for name_id, name in block.names.items():
+                    self.names[(file_index, name_id)] = name
+
+                if len(block):
+                    self.add_block(file_index, block)
+
+    def add_block(self, file_index: int, block: SampleBlock) -> None:
+        """
+        Добавляет замеры блока: группирует их по (интервал, id имени, подкорзина задержки) без цикла по замерам.
+        """
+        columns = {column: np.frombuffer(values, dtype=values.typecode) for column, values in block.columns.items()}
+
+        bucket_indices = (columns["timestamp"] // self.interval).astype(np.int64)
+        first_bucket_index = int(bucket_indices.min())
+        name_ids = columns["name_id"].astype(np.int64)
+        names_count = int(name_ids.max()) + 1
+
+        # Группа замера — пара (интервал, id имени), упакованная в одно число
+        group_keys, groups = np.unique((bucket_indices - first_bucket_index) * names_count + name_ids, return_inverse=True)
+        counts = np.bincount(groups)
+        failures = np.bincount(groups, weights=columns["status"])
+        response_lengths = np.bincount(groups, weights=columns["response_length"])
+
+        buckets = []
+        for group, key in enumerate(group_keys.tolist()):
+            bucket_index, name_id = divmod(key, names_count)
+            key = (first_bucket_index + bucket_index, self.names[(file_index, name_id)])
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                bucket = self.buckets[key] = TimelineBucket()
+
+            bucket.count += int(counts[group])
+            bucket.failures += int(failures[group])
+            bucket.response_length += int(response_lengths[group])
+            buckets.append(bucket)
+
+        # Ключи (группа, подкорзина задержки) после np.unique отсортированы, поэтому задержки группы идут подряд
+        latencies_count = len(LATENCY_QUANTIZER.counts)
+        latency_keys, latency_counts = np.unique(
+            groups * latencies_count + get_latency_indices(columns["response_time"]),
+            return_counts=True
+        )
+        latency_groups, latency_indices = np.divmod(latency_keys, latencies_count)
+        splits = np.flatnonzero(np.diff(latency_groups)) + 1
+        for group, indices, counts in zip(
+                latency_groups[np.concatenate(([0], splits))].tolist(),
+                np.split(latency_indices, splits),
+                np.split(latency_counts.astype(np.int64), splits)
+        ):
+            buckets[group].add_latencies(indices, counts)
+
+    def get_requests(self) -> dict[RequestName, dict[int, TimelineBucket]]:
+        """
+        Интервалы по запросам, плюс строка Aggregated по всем запросам.
+        """
+        requests: dict[RequestName, dict[int, TimelineBucket]] = {}
+        for (bucket_index, name), bucket in self.buckets.items():
+            requests.setdefault(name, {})[bucket_index] = bucket
+            aggregated = requests.setdefault(("", AGGREGATED_NAME), {})
+            aggregated.setdefault(bucket_index, TimelineBucket()).merge(bucket)
+
+        return requests
+
+    def get_timeline_rows(self, requests: dict[RequestName, dict[int, TimelineBucket]]) -> list[dict]:
+        rows = []
+        for (request_type, name), buckets in requests.items():
+            for bucket_index in sorted(buckets):
+                bucket = buckets[bucket_index]
+                row = {
+                    "Timestamp": bucket_index * self.interval,
+                    "Type": request_type,
+                    "Name": name,
+                    "Requests/s": round(bucket.count / self.interval, 2),
+                    "Failures/s": round(bucket.failures / self.interval, 2),
+                    "Error Rate, %": round(bucket.failures / bucket.count * 100, 3)
+                }
+                for percentile in TIMELINE_PERCENTILES:
+                    row[f"{percentile}%"] = round(bucket.get_percentile_ms(percentile), 1)
+
+                row["Average Content Size"] = round(bucket.response_length / bucket.count)
+                rows.append(row)
+
+        return rows
+
+    def get_summary_rows(self, requests: dict[RequestName, dict[int, TimelineBucket]]) -> list[dict]:
+        rows = []
+        for (request_type, name), buckets in sorted(requests.items(), key=lambda item: item[0][1] == AGGREGATED_NAME):
+            total = TimelineBucket()
+            for bucket in buckets.values():
+                total.merge(bucket)
+
+            duration = (max(buckets) - min(buckets) + 1) * self.interval
+            rows.append({
+                "Type": request_type,
+                "Name": name,
+                "Requests": total.count,
+                "Avg RPS": round(total.count / duration, 2),
+                "Peak RPS": round(max(bucket.count for bucket in buckets.values()) / self.interval, 2),
+                "50%": round(total.get_percentile_ms(50), 1),
+                "99%": round(total.get_percentile_ms(99), 1),
+                "99.9%": round(total.get_percentile_ms(99.9), 1),
+                "Error Rate, %": round(total.failures / total.count * 100, 3),
+                "Worst Interval Error Rate, %": round(
+                    max(bucket.failures / bucket.count for bucket in buckets.values()) * 100, 3
+                )
+            })
+
+        return rows
+
+    def get_knee(self, requests: dict[RequestName, dict[int, TimelineBucket]]) -> dict[str, float] | None:
+        """
+        Точка насыщения по интервалам (все запросы вместе): нагрузкой служит пропускная способность интервала.
+        """
+        buckets = requests.get(("", AGGREGATED_NAME), {})
+        indices = sorted(buckets)
+        throughput = [buckets[index].count / self.interval for index in indices]
+        latency = [buckets[index].get_percentile_ms(50) for index in indices]
+        knee = find_knee(throughput, throughput, latency)
+        if knee is None:
+            return None
+
+        return {
+            "timestamp": indices[knee] * self.interval,
+            "offset": (indices[knee] - indices[0]) * self.interval,
+            "rps": round(throughput[knee], 2),
+            "p50": round(latency[knee], 1)
+        }
+
+
+def write_csv(path: str, rows: list[dict]) -> None:
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def analyze_history(paths: list[str], csv_prefix: str | None) -> None:
+    summary_rows, knee_rows, timeline_rows = [], [], []
+    for path in paths:
+        run = get_run_name(path)
+        requests = load_stats_history(path)
+        summary_rows.extend(get_history_rows(run, requests))
+
+        knee = get_history_knee(requests)
+        knee_rows.append({
+            "Run": run,
+            "Knee Users": knee["users"] if knee else "N/A",
+            "Knee RPS": knee["rps"] if knee else "N/A",
+            "Knee 50%": knee["p50"] if knee else "N/A"
+        })
+
+        for (request_type, name), columns in requests.items():
+            for index in range(len(columns["Timestamp"])):
+                rps, failures = columns["Requests/s"][index], columns["Failures/s"][index]
+                timeline_rows.append({
+                    "Run": run,
+                    "Timestamp": int(columns["Timestamp"][index]),
+                    "Type": request_type,
+                    "Name": name,
+                    "User Count": int(columns["User Count"][index]),
+                    "Requests/s": rps,
+                    "Error Rate, %": round(failures / rps * 100, 3) if rps else 0.0,
+                    "50%": format_float(columns["50%"][index]),
+                    "99%": format_float(columns["99%"][index])
+                })
+
+    if summary_rows:
+        print(format_table(summary_rows), end="\n\n")
+
+    print("Saturation knee (max throughput / median latency by user count):")
+    print(format_table(knee_rows))
+
+    if csv_prefix and summary_rows:
+        write_csv(f"{csv_prefix}_summary.csv", summary_rows)
+        write_csv(f"{csv_prefix}_timeline.csv", timeline_rows)
+
+
+def analyze_samples(paths: list[str], interval: float, csv_prefix: str | None) -> None:
+    timeline = SampleTimeline(interval)
+    for path in paths:
+        timeline.add_file(path)
+
+    requests = timeline.get_requests()
+    if not requests:
+        print("No samples")
+        return
+
+    print(format_table(timeline.get_summary_rows(requests)), end="\n\n")
+
+    knee = timeline.get_knee(requests)
+    if knee:
+        knee_time = datetime.fromtimestamp(knee["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
+        print(f"Saturation knee (max throughput / median latency by {interval:g}s interval): "
+              f"{knee['rps']} rps, p50 {knee['p50']}ms at {knee_time} (+{knee['offset']:g}s from the run start)")
+    else:
+        print("Saturation knee: not enough load levels")
+
+    if csv_prefix:
+        write_csv(f"{csv_prefix}_summary.csv", timeline.get_summary_rows(requests))
+        write_csv(f"{csv_prefix}_timeline.csv", timeline.get_timeline_rows(requests))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m tools.analytics", description=__doc__.split("\n\n")[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    history_parser = subparsers.add_parser("history", help="Compare runs by Locust *_stats_history.csv files")
+    history_parser.add_argument("paths", nargs="+")
+    history_parser.add_argument("--csv", dest="csv_prefix", help="Write <prefix>_summary.csv and <prefix>_timeline.csv")
+
+    samples_parser = subparsers.add_parser("samples", help="Analyze raw sample logs of one run (all worker files)")
+    samples_parser.add_argument("paths", nargs="+")
+    samples_parser.add_argument("--interval", type=float, default=1.0, help="Timeline interval, s")
+    samples_parser.add_argument("--csv", dest="csv_prefix", help="Write <prefix>_summary.csv and <prefix>_timeline.csv")
+
+    args = parser.parse_args(argv)
+    if args.command == "history":
+        analyze_history(args.paths, args.csv_prefix)
+    else:
+        analyze_samples(args.paths, args.interval, args.csv_prefix)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,8 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class FakeConfig(BaseModel):
+    mode: Literal["faker", "pooled"] = "faker"
+    pool_size: int = 10_000
@@ -1,9 +1,15 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
 
 class GRPCClientConfig(BaseModel):
     port: int
     host: str
+    channel_scope: Literal["client", "user", "process", "pool"] = "user"
+    channel_pool_size: int = 4
+    response_size_mode: Literal["bytesize", "sampled", "off"] = "bytesize"
+    response_size_sample_rate: int = 100
 
     @property
     def client_url(self) -> str:
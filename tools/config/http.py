@@ -1,10 +1,28 @@
+from typing import Literal
+
+from httpx import Limits
 from pydantic import BaseModel, HttpUrl
 
 
 class HTTPClientConfig(BaseModel):
     url: HttpUrl
     timeout: float = 100.0
+    pool_scope: Literal["client", "user", "process"] = "user"
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    metrics_mode: Literal["body", "stream", "headers"] = "body"
+    # none не допускается глобально: он задаётся явно для клиента или вызова, результат которого не используется
+    validation_mode: Literal["full", "lazy", "ids-only"] = "full"
 
     @property
     def client_url(self) -> str:
-        return str(self.url)
\ No newline at end of file
+        return str(self.url)
+
+    @property
+    def limits(self) -> Limits:
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
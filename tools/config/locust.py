@@ -1,5 +1,31 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
+
+class ArrivalStageConfig(BaseModel):
+    """
+    Этап ramping_arrival_rate: за `duration` секунд частота итераций линейно меняется до `target` в секунду.
+    """
+    duration: float
+    target: float
+
+
 class LocustUserConfig(BaseModel):
     wait_time_min: float = 1
-    wait_time_max: float = 3
\ No newline at end of file
+    wait_time_max: float = 3
+    # closed — как раньше: пауза wait_time_min..wait_time_max между итерациями пользователя.
+    # constant_arrival_rate / ramping_arrival_rate — открытая модель: итерации запускаются по расписанию
+    # с заданной частотой независимо от времени ответа, число пользователей подбирает ArrivalRateLoadShape.
+    load_model: Literal["closed", "constant_arrival_rate", "ramping_arrival_rate"] = "closed"
+    # Итераций в секунду для constant_arrival_rate и начальная частота для ramping_arrival_rate.
+    # Итерация — одна задача, для последовательных сценариев (SequentialTaskSet) — полный проход по их задачам
+    arrival_rate: float = 10
+    # Длительность теста для constant_arrival_rate, с
+    arrival_duration: float = 60
+    arrival_stages: list[ArrivalStageConfig] = []
+    # Слот расписания, опоздавший больше чем на столько секунд (все пользователи заняты), пропускается
+    arrival_max_lag: float = 1
+    pre_allocated_users: int = 10
+    max_users: int = 1000
+    spawn_rate: float = 100
@@ -0,0 +1,27 @@
+from typing import Literal
+
+from pydantic import BaseModel, PositiveInt
+
+
+class SeedsConfig(BaseModel):
+    # services создаёт данные в обход gateway: операции всегда COMPLETED, балансы счетов не обновляются (остаются 0)
+    backend: Literal["sync", "async", "services"] = "sync"
+    workers: int = 1
+    concurrency: int = 100
+    force_reseed: bool = False
+    cache_ttl: float | None = None
+    exhaustion_policy: Literal["wrap", "fail", "reseed"] = "fail"
+    reseed_batch: int = 100
+    storage: Literal["models", "compact"] = "models"
+    dump_format: Literal["json", "binary", "jsonl"] = "json"
+    compress: bool = False
+    initial_load: PositiveInt | None = None
+    metrics_interval: float = 10.0
+    metrics_export: list[Literal["csv", "prometheus"]] = []
+    retry_attempts: int = 3
+    retry_backoff: float = 0.1
+    retry_backoff_max: float = 5.0
+    max_failed_users_ratio: float = 0.1
+    pipeline_depth: int = 32
+    # Части сидинговых данных, которые мастер откладывает для воркеров, подключившихся после старта теста
+    spare_shards: int = 0
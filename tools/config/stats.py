@@ -0,0 +1,21 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class StatsConfig(BaseModel):
+    # Хранилище задержек по запросам (tools/locust/stats.py): hdr — HDR-гистограммы, locust — только штатная статистика
+    latency_store: Literal["locust", "hdr"] = "hdr"
+    # Перцентили в отчётах: и в штатных таблицах/CSV Locust, и в отчёте HDR-гистограмм
+    percentiles: list[float] = [0.50, 0.60, 0.70, 0.80, 0.90, 0.95, 0.99, 0.999, 0.9999, 1.0]
+    # Дополнительно считать задержки от запланированного начала итерации (только для открытой модели нагрузки)
+    corrected_latency: bool = False
+    # Точность и верхняя граница HDR-гистограмм задержек
+    histogram_significant_figures: int = 3
+    histogram_highest_value_ms: float = 60_000
+    # Период интервальных гистограмм, с
+    histogram_interval: float = 5
+    # Журнал сырых замеров каждого запроса (tools/locust/samples.py)
+    sample_log: bool = False
+    sample_log_buffer_size: int = 10_000
+    sample_log_flush_interval: float = 1
@@ -1,9 +1,34 @@
 import time
+import uuid
+from itertools import count, cycle
+from typing import Any, Callable, Hashable, Iterator
 
 from faker import Faker
 from faker.providers.python import TEnum
 from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
 
+from config import settings
+
+CATEGORIES = [
+    "gas",
+    "taxi",
+    "tolls",
+    "water",
+    "beauty",
+    "mobile",
+    "travel",
+    "parking",
+    "catalog",
+    "internet",
+    "satellite",
+    "education",
+    "government",
+    "healthcare",
+    "restaurants",
+    "electricity",
+    "supermarkets",
+]
+
 
 class Fake:
     """
@@ -52,25 +77,7 @@ class Fake:
 
         :return: Случайная категория (например, 'gas', 'taxi', 'supermarkets' и т.д.).
         """
-        return self.faker.random_element([
-            "gas",
-            "taxi",
-            "tolls",
-            "water",
-            "beauty",
-            "mobile",
-            "travel",
-            "parking",
-            "catalog",
-            "internet",
-            "satellite",
-            "education",
-            "government",
-            "healthcare",
-            "restaurants",
-            "electricity",
-            "supermarkets",
-        ])
+        return self.faker.random_element(CATEGORIES)
 
     def last_name(self) -> str:
         """
@@ -122,6 +129,163 @@ class Fake:
         """
         return self.float(1, 1000)
 
+    def card_number(self) -> str:
+        """
+        Генерирует случайный номер банковской карты.
+
+        :return: Номер карты.
+        """
+        return self.faker.credit_card_number()
+
+    def card_holder(self) -> str:
+        """
+        Генерирует случайное имя держателя карты.
+
+        :return: Имя и фамилия держателя.
+        """
+        return self.faker.name()
+
+    def pin(self) -> str:
+        """
+        Генерирует случайный PIN-код карты.
+
+        :return: PIN-код из 4 цифр.
+        """
+        return self.faker.numerify("####")
+
+    def cvv(self) -> str:
+        """
+        Генерирует случайный CVV-код карты.
+
+        :return: CVV-код из 3 цифр.
+        """
+        return self.faker.credit_card_security_code()
+
+    def expiry_date(self) -> str:
+        """
+        Генерирует случайный срок действия карты.
+
+        :return: Срок действия в формате MM/YY.
+        """
+        return self.faker.credit_card_expire()
+
+
+class PooledFake(Fake):
+    """
+    Генератор тестовых данных, который отдаёт заранее сгенерированные значения по кругу.
+
+    Faker медленный в пересчёте на один вызов, поэтому значения генерируются пачками
+    (при первом обращении к значению каждого вида, а для сценариев Locust — заранее, в warmup()
+    на старте теста) и дальше выдаются из кольцевого буфера за O(1). Email остаётся уникальным:
+    к значению из пула добавляется уникальный для процесса префикс и порядковый номер.
+    """
+
+    def __init__(self, faker: Faker, size: int = 10_000):
+        """
+        :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
+        :param size: Количество значений в каждом пуле.
+        """
+        super().__init__(faker)
+        self.size = size
+        self.pools: dict[Hashable, Iterator[Any]] = {}
+        self.email_prefix = uuid.uuid4().hex[:12]
+        self.email_counter = count()
+
+    def pool(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Возвращает следующее значение из пула; при первом обращении пул заполняется.
+
+        :param key: Ключ пула.
+        :param factory: Функция генерации одного значения.
+        :return: Значение из пула.
+        """
+        values = self.pools.get(key)
+        if values is None:
+            values = self.pools[key] = cycle([factory() for _ in range(self.size)])
+
+        return next(values)
+
+    def choices(self, key: Hashable, population: Callable[[], list[Any]]) -> Any:
+        """
+        Возвращает следующее значение из пула случайных элементов population.
+        Пул заполняется одним вызовом random.choices вместо size вызовов Faker.
+        """
+        values = self.pools.get(key)
+        if values is None:
+            values = self.pools[key] = cycle(self.faker.random.choices(population(), k=self.size))
+
+        return next(values)
+
+    def warmup(self) -> None:
+        """
+        Заполняет пулы значений, используемых в сценариях, чтобы генерация не попадала на время нагрузки.
+        Заполненные пулы повторно не генерируются.
+        """
+        self.email_local_part()
+        self.category()
+        self.last_name()
+        self.first_name()
+        self.phone_number()
+        self.amount()
+
+    def enum(self, value: type[TEnum]) -> TEnum:
+        return self.choices(value, lambda: list(value))
+
+    def proto_enum(self, value: EnumTypeWrapper) -> int:
+        return self.choices(value, value.values)
+
+    def email_local_part(self) -> str:
+        return self.pool("email", lambda: self.faker.email())
+
+    def email(self) -> str:
+        return f"{self.email_prefix}.{next(self.email_counter)}.{self.email_local_part()}"
+
+    def category(self) -> str:
+        return self.choices("category", lambda: CATEGORIES)
+
+    def last_name(self) -> str:
+        return self.pool("last_name", lambda: self.faker.last_name())
+
+    def first_name(self) -> str:
+        return self.pool("first_name", lambda: self.faker.first_name())
+
+    def middle_name(self) -> str:
+        return self.pool("middle_name", lambda: self.faker.first_name())
+
+    def phone_number(self) -> str:
+        return self.pool("phone_number", lambda: self.faker.phone_number())
+
+    def float(self, start: int = 1, end: int = 100) -> float:
+        return self.pool(("float", start, end), lambda: super(PooledFake, self).float(start, end))
+
+    def card_number(self) -> str:
+        return self.pool("card_number", lambda: self.faker.credit_card_number())
+
+    def card_holder(self) -> str:
+        return self.pool("card_holder", lambda: self.faker.name())
+
+    def pin(self) -> str:
+        return self.pool("pin", lambda: self.faker.numerify("####"))
+
+    def cvv(self) -> str:
+        return self.pool("cvv", lambda: self.faker.credit_card_security_code())
+
+    def expiry_date(self) -> str:
+        return self.pool("expiry_date", lambda: self.faker.credit_card_expire())
+
+
+def build_fake() -> Fake:
+    """
+    Создаёт генератор тестовых данных в режиме FAKE.MODE: faker (каждое значение генерируется Faker)
+    или pooled (значения заранее генерируются пачками и выдаются из пулов).
+
+    :return: Экземпляр Fake.
+    """
+    if settings.fake.mode == "pooled":
+        return PooledFake(faker=Faker(), size=settings.fake.pool_size)
+
+    return Fake(faker=Faker())
+
 
 # Создаем экземпляр класса Fake с использованием Faker
-fake = Fake(faker=Faker())
+fake = build_fake()
@@ -0,0 +1,144 @@
+"""
+Компактная HDR-гистограмма задержек (по мотивам HdrHistogram).
+
+Значения (микросекунды) раскладываются по экспоненциальным корзинам, каждая из которых разбита
+на одинаковое число линейных подкорзин, поэтому относительная погрешность любого перцентиля
+не больше 10^-significant_figures, а размер гистограммы фиксирован и зависит только от точности
+и верхней границы — не от количества записанных значений.
+"""
+import math
+from array import array
+
+
+class LatencyHistogram:
+    """
+    HDR-гистограмма задержек с фиксированной относительной точностью.
+
+    Attributes:
+        highest_value: Верхняя граница, мкс; большие значения записываются как highest_value
+        significant_figures: Количество значащих цифр точности (1..5)
+        counts: Количество значений в каждой подкорзине
+        total_count: Общее количество записанных значений
+        max_value: Максимальное записанное значение, мкс
+    """
+
+    def __init__(self, highest_value: int = 60_000_000, significant_figures: int = 3):
+        if not 1 <= significant_figures <= 5:
+            raise ValueError(f"significant_figures must be in 1..5, got {significant_figures}")
+
+        self.highest_value = max(highest_value, 2)
+        self.significant_figures = significant_figures
+
+        self.sub_bucket_half_count_magnitude = max(math.ceil(math.log2(2 * 10 ** significant_figures)) - 1, 0)
+        self.sub_bucket_count = 1 << (self.sub_bucket_half_count_magnitude + 1)
+        self.sub_bucket_half_count = self.sub_bucket_count // 2
+        self.sub_bucket_mask = self.sub_bucket_count - 1
+
+        bucket_count, smallest_untrackable_value = 1, self.sub_bucket_count
+        while smallest_untrackable_value <= self.highest_value:
+            smallest_untrackable_value <<= 1
+            bucket_count += 1
+
+        self.counts = array("Q", bytes(8 * (bucket_count + 1) * self.sub_bucket_half_count))
+        self.total_count = 0
+        self.max_value = 0
+
+    def get_index(self, value: int) -> int:
+        bucket_index = (value | self.sub_bucket_mask).bit_length() - (self.sub_bucket_half_count_magnitude + 1)
+        sub_bucket_index = value >> bucket_index
+        return ((bucket_index + 1) << self.sub_bucket_half_count_magnitude) + sub_bucket_index - self.sub_bucket_half_count
+
+    def get_value(self, index: int) -> int:
+        """
+        Возвращает наибольшее значение, попадающее в подкорзину `index`.
+        """
+        bucket_index = (index >> self.sub_bucket_half_count_magnitude) - 1
+        sub_bucket_index = (index & (self.sub_bucket_half_count - 1)) + self.sub_bucket_half_count
+        if bucket_index < 0:
+            sub_bucket_index -= self.sub_bucket_half_count
+            bucket_index = 0
+
+        return ((sub_bucket_index + 1) << bucket_index) - 1
+
+    def record(self, value: int, count: int = 1) -> None:
+        """
+        Записывает значение в микросекундах.
+        """
+        value = min(max(value, 0), self.highest_value)
+        self.counts[self.get_index(value)] += count
+        self.total_count += count
+        self.max_value = max(self.max_value, value)
+
+    def record_ms(self, value: float) -> None:
+        self.record(round(value * 1000))
+
+    def get_value_at_percentile(self, percentile: float) -> int:
+        """
+        Возвращает значение (мкс), не меньше которого `percentile` процентов записанных значений.
+        """
+        if self.total_count == 0:
+            return 0
+
+        target = max(math.ceil(percentile / 100 * self.total_count), 1)
+        accumulated = 0
+        for index, count in enumerate(self.counts):
+            accumulated += count
+            if accumulated >= target:
+                return min(self.get_value(index), self.max_value)
+
+        return self.max_value
+
+    def get_percentile_ms(self, percentile: float) -> float:
+        return self.get_value_at_percentile(percentile) / 1000
+
+    def check_compatible(self, significant_figures: int, highest_value: int) -> None:
+        """
+        Проверяет, что гистограмма с такими параметрами раскладывает значения по тем же подкорзинам.
+
+        :raises ValueError: Если точность или верхняя граница отличаются.
+        """
+        if (significant_figures, highest_value) != (self.significant_figures, self.highest_value):
+            raise ValueError(
+                f"Cannot merge histogram with significant_figures={significant_figures}, "
+                f"highest_value={highest_value} into histogram with significant_figures={self.significant_figures}, "
+                f"highest_value={self.highest_value}"
+            )
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        self.check_compatible(other.significant_figures, other.highest_value)
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+
+        self.total_count += other.total_count
+        self.max_value = max(self.max_value, other.max_value)
+
+    def reset(self) -> None:
+        self.counts = array("Q", bytes(8 * len(self.counts)))
+        self.total_count = 0
+        self.max_value = 0
+
+    def dump(self) -> dict:
+        """
+        Возвращает разреженное представление гистограммы (только непустые подкорзины)
+        для передачи между процессами, например от воркера мастеру.
+        """
+        indices = [index for index, count in enumerate(self.counts) if count]
+        return {
+            "significant_figures": self.significant_figures,
+            "highest_value": self.highest_value,
+            "indices": indices,
+            "counts": [self.counts[index] for index in indices],
+            "max_value": self.max_value
+        }
+
+    def merge_dump(self, data: dict) -> None:
+        """
+        Добавляет гистограмму, полученную через dump() с той же точностью и верхней границей.
+        """
+        self.check_compatible(data["significant_figures"], data["highest_value"])
+        for index, count in zip(data["indices"], data["counts"]):
+            self.counts[index] += count
+            self.total_count += count
+
+        self.max_value = max(self.max_value, data["max_value"])
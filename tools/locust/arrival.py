@@ -0,0 +1,279 @@
+"""
+Открытая модель нагрузки (arrival rate) для Locust.
+
+В закрытой модели пользователь начинает следующую итерацию только после ответа на предыдущую,
+поэтому при росте задержки стенда падает и пропускная способность — насыщение маскируется.
+Здесь итерации запускаются по расписанию прибытий: слот k наступает в момент, когда накопленное
+число прибытий (интеграл частоты) достигает k. Свободный пользователь занимает ближайший слот
+и ждёт его наступления (см. LocustBaseUser.wait_time), количество пользователей подбирает
+ArrivalRateLoadShape (tools/locust/shape.py).
+
+Если все пользователи заняты, слоты не ждут: слот, опоздавший больше чем на LOCUST_USER.ARRIVAL_MAX_LAG,
+пропускается и учитывается как пропущенный (coordinated omission), у остальных учитывается опоздание.
+При STATS.CORRECTED_LATENCY=true слоты не пропускаются, пропущенными считаются только слоты, не занятые до остановки теста.
+В распределённом режиме каждый воркер идёт по общему расписанию со своей долей частоты
+и отправляет статистику мастеру, сводка пишется в лог мастера при его завершении.
+"""
+import math
+import time
+
+from locust import events
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+from config import settings
+from tools.config.locust import LocustUserConfig
+from tools.logger import get_logger
+
+logger = get_logger("ARRIVAL_SCHEDULE")
+
+# Тип сообщения Locust, в котором мастер передаёт воркеру его долю частоты прибытий
+ARRIVAL_SHARE_MESSAGE = "arrival_share"
+# Ключ статистики расписания в отчётах воркеров мастеру
+ARRIVAL_REPORT_KEY = "arrival_schedule"
+
+
+class ArrivalStats:
+    """
+    Статистика выполнения расписания прибытий.
+
+    Attributes:
+        started: Слотов, занятых пользователями (итерация запущена)
+        late: Из них запущено с опозданием
+        missed: Слотов, пропущенных из-за того, что все пользователи были заняты
+        lag_total_ms: Суммарное опоздание запущенных итераций, мс
+        lag_max_ms: Максимальное опоздание запущенной итерации, мс
+        iterations: Завершённых итераций
+        iteration_time_total_ms: Суммарная длительность завершённых итераций, мс
+    """
+    FIELDS = ("started", "late", "missed", "lag_total_ms", "lag_max_ms", "iterations", "iteration_time_total_ms")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.started = 0
+        self.late = 0
+        self.missed = 0
+        self.lag_total_ms = 0.0
+        self.lag_max_ms = 0.0
+        self.iterations = 0
+        self.iteration_time_total_ms = 0.0
+
+    def record_start(self, lag: float) -> None:
+        self.started += 1
+        if lag > 0:
+            self.late += 1
+            self.lag_total_ms += lag * 1000
+            self.lag_max_ms = max(self.lag_max_ms, lag * 1000)
+
+    def record_iteration(self, duration: float) -> None:
+        self.iterations += 1
+        self.iteration_time_total_ms += duration * 1000
+
+    def to_dict(self) -> dict[str, float]:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def merge(self, data: dict[str, float]) -> None:
+        """
+        Добавляет статистику, полученную от воркера.
+        """
+        for field in self.FIELDS:
+            if field == "lag_max_ms":
+                self.lag_max_ms = max(self.lag_max_ms, data[field])
+            else:
+                setattr(self, field, getattr(self, field) + data[field])
+
+    @property
+    def scheduled(self) -> int:
+        return self.started + self.missed
+
+    @property
+    def summary(self) -> str:
+        missed_ratio = self.missed / self.scheduled * 100 if self.scheduled else 0.0
+        average_lag_ms = self.lag_total_ms / self.late if self.late else 0.0
+        return (
+            f"{self.scheduled} slots scheduled, {self.started} started "
+            f"({self.late} late, avg lag {average_lag_ms:.1f}ms, max lag {self.lag_max_ms:.1f}ms), "
+            f"{self.missed} missed ({missed_ratio:.2f}%)"
+        )
+
+
+class ArrivalSchedule:
+    """
+    Расписание прибытий: частота итераций задаётся этапами с линейным изменением частоты.
+
+    Attributes:
+        stages: Этапы (длительность, с; частота в начале; частота в конце), итераций/с
+        max_lag: Допустимое опоздание слота, с; более поздние слоты пропускаются
+        share: Доля частоты, которую обслуживает этот процесс (1 / число воркеров)
+        offset: Номер воркера: воркеры занимают слоты общего расписания по очереди, а не одновременно
+        duration: Общая длительность расписания, с
+        start_time: Момент начала расписания (time.perf_counter)
+        next_index: Номер следующего незанятого слота
+        stats: Статистика выполнения расписания
+    """
+
+    def __init__(self, stages: list[tuple[float, float, float]], max_lag: float):
+        self.stages = stages
+        self.max_lag = max_lag
+        self.share = 1.0
+        self.offset = 0
+        self.duration = sum(duration for duration, _, _ in stages)
+        self.start_time = time.perf_counter()
+        self.next_index = 0
+        self.stats = ArrivalStats()
+
+    @classmethod
+    def from_config(cls, config: LocustUserConfig) -> "ArrivalSchedule":
+        if config.load_model == "constant_arrival_rate":
+            return cls([(config.arrival_duration, config.arrival_rate, config.arrival_rate)], config.arrival_max_lag)
+
+        if not config.arrival_stages:
+            raise ValueError("LOCUST_USER.ARRIVAL_STAGES must not be empty for ramping_arrival_rate")
+
+        stages, rate = [], config.arrival_rate
+        for stage in config.arrival_stages:
+            stages.append((stage.duration, rate, stage.target))
+            rate = stage.target
+
+        return cls(stages, config.arrival_max_lag)
+
+    def start(self) -> None:
+        self.start_time = time.perf_counter()
+        self.next_index = 0
+        self.stats.reset()
+
+    def get_rate(self, elapsed: float) -> float:
+        """
+        Возвращает полную (без учёта доли процесса) частоту итераций через `elapsed` секунд после начала.
+        """
+        for duration, start_rate, end_rate in self.stages:
+            if elapsed < duration:
+                return start_rate + (end_rate - start_rate) * elapsed / duration
+            elapsed -= duration
+
+        return 0.0
+
+    def get_arrival_offset(self, index: int) -> float | None:
+        """
+        Возвращает момент наступления слота `index` в секундах от начала расписания
+        или None, если слот выходит за пределы расписания.
+        """
+        arrivals = index / self.share + self.offset
+        offset = 0.0
+        for duration, start_rate, end_rate in self.stages:
+            # Число прибытий за этап при линейной частоте: start_rate * t + a * t^2, где a = (end - start) / 2d
+            stage_arrivals = (start_rate + end_rate) / 2 * duration
+            if arrivals < stage_arrivals:
+                a = (end_rate - start_rate) / (2 * duration)
+                if abs(a) < 1e-12:
+                    return offset + arrivals / start_rate
+
+                return offset + (-start_rate + math.sqrt(start_rate ** 2 + 4 * a * arrivals)) / (2 * a)
+
+            arrivals -= stage_arrivals
+            offset += duration
+
+        return None
+
+    def claim(self, now: float) -> float | None:
+        """
+        Занимает ближайший слот расписания. Слоты, опоздавшие больше чем на `max_lag`, пропускаются.
+
+        Args:
+            now: Текущий момент (time.perf_counter)
+
+        Returns:
+            Момент наступления занятого слота (time.perf_counter) или None, если расписание закончилось
+        """
+        while True:
+            offset = self.get_arrival_offset(self.next_index)
+            if offset is None:
+                return None
+
+            self.next_index += 1
+            slot = self.start_time + offset
+            if now - slot <= self.max_lag:
+                self.stats.record_start(now - slot)
+                return slot
+
+            self.stats.missed += 1
+
+    def finish(self, now: float) -> None:
+        """
+        Учитывает как пропущенные слоты, которые наступили до остановки теста, но так и не были заняты.
+        """
+        while True:
+            offset = self.get_arrival_offset(self.next_index)
+            if offset is None or self.start_time + offset > now:
+                return
+
+            self.next_index += 1
+            self.stats.missed += 1
+
+
+@events.init.add_listener
+def init_arrival_schedule(environment: Environment, **kwargs) -> None:
+    """
+    При открытой модели нагрузки создаёт расписание прибытий в `environment.arrival_schedule`.
+
+    - Локальный запуск и воркеры: расписание запускается на test_start, пользователи занимают его слоты.
+    - Мастер: расписание задаёт частоту для ArrivalRateLoadShape и собирает статистику воркеров;
+      на test_start каждому воркеру отправляется его доля частоты.
+    """
+    config = settings.locust_user
+    if config.load_model == "closed":
+        return
+
+    schedule = environment.arrival_schedule = ArrivalSchedule.from_config(config)
+    if settings.stats.corrected_latency:
+        # Пропущенный слот выпал бы из исправленных перцентилей (tools/locust/latency.py), поэтому опоздавшие
+        # слоты не пропускаются: итерация стартует с опозданием, и оно прибавляется к её задержкам
+        schedule.max_lag = math.inf
+
+    runner = environment.runner
+
+    def on_test_start(environment: Environment, **kwargs):
+        schedule.start()
+
+    def log_summary(environment: Environment, **kwargs):
+        logger.info(f"Arrival schedule ({config.load_model}): {schedule.stats.summary}")
+
+    environment.events.test_start.add_listener(on_test_start)
+
+    if not isinstance(runner, MasterRunner):
+        def on_test_stop(environment: Environment, **kwargs):
+            schedule.finish(time.perf_counter())
+
+        environment.events.test_stop.add_listener(on_test_stop)
+
+    if isinstance(runner, WorkerRunner):
+        def on_arrival_share(environment: Environment, msg, **kwargs):
+            schedule.share, schedule.offset = msg.data["share"], msg.data["offset"]
+
+        def on_report_to_master(client_id: str, data: dict):
+            data[ARRIVAL_REPORT_KEY] = schedule.stats.to_dict()
+            schedule.stats.reset()
+
+        runner.register_message(ARRIVAL_SHARE_MESSAGE, on_arrival_share)
+        environment.events.report_to_master.add_listener(on_report_to_master)
+        return
+
+    if isinstance(runner, MasterRunner):
+        def on_master_test_start(environment: Environment, **kwargs):
+            workers = runner.clients.ready + runner.clients.running + runner.clients.spawning
+            for index, worker in enumerate(workers):
+                share = {"share": 1 / len(workers), "offset": index}
+                runner.send_message(ARRIVAL_SHARE_MESSAGE, share, client_id=worker.id)
+
+        def on_worker_report(client_id: str, data: dict):
+            if ARRIVAL_REPORT_KEY in data:
+                schedule.stats.merge(data[ARRIVAL_REPORT_KEY])
+
+        environment.events.test_start.add_listener(on_master_test_start)
+        environment.events.worker_report.add_listener(on_worker_report)
+        # Финальные отчёты воркеров приходят уже после test_stop мастера
+        environment.events.quitting.add_listener(log_summary)
+    else:
+        environment.events.test_stop.add_listener(log_summary)
@@ -0,0 +1,169 @@
+"""
+Задержки с поправкой на coordinated omission.
+
+LocustInterceptor и locust_response_event_hook измеряют время ответа от фактической отправки запроса.
+Если генератор нагрузки не успевает (все пользователи заняты, greenlet подвис, стенд тормозит и
+итерации копятся), задержка ожидания в очереди в эти цифры не попадает и p99 выглядит лучше, чем
+его увидел бы реальный клиент.
+
+При STATS.CORRECTED_LATENCY=true и открытой модели нагрузки (tools/locust/arrival.py) каждая итерация
+знает запланированный момент своего начала (слот расписания). Опоздание итерации — разница между
+фактическим началом её первого запроса и слотом — прибавляется ко времени ответа всех её запросов,
+и результат пишется в отдельное хранилище HDR-гистограмм (tools/locust/stats.py). По окончании теста
+исправленные перцентили выводятся в лог рядом со штатными перцентилями Locust, а при --csv
+дополнительно сохраняются в <csv_prefix>_corrected_latency.csv.
+
+Чтобы опоздавшие итерации не выпадали из исправленных перцентилей, при этой опции расписание не пропускает
+слоты (LOCUST_USER.ARRIVAL_MAX_LAG не действует). Слоты, которые так и не были заняты до остановки теста,
+в гистограммы не попадают: их число выводится в отчёте (Missed Slots).
+"""
+import csv
+import time
+from contextvars import ContextVar
+
+from locust import events
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+from config import settings
+from tools.locust.stats import LatencyStore
+from tools.logger import get_logger
+from tools.tables import format_table
+
+logger = get_logger("CORRECTED_LATENCY")
+
+# Ключ исправленных гистограмм в отчётах воркеров мастеру
+CORRECTED_LATENCY_REPORT_KEY = "corrected_latency"
+# Перцентили в отчёте
+CORRECTED_LATENCY_PERCENTILES = (50, 90, 99, 99.9)
+
+
+class IterationTiming:
+    """
+    Запланированное начало текущей итерации пользователя.
+
+    Attributes:
+        slot: Момент слота расписания (time.perf_counter)
+        lag: Опоздание итерации, с; определяется по первому запросу итерации
+    """
+    __slots__ = ("slot", "lag")
+
+    def __init__(self, slot: float):
+        self.slot = slot
+        self.lag: float | None = None
+
+
+# Контекстные переменные локальны для greenlet, поэтому у каждого пользователя своя итерация
+iteration_timing: ContextVar[IterationTiming | None] = ContextVar("iteration_timing", default=None)
+
+
+def start_iteration(slot: float | None) -> None:
+    """
+    Запоминает слот расписания, по которому начнётся следующая итерация текущего пользователя.
+    """
+    iteration_timing.set(IterationTiming(slot) if slot is not None else None)
+
+
+class CorrectedLatencyRecorder(LatencyStore):
+    """
+    Хранилище исправленных задержек: время ответа плюс опоздание итерации относительно её слота.
+    """
+
+    def on_request(self, request_type: str, name: str, response_time: float, **kwargs) -> None:
+        timing = iteration_timing.get()
+        if timing is None:
+            return
+
+        if timing.lag is None:
+            request_start = time.perf_counter() - response_time / 1000
+            timing.lag = max(request_start - timing.slot, 0.0)
+
+        self.record(request_type, name, response_time + timing.lag * 1000)
+
+    def get_report_rows(self, environment: Environment) -> list[dict[str, str | int | float]]:
+        """
+        Строки отчёта: штатные перцентили Locust и исправленные перцентили для каждого запроса,
+        а также число слотов расписания, так и не занятых до остановки теста (общее для всех запросов).
+        """
+        rows = []
+        missed = environment.arrival_schedule.stats.missed
+        for (request_type, name), histogram in sorted(self.cumulative.items()):
+            entry = environment.stats.get(name, request_type)
+            row = {
+                "Type": request_type,
+                "Name": name,
+                "Request Count": histogram.total_count,
+                "50%": entry.get_response_time_percentile(0.5),
+                "99%": entry.get_response_time_percentile(0.99)
+            }
+            for percentile in CORRECTED_LATENCY_PERCENTILES:
+                row[f"Corrected {percentile:g}%"] = round(histogram.get_percentile_ms(percentile), 1)
+
+            row["Corrected Max"] = round(histogram.max_value / 1000, 1)
+            row["Missed Slots"] = missed
+            rows.append(row)
+
+        return rows
+
+    def report(self, environment: Environment) -> None:
+        self.roll()
+        rows = self.get_report_rows(environment)
+        if not rows:
+            logger.info("No corrected latencies recorded")
+            return
+
+        logger.info("Latency percentiles (ms), stock vs coordinated-omission-corrected:\n" + format_table(rows))
+
+        csv_prefix = getattr(environment.parsed_options, "csv_prefix", None)
+        if csv_prefix:
+            with open(f"{csv_prefix}_corrected_latency.csv", "w", newline="") as file:
+                writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+                writer.writeheader()
+                writer.writerows(rows)
+
+
+@events.init.add_listener
+def init_corrected_latency(environment: Environment, **kwargs) -> None:
+    """
+    При STATS.CORRECTED_LATENCY=true подписывает CorrectedLatencyRecorder на запросы.
+
+    - Локальный запуск: отчёт выводится на test_stop.
+    - Воркеры: гистограммы уходят мастеру в каждом отчёте.
+    - Мастер: собирает гистограммы воркеров, отчёт выводится при завершении (после финальных отчётов воркеров).
+    """
+    if not settings.stats.corrected_latency:
+        return
+
+    if settings.locust_user.load_model == "closed":
+        logger.warning("STATS.CORRECTED_LATENCY requires an open load model (LOCUST_USER.LOAD_MODEL), ignoring")
+        return
+
+    recorder = environment.corrected_latency = CorrectedLatencyRecorder()
+    runner = environment.runner
+
+    def on_test_start(environment: Environment, **kwargs):
+        recorder.reset()
+
+    def on_report(environment: Environment, **kwargs):
+        recorder.report(environment)
+
+    environment.events.test_start.add_listener(on_test_start)
+
+    if isinstance(runner, WorkerRunner):
+        def on_report_to_master(client_id: str, data: dict):
+            data[CORRECTED_LATENCY_REPORT_KEY] = recorder.dump_interval()
+
+        environment.events.request.add_listener(recorder.on_request)
+        environment.events.report_to_master.add_listener(on_report_to_master)
+        return
+
+    if isinstance(runner, MasterRunner):
+        def on_worker_report(client_id: str, data: dict):
+            if CORRECTED_LATENCY_REPORT_KEY in data:
+                recorder.merge_dump(data[CORRECTED_LATENCY_REPORT_KEY])
+
+        environment.events.worker_report.add_listener(on_worker_report)
+        environment.events.quitting.add_listener(on_report)
+    else:
+        environment.events.request.add_listener(recorder.on_request)
+        environment.events.test_stop.add_listener(on_report)
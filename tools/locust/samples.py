@@ -0,0 +1,136 @@
+"""
+Журнал сырых замеров запросов для разбора после теста.
+
+CSV Locust агрегируются с шагом CSV_STATS_INTERVAL_SEC (5 с), поэтому короткие всплески задержки в них
+размываются. При STATS.SAMPLE_LOG=true каждый запрос (время начала, имя, время ответа, размер, статус, номер
+воркера) дописывается в колоночный бинарный журнал (формат — tools/samples.py): <csv_prefix>_samples.bin
+при локальном запуске и <csv_prefix>_samples_<номер воркера>.bin на каждом воркере (без --csv — префикс locust).
+
+Замеры копятся в памяти и блоками по STATS.SAMPLE_LOG_BUFFER_SIZE (или раз в STATS.SAMPLE_LOG_FLUSH_INTERVAL
+секунд) отдаются на запись в отдельный системный поток, поэтому запись на диск не блокирует greenlet пользователей.
+"""
+import time
+
+from gevent.threadpool import ThreadPool
+from locust import events
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+from config import settings
+from tools.logger import get_logger
+from tools.samples import SAMPLE_LOG_MAGIC, RequestName, SampleBlock
+
+logger = get_logger("SAMPLE_LOG")
+
+
+class SampleLogWriter:
+    """
+    Буферизованная запись замеров в журнал через фоновый поток.
+
+    Attributes:
+        path: Путь к журналу
+        worker: Номер воркера, записывается в каждый замер
+        buffer_size: Замеров в блоке
+        flush_interval: Максимальный возраст неполного блока, с
+        name_ids: Id уже записанных имён запросов
+        block: Текущий (ещё не записанный) блок
+        samples: Всего записанных замеров
+    """
+
+    def __init__(self, path: str, worker: int, buffer_size: int, flush_interval: float):
+        self.path = path
+        self.worker = worker
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.name_ids: dict[RequestName, int] = {}
+        self.block = SampleBlock()
+        self.samples = 0
+        self.last_flush = time.time()
+
+        self.file = open(path, "wb")
+        self.file.write(SAMPLE_LOG_MAGIC)
+        # Один поток — блоки записываются строго по порядку
+        self.pool = ThreadPool(1)
+
+    def on_request(
+            self,
+            request_type: str,
+            name: str,
+            response_time: float,
+            response_length: int,
+            exception: Exception | None = None,
+            **kwargs
+    ) -> None:
+        key = (request_type, name)
+        name_id = self.name_ids.get(key)
+        if name_id is None:
+            name_id = self.name_ids[key] = len(self.name_ids)
+            self.block.names[name_id] = key
+
+        now = time.time()
+        status = 0 if exception is None else 1
+        self.block.append(now - response_time / 1000, name_id, response_time, response_length or 0, status, self.worker)
+        if len(self.block) >= self.buffer_size or now - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def write_block(self, block: SampleBlock) -> None:
+        """
+        Выполняется в фоновом потоке.
+        """
+        self.file.write(block.encode())
+        self.file.flush()
+
+    def flush(self) -> None:
+        block, self.block = self.block, SampleBlock()
+        self.last_flush = time.time()
+        if len(block) or block.names:
+            self.samples += len(block)
+            self.pool.spawn(self.write_block, block)
+
+    def close(self) -> None:
+        self.flush()
+        self.pool.join()
+        self.pool.kill()
+        self.file.close()
+
+
+@events.init.add_listener
+def init_sample_log(environment: Environment, **kwargs) -> None:
+    """
+    При STATS.SAMPLE_LOG=true пишет журнал замеров с test_start до test_stop (на мастере запросов нет).
+    """
+    config = settings.stats
+    if not config.sample_log or isinstance(environment.runner, MasterRunner):
+        return
+
+    state: dict[str, SampleLogWriter | None] = {"writer": None}
+
+    def on_test_start(environment: Environment, **kwargs):
+        if state["writer"] is not None:
+            return
+
+        runner = environment.runner
+        prefix = getattr(environment.parsed_options, "csv_prefix", None) or "locust"
+        if isinstance(runner, WorkerRunner):
+            worker = max(runner.worker_index, 0)
+            path = f"{prefix}_samples_{worker}.bin"
+        else:
+            worker, path = 0, f"{prefix}_samples.bin"
+
+        writer = state["writer"] = SampleLogWriter(
+            path, worker, config.sample_log_buffer_size, config.sample_log_flush_interval
+        )
+        environment.events.request.add_listener(writer.on_request)
+
+    def on_test_stop(environment: Environment, **kwargs):
+        writer = state["writer"]
+        if writer is None:
+            return
+
+        environment.events.request.remove_listener(writer.on_request)
+        writer.close()
+        state["writer"] = None
+        logger.info(f"Sample log written to {writer.path} ({writer.samples} samples)")
+
+    environment.events.test_start.add_listener(on_test_start)
+    environment.events.test_stop.add_listener(on_test_stop)
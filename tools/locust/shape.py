@@ -0,0 +1,53 @@
+import math
+
+from locust import LoadTestShape
+
+from config import settings
+
+# Запас пользователей сверх оценки по закону Литтла (частота * длительность итерации)
+ARRIVAL_USERS_HEADROOM = 1.2
+
+
+class ArrivalRateLoadShape(LoadTestShape):
+    """
+    Форма нагрузки для открытой модели (LOCUST_USER.LOAD_MODEL=constant_arrival_rate / ramping_arrival_rate).
+
+    Частоту итераций задаёт расписание прибытий (tools/locust/arrival.py), а форма лишь держит достаточно
+    пользователей, чтобы его обслужить: частота * средняя длительность недавних итераций с запасом,
+    но не меньше LOCUST_USER.PRE_ALLOCATED_USERS и не больше LOCUST_USER.MAX_USERS.
+    Тест останавливается, когда расписание заканчивается.
+
+    Чтобы форма применялась, её нужно импортировать в locustfile сценария. В закрытой модели
+    она абстрактная и Locust её игнорирует: работают --users, --spawn-rate и --run-time.
+    """
+    abstract = settings.locust_user.load_model == "closed"
+
+    def __init__(self):
+        super().__init__()
+        self.iterations = 0
+        self.iteration_time_total_ms = 0.0
+        self.iteration_time_ms = 0.0
+
+    def get_iteration_time_ms(self) -> float:
+        """
+        Средняя длительность итераций, завершившихся с прошлого тика (или прошлая оценка, если таких нет).
+        """
+        stats = self.runner.environment.arrival_schedule.stats
+        iterations = stats.iterations - self.iterations
+        if iterations > 0:
+            self.iteration_time_ms = (stats.iteration_time_total_ms - self.iteration_time_total_ms) / iterations
+            self.iterations, self.iteration_time_total_ms = stats.iterations, stats.iteration_time_total_ms
+
+        return self.iteration_time_ms
+
+    def tick(self) -> tuple[int, float] | None:
+        config = settings.locust_user
+        schedule = self.runner.environment.arrival_schedule
+
+        run_time = self.get_run_time()
+        if run_time >= schedule.duration:
+            return None
+
+        busy_users = schedule.get_rate(run_time) * self.get_iteration_time_ms() / 1000
+        users = math.ceil(busy_users * ARRIVAL_USERS_HEADROOM)
+        return min(max(users, config.pre_allocated_users), config.max_users), config.spawn_rate
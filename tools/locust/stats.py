@@ -0,0 +1,248 @@
+"""
+Хранилище задержек по запросам на HDR-гистограммах.
+
+Штатная статистика Locust округляет время ответа до корзин (до 10 мс, 100 мс и т.д.), поэтому на хвостах
+(p99.9, p99.99) её перцентили грубые. Хранилище (STATS.LATENCY_STORE=hdr) дополнительно пишет каждое время
+ответа в HDR-гистограмму запроса (tools/histogram.py): точность задаётся STATS.HISTOGRAM_SIGNIFICANT_FIGURES,
+а память на запрос фиксирована и не растёт с длительностью теста.
+
+Запись идёт в интервальные гистограммы; раз в STATS.HISTOGRAM_INTERVAL секунд интервал закрывается и
+добавляется в накопительные. В распределённом режиме воркеры отправляют интервальные гистограммы мастеру
+в каждом отчёте, мастер их суммирует. По окончании теста в лог выводятся перцентили STATS.PERCENTILES
+по накопительным гистограммам, а при --csv интервальные и накопительные гистограммы сохраняются
+в <csv_prefix>_latency_histograms.jsonl, перцентили — в <csv_prefix>_latency_percentiles.csv.
+"""
+import csv
+import json
+import time
+
+import gevent
+from locust import events
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+from locust.stats import get_readable_percentiles
+
+from config import settings
+from tools.histogram import LatencyHistogram
+from tools.logger import get_logger
+from tools.tables import format_table
+
+logger = get_logger("LATENCY_STORE")
+
+# Ключ интервальных гистограмм в отчётах воркеров мастеру
+LATENCY_STORE_REPORT_KEY = "latency_store"
+# Имя строки с суммой по всем запросам, как в таблицах Locust
+AGGREGATED_NAME = "Aggregated"
+
+HistogramsDump = list[list]
+
+
+class LatencyStore:
+    """
+    Интервальные и накопительные гистограммы задержек по запросам (тип запроса, имя).
+
+    Класс гистограммы задаётся атрибутом `histogram_class`: подойдёт любой класс с интерфейсом
+    LatencyHistogram (record_ms, dump, merge_dump, get_percentile_ms).
+
+    Attributes:
+        interval: Гистограммы текущего интервала
+        cumulative: Гистограммы всех закрытых интервалов
+        start_time: Начало сбора (time.time)
+        interval_start: Начало текущего интервала (time.time)
+    """
+    histogram_class = LatencyHistogram
+
+    def __init__(self):
+        self.interval: dict[tuple[str, str], LatencyHistogram] = {}
+        self.cumulative: dict[tuple[str, str], LatencyHistogram] = {}
+        self.start_time = self.interval_start = time.time()
+
+    def create_histogram(self) -> LatencyHistogram:
+        return self.histogram_class(
+            highest_value=round(settings.stats.histogram_highest_value_ms * 1000),
+            significant_figures=settings.stats.histogram_significant_figures
+        )
+
+    def get_histogram(
+            self,
+            histograms: dict[tuple[str, str], LatencyHistogram],
+            request_type: str,
+            name: str
+    ) -> LatencyHistogram:
+        key = (request_type, name)
+        if key not in histograms:
+            histograms[key] = self.create_histogram()
+
+        return histograms[key]
+
+    def record(self, request_type: str, name: str, response_time: float) -> None:
+        self.get_histogram(self.interval, request_type, name).record_ms(response_time)
+
+    def on_request(self, request_type: str, name: str, response_time: float, **kwargs) -> None:
+        self.record(request_type, name, response_time)
+
+    def dump_interval(self) -> HistogramsDump:
+        """
+        Возвращает разреженные гистограммы текущего интервала и начинает новый интервал.
+        """
+        data = [[request_type, name, histogram.dump()] for (request_type, name), histogram in self.interval.items()]
+        self.interval.clear()
+        self.interval_start = time.time()
+        return data
+
+    def merge_dump(self, data: HistogramsDump) -> None:
+        """
+        Добавляет в текущий интервал гистограммы, полученные через dump_interval() (например, от воркера).
+        """
+        for request_type, name, histogram in data:
+            self.get_histogram(self.interval, request_type, name).merge_dump(histogram)
+
+    def roll(self) -> HistogramsDump:
+        """
+        Закрывает текущий интервал: добавляет его в накопительные гистограммы и возвращает его дамп.
+        """
+        data = self.dump_interval()
+        for request_type, name, histogram in data:
+            self.get_histogram(self.cumulative, request_type, name).merge_dump(histogram)
+
+        return data
+
+    def reset(self) -> None:
+        self.interval.clear()
+        self.cumulative.clear()
+        self.start_time = self.interval_start = time.time()
+
+    def get_aggregated(self) -> LatencyHistogram:
+        aggregated = self.create_histogram()
+        for histogram in self.cumulative.values():
+            aggregated.merge(histogram)
+
+        return aggregated
+
+    def get_rows(self, percentiles: list[float]) -> list[dict[str, str | int | float]]:
+        """
+        Строки отчёта по накопительным гистограммам: количество и перцентили (мс) для каждого запроса.
+        """
+        rows = []
+        histograms = sorted(self.cumulative.items())
+        if len(histograms) > 1:
+            histograms.append((("", AGGREGATED_NAME), self.get_aggregated()))
+
+        for (request_type, name), histogram in histograms:
+            row = {"Type": request_type, "Name": name, "Request Count": histogram.total_count}
+            for percentile, column in zip(percentiles, get_readable_percentiles(percentiles)):
+                row[column] = round(histogram.get_percentile_ms(percentile * 100), 3)
+
+            rows.append(row)
+
+        return rows
+
+
+class LatencyHistogramLog:
+    """
+    Журнал гистограмм в формате JSON Lines: по строке на гистограмму запроса за интервал или за весь тест.
+    """
+
+    def __init__(self, path: str):
+        self.file = open(path, "w")
+
+    def write(self, kind: str, start: float, end: float, data: HistogramsDump) -> None:
+        for request_type, name, histogram in data:
+            record = {"kind": kind, "start": start, "end": end, "type": request_type, "name": name, **histogram}
+            self.file.write(json.dumps(record) + "\n")
+
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+# Доступные хранилища задержек (STATS.LATENCY_STORE); locust — без дополнительного хранилища
+LATENCY_STORES: dict[str, type[LatencyStore]] = {"hdr": LatencyStore}
+
+
+@events.init.add_listener
+def init_latency_store(environment: Environment, **kwargs) -> None:
+    """
+    Подписывает хранилище задержек STATS.LATENCY_STORE на запросы.
+
+    - Локальный запуск: интервалы закрываются каждые STATS.HISTOGRAM_INTERVAL секунд, отчёт — на test_stop.
+    - Воркеры: интервальные гистограммы уходят мастеру в каждом отчёте.
+    - Мастер: суммирует гистограммы воркеров, отчёт — при завершении (после финальных отчётов воркеров).
+    """
+    config = settings.stats
+    if config.latency_store == "locust":
+        return
+
+    store = environment.latency_store = LATENCY_STORES[config.latency_store]()
+    runner = environment.runner
+
+    if isinstance(runner, WorkerRunner):
+        def on_report_to_master(client_id: str, data: dict):
+            data[LATENCY_STORE_REPORT_KEY] = store.dump_interval()
+
+        environment.events.request.add_listener(store.on_request)
+        environment.events.report_to_master.add_listener(on_report_to_master)
+        return
+
+    state: dict[str, gevent.Greenlet | LatencyHistogramLog | None] = {"greenlet": None, "log": None}
+
+    def roll_interval():
+        start = store.interval_start
+        data = store.roll()
+        if state["log"] is not None:
+            state["log"].write("interval", start, store.interval_start, data)
+
+    def interval_loop():
+        while True:
+            gevent.sleep(config.histogram_interval)
+            roll_interval()
+
+    def on_test_start(environment: Environment, **kwargs):
+        store.reset()
+        csv_prefix = getattr(environment.parsed_options, "csv_prefix", None)
+        if csv_prefix and state["log"] is None:
+            state["log"] = LatencyHistogramLog(f"{csv_prefix}_latency_histograms.jsonl")
+
+        if state["greenlet"] is None:
+            state["greenlet"] = gevent.spawn(interval_loop)
+
+    def on_report(environment: Environment, **kwargs):
+        if state["greenlet"] is not None:
+            state["greenlet"].kill(block=False)
+            state["greenlet"] = None
+
+        roll_interval()
+        rows = store.get_rows(config.percentiles)
+        if not rows:
+            logger.info("No latencies recorded")
+            return
+
+        logger.info("Latency percentiles (ms) from HDR histograms:\n" + format_table(rows))
+
+        log = state["log"]
+        if log is not None:
+            log.write("cumulative", store.start_time, store.interval_start, [
+                [request_type, name, histogram.dump()] for (request_type, name), histogram in store.cumulative.items()
+            ])
+            log.close()
+            state["log"] = None
+
+            csv_prefix = environment.parsed_options.csv_prefix
+            with open(f"{csv_prefix}_latency_percentiles.csv", "w", newline="") as file:
+                writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+                writer.writeheader()
+                writer.writerows(rows)
+
+    environment.events.test_start.add_listener(on_test_start)
+
+    if isinstance(runner, MasterRunner):
+        def on_worker_report(client_id: str, data: dict):
+            if LATENCY_STORE_REPORT_KEY in data:
+                store.merge_dump(data[LATENCY_STORE_REPORT_KEY])
+
+        environment.events.worker_report.add_listener(on_worker_report)
+        environment.events.quitting.add_listener(on_report)
+    else:
+        environment.events.request.add_listener(store.on_request)
+        environment.events.test_stop.add_listener(on_report)
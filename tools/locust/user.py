@@ -1,14 +1,108 @@
-from locust import User, between
+import time
+
+import gevent
+from locust import SequentialTaskSet, User, between, events
+from locust.env import Environment
+from locust.runners import MasterRunner
+
 from config import settings
+from tools.fakers import PooledFake, fake
+from tools.locust import samples  # noqa: F401 (журнал замеров, STATS.SAMPLE_LOG)
+from tools.locust.arrival import ArrivalSchedule
+from tools.locust.latency import start_iteration
+
+# Период, с которым пользователь без слота (расписание закончилось, тест вот-вот остановится) проверяет расписание
+ARRIVAL_IDLE_WAIT_TIME = 1.0
+
+
+@events.test_start.add_listener
+def warmup_fake(environment: Environment, **kwargs) -> None:
+    """
+    При FAKE.MODE=pooled заполняет пулы тестовых данных до спавна пользователей, а не на первых запросах под нагрузкой.
+    На мастере пользователей нет, поэтому пулы там не нужны.
+    """
+    if isinstance(fake, PooledFake) and not isinstance(environment.runner, MasterRunner):
+        fake.warmup()
+
 
 class LocustBaseUser(User):
     """
     Базовый виртуальный пользователь Locust, от которого наследуются все сценарии.
     Содержит общие настройки, которые могут быть переопределены при необходимости.
+
+    Модель нагрузки задаётся LOCUST_USER.LOAD_MODEL: в закрытой (closed) между итерациями
+    выдерживается пауза closed_wait_time, в открытой итерации запускаются по расписанию прибытий
+    (см. tools/locust/arrival.py).
+
+    Итерация — одна задача пользователя или TaskSet, а для LocustBaseSequentialTaskSet — полный проход
+    по его задачам: к ней относится частота открытой модели (LOCUST_USER.ARRIVAL_RATE).
     """
     host = "localhost"
     abstract = True
-    wait_time = between(
+    closed_wait_time = between(
         min_wait=settings.locust_user.wait_time_min,
         max_wait=settings.locust_user.wait_time_max,
-    )
\ No newline at end of file
+    )
+    # Момент начала текущей итерации (только для открытой модели)
+    iteration_start: float | None = None
+
+    @property
+    def arrival_schedule(self) -> ArrivalSchedule | None:
+        return getattr(self.environment, "arrival_schedule", None)
+
+    def on_start(self) -> None:
+        # В открытой модели и первая итерация начинается по расписанию, а не сразу после спавна
+        if self.arrival_schedule is not None:
+            self.wait()
+
+    def wait_time(self) -> float:
+        """
+        Возвращает паузу перед следующей итерацией.
+
+        В открытой модели — время до ближайшего свободного слота расписания прибытий, поэтому итерации
+        идут с заданной частотой независимо от времени ответа стенда. Заодно в статистику расписания
+        записывается длительность завершившейся итерации (по ней ArrivalRateLoadShape подбирает число пользователей).
+        """
+        schedule = self.arrival_schedule
+        if schedule is None:
+            return self.closed_wait_time()
+
+        now = time.perf_counter()
+        if self.iteration_start is not None:
+            schedule.stats.record_iteration(now - self.iteration_start)
+
+        slot = schedule.claim(now)
+        # Итерация без слота превысила бы заданную частоту, поэтому пользователь простаивает до остановки теста
+        while slot is None:
+            gevent.sleep(ARRIVAL_IDLE_WAIT_TIME)
+            now = time.perf_counter()
+            slot = schedule.claim(now)
+
+        # Запланированное начало итерации — точка отсчёта исправленных задержек (tools/locust/latency.py)
+        start_iteration(slot)
+        self.iteration_start = max(slot, now)
+        return max(slot - now, 0.0)
+
+
+class LocustBaseSequentialTaskSet(SequentialTaskSet):
+    """
+    Базовый SequentialTaskSet сценариев: в открытой модели полный проход по задачам считается одной итерацией.
+
+    Locust вызывает wait_time пользователя после каждой задачи, и без этого каждый шаг сценария
+    занимал бы свой слот расписания. Здесь между задачами прохода пауза нулевая, а слот занимается
+    только перед началом следующего прохода. В закрытой модели пауза выдерживается после каждой задачи, как раньше.
+
+    Attributes:
+        step: Номер задачи в текущем проходе
+    """
+    step: int = 0
+
+    def wait_time(self) -> float:
+        if self.user.arrival_schedule is None:
+            return self.user.wait_time()
+
+        self.step = (self.step + 1) % len(self.tasks)
+        if self.step:
+            return 0.0
+
+        return self.user.wait_time()
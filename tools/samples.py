@@ -0,0 +1,121 @@
+"""
+Формат журнала сырых замеров запросов (STATS.SAMPLE_LOG, tools/locust/samples.py).
+
+Файл начинается с SAMPLE_LOG_MAGIC, дальше идут блоки, которые только дописываются в конец:
+
+- заголовок блока BLOCK_HEADER: BLOCK_MAGIC, количество новых имён запросов, количество замеров;
+- новые имена: NAME_HEADER (id имени, длина типа запроса, длина имени) и сами строки в UTF-8;
+- колонки SAMPLE_COLUMNS подряд, каждая — массив из `количество замеров` значений (little-endian).
+
+Имена запросов передаются один раз — в первом блоке, где они встретились, замеры ссылаются на них по id.
+Колоночное хранение позволяет читать журнал блоками прямо в array без разбора каждой записи.
+"""
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterator
+
+SAMPLE_LOG_MAGIC = b"LCSAMPL2"
+BLOCK_MAGIC = b"BLK1"
+BLOCK_HEADER = struct.Struct("<4sII")
+NAME_HEADER = struct.Struct("<IHH")
+# Колонки замера: время начала запроса (unix, с), id имени, время ответа (мс), размер ответа (байт),
+# статус (0 — успех, 1 — ошибка), номер воркера (0 при локальном запуске)
+SAMPLE_COLUMNS = (
+    ("timestamp", "d"),
+    ("name_id", "I"),
+    ("response_time", "f"),
+    ("response_length", "I"),
+    ("status", "B"),
+    ("worker", "I")
+)
+
+RequestName = tuple[str, str]
+
+
+class SampleBlock:
+    """
+    Блок замеров: колонки и новые имена запросов, впервые встретившиеся в этом блоке.
+
+    Attributes:
+        names: Новые имена запросов: id -> (тип запроса, имя)
+        columns: Колонки замеров по SAMPLE_COLUMNS
+    """
+
+    def __init__(self):
+        self.names: dict[int, RequestName] = {}
+        self.columns: dict[str, array] = {column: array(typecode) for column, typecode in SAMPLE_COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.columns["timestamp"])
+
+    def append(
+            self,
+            timestamp: float,
+            name_id: int,
+            response_time: float,
+            response_length: int,
+            status: int,
+            worker: int
+    ) -> None:
+        self.columns["timestamp"].append(timestamp)
+        self.columns["name_id"].append(name_id)
+        self.columns["response_time"].append(response_time)
+        self.columns["response_length"].append(min(response_length, 0xFFFFFFFF))
+        self.columns["status"].append(status)
+        self.columns["worker"].append(worker)
+
+    def encode(self) -> bytes:
+        chunks = [BLOCK_HEADER.pack(BLOCK_MAGIC, len(self.names), len(self))]
+        for name_id, (request_type, name) in self.names.items():
+            request_type_bytes, name_bytes = request_type.encode(), name.encode()
+            chunks.append(NAME_HEADER.pack(name_id, len(request_type_bytes), len(name_bytes)))
+            chunks.extend((request_type_bytes, name_bytes))
+
+        for column, _ in SAMPLE_COLUMNS:
+            values = self.columns[column]
+            if sys.byteorder == "big":
+                values = array(values.typecode, values)
+                values.byteswap()
+
+            chunks.append(values.tobytes())
+
+        return b"".join(chunks)
+
+
+def read_exact(file: BinaryIO, size: int) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise EOFError(f"Truncated sample log: expected {size} bytes, got {len(data)}")
+
+    return data
+
+
+def read_sample_blocks(file: BinaryIO) -> Iterator[SampleBlock]:
+    """
+    Читает журнал замеров поблочно. Недописанный последний блок (тест ещё идёт или был прерван) пропускается.
+    """
+    if file.read(len(SAMPLE_LOG_MAGIC)) != SAMPLE_LOG_MAGIC:
+        raise ValueError("Not a sample log: bad magic")
+
+    while header := file.read(BLOCK_HEADER.size):
+        try:
+            magic, names_count, count = BLOCK_HEADER.unpack(header)
+            if magic != BLOCK_MAGIC:
+                raise ValueError("Corrupted sample log: bad block magic")
+
+            block = SampleBlock()
+            for _ in range(names_count):
+                name_id, request_type_length, name_length = NAME_HEADER.unpack(read_exact(file, NAME_HEADER.size))
+                request_type = read_exact(file, request_type_length).decode()
+                block.names[name_id] = (request_type, read_exact(file, name_length).decode())
+
+            for column, typecode in SAMPLE_COLUMNS:
+                values = block.columns[column]
+                values.frombytes(read_exact(file, values.itemsize * count))
+                if sys.byteorder == "big":
+                    values.byteswap()
+        except (EOFError, struct.error):
+            return
+
+        yield block
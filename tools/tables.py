@@ -0,0 +1,9 @@
+def format_table(rows: list[dict[str, str | int | float]]) -> str:
+    """
+    Форматирует строки отчёта (словари с одинаковыми ключами) в текстовую таблицу.
+    """
+    columns = list(rows[0])
+    widths = {column: max(len(column), *(len(str(row[column])) for row in rows)) for column in columns}
+    lines = [" | ".join(column.ljust(widths[column]) for column in columns)]
+    lines.extend(" | ".join(str(row[column]).ljust(widths[column]) for column in columns) for row in rows)
+    return "\n".join(lines)